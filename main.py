@@ -4,50 +4,86 @@
 import argparse
 import json
 import os
+import queue
+import threading
+import time
 
 from dotenv import load_dotenv
 load_dotenv()
-from dataclasses import asdict, replace
+from contextlib import contextmanager
+from dataclasses import asdict, fields, replace
 from datetime import datetime, timedelta
 from pathlib import Path
 from types import ModuleType
+from typing import Callable, Iterator
 
 from models import Event
 from services.email import ScraperError
-from scrapers.culture import arcub, elvirepopescu, improteca, mare, mnac
-from scrapers.music import ateneul, bfh, control, enescu, eventbook as eventbook_music, expirat, garana, hardrock, iabilet, jazzinthepark, jazzx, jfr, operanb, quantic, rockstadt
-from scrapers.theatre import bulandra, cuibul, eventbook as eventbook_theatre, godot, grivita53, metropolis, nottara, teatrulmic, tnb
+from scrapers.registry import (
+    CATEGORIES,
+    STATIC_GROUPS,
+    ScraperSpec,
+    matches,
+    scraper_specs,
+    unknown_names,
+)
 from services.dedup import (
+    StreamingDedup,
     dedup_serialized_cross_source,
     llm_dedup,
     stage1_dedup,
 )
-from services.enrichment import enrich_events
-from services.http import get_fetch_failures, reset_fetch_failures
+from services.enrichment import EnrichmentPool, enrich_events
+from services.http import (
+    FetchContext,
+    RateLimit,
+    close_browser_pool,
+    close_http_clients,
+    disable_http_archive,
+    disable_response_cache,
+    enable_http_archive,
+    enable_response_cache,
+    current_fetch_context,
+    fetch_context,
+    fetch_page,
+    get_fetch_failures,
+    open_circuit_summary,
+    set_rate_limit,
+)
+from services.checkpoints import (
+    STAGES,
+    load_checkpoint,
+    previous_stage,
+    runs_stage,
+    save_checkpoint,
+)
+from services.fingerprints import (
+    fingerprint_entry,
+    is_unchanged,
+    listing_fingerprint,
+    load_fingerprints,
+    save_fingerprints,
+)
+from services.shards import (
+    balance_shards,
+    estimate_seconds,
+    load_history,
+    record_runs,
+    save_history,
+)
 from services.spotify import search_artist
 
 DATA_DIR = Path(__file__).parent / "web" / "public" / "data"
 EVENTS_FILE = DATA_DIR / "events.json"
 ARTIFACTS_DIR = Path(__file__).parent / "artifacts"
 ERRORS_FILE = ARTIFACTS_DIR / "scraper_errors.json"
+# Replayed runs save here instead of overwriting the committed events.json.
+REPLAY_EVENTS_FILE = ARTIFACTS_DIR / "events_replay.json"
+CHECKPOINTS_DIR = ARTIFACTS_DIR / "checkpoints"
+SCRAPER_HISTORY_FILE = Path(__file__).parent / "data" / "scraper_history.json"
+FINGERPRINTS_FILE = Path(__file__).parent / "data" / "scraper_fingerprints.json"
 MAX_EVENT_HORIZON_DAYS = 730
-FESTIVAL_SCRAPERS = {bfh, garana, jazzinthepark, jfr, rockstadt}
-
-# Scraper groups for parallel execution (split to avoid 45min timeout)
-# Group 1: Heavy scrapers = ateneul (50 scrolls), enescu (20 clicks)
-# Group 2: Heavy scrapers = operanb (4 pages), tnb (2 pages)
-SCRAPER_GROUPS = {
-    1: {
-        "music": [ateneul, enescu, eventbook_music, control, hardrock, jazzx],
-        "theatre": [bulandra, cuibul, eventbook_theatre, godot, grivita53],
-        "culture": [arcub, mare, mnac],
-    },
-    2: {
-        "music": [operanb, expirat, quantic, iabilet],
-        "theatre": [metropolis, nottara, teatrulmic, tnb],
-        "culture": [elvirepopescu, improteca],
-    },
-}
+
 
 def should_run_festival_scrapers(now: datetime | None = None) -> bool:
     """Refresh annual festival programmes weekly and at each month start."""
@@ -55,7 +91,27 @@ def should_run_festival_scrapers(now: datetime | None = None) -> bool:
     return reference.day == 1 or reference.weekday() == 6
 
 
+DEFAULT_SCRAPER_WORKERS = 4
+# Wall-clock budget per scraper; modules may set TIME_BUDGET_SECONDS instead.
+DEFAULT_SCRAPER_TIME_BUDGET_SECONDS = 600
+
 scraper_errors: list[ScraperError] = []
+# Fetch counts, bytes and timings of each scraper in the current run,
+# keyed by scraper_key. Parse time is the CPU time of the scraper's thread.
+scraper_fetch_contexts: dict[str, FetchContext] = {}
+scraper_wall_seconds: dict[str, float] = {}
+scraper_parse_seconds: dict[str, float] = {}
+scraper_event_counts: dict[str, int] = {}
+# Scrapers that scraped this run, rather than reusing the last run's events
+# or being cut short by an open circuit; only their times feed the history.
+scrapers_ran: set[str] = set()
+# Listing fingerprints from the last successful runs, those recorded by this
+# run, and the events already published per category (for reuse).
+previous_fingerprints: dict[str, dict] = {}
+fresh_fingerprints: dict[str, dict] = {}
+previous_events: dict[str, list[dict]] = {"music": [], "theatre": [], "culture": []}
+# Guards the per-run scraper results above and below across worker threads.
+scraper_results_lock = threading.Lock()
 successful_scraper_sources: dict[str, set[str]] = {
     "music": set(),
     "theatre": set(),
@@ -81,23 +137,197 @@ def get_scraper_sources(scraper: ModuleType, events: list[Event]) -> set[str]:
     return {source}
 
 
+def event_from_dict(data: dict) -> Event:
+    """Rebuild an Event from its events.json representation."""
+    known = {field.name for field in fields(Event)}
+    values = {key: value for key, value in data.items() if key in known}
+    if isinstance(values.get("date"), str):
+        values["date"] = datetime.fromisoformat(values["date"])
+    return Event(**values)
+
+
+def check_listing_fingerprint(scraper: ModuleType) -> tuple[str | None, str | None]:
+    """Fetch and fingerprint an opted-in scraper's listing page.
+
+    Scrapers opt in with FINGERPRINT_SELECTOR; the page is FINGERPRINT_URL
+    (default EVENTS_URL), rendered when FINGERPRINT_NEEDS_JS is True. Opt in
+    only where the run costs more than the listing (detail pages, paging),
+    and accept ``scrape(listing_html=...)`` so a changed listing is parsed
+    from this fetch instead of being downloaded again.
+
+    Returns (fingerprint, listing html). Any failure just means the scraper
+    runs normally.
+    """
+    selector = getattr(scraper, "FINGERPRINT_SELECTOR", None)
+    url = getattr(scraper, "FINGERPRINT_URL", None) or getattr(
+        scraper, "EVENTS_URL", None
+    )
+    if not isinstance(selector, str) or not isinstance(url, str):
+        return None, None
+    needs_js = getattr(scraper, "FINGERPRINT_NEEDS_JS", False) is True
+    try:
+        html = fetch_page(url, needs_js=needs_js, record_failure=False)
+    except Exception:
+        return None, None
+    return listing_fingerprint(html, selector), html
+
+
+def reuse_previous_events(
+    scraper: ModuleType,
+    category: str,
+    fingerprint: str,
+) -> list[Event] | None:
+    """Return last run's events if the listing is unchanged, else None.
+
+    Reused sources count as successfully scraped, so replace_source_events
+    and the group merge keep treating them as fresh.
+    """
+    key = scraper_key(scraper)
+    entry = previous_fingerprints.get(key)
+    if not is_unchanged(entry, fingerprint):
+        return None
+    sources = set(entry["sources"])
+    try:
+        events = [
+            event_from_dict(event)
+            for event in previous_events.get(category, [])
+            if event.get("source") in sources
+        ]
+    except (TypeError, ValueError):
+        return None
+    if not events:
+        return None
+    with scraper_results_lock:
+        successful_scraper_sources[category].update(sources)
+        fresh_fingerprints[key] = entry
+    return events
+
+
+def scraper_key(scraper: ModuleType) -> str:
+    """Stable scraper id such as "music.eventbook" (names repeat per category)."""
+    return scraper.__name__.removeprefix("scrapers.")
+
+
+def record_scraper_error(error: ScraperError) -> None:
+    """Record a scraper failure; safe to call from worker threads."""
+    with scraper_results_lock:
+        scraper_errors.append(error)
+
+
+def scraper_time_budget(scraper: ModuleType) -> float:
+    """Seconds a scraper may spend fetching before its fetches are refused."""
+    budget = getattr(scraper, "TIME_BUDGET_SECONDS", None)
+    if isinstance(budget, (int, float)) and not isinstance(budget, bool) and budget > 0:
+        return float(budget)
+    return float(DEFAULT_SCRAPER_TIME_BUDGET_SECONDS)
+
+
+def scraper_cache_ttl(scraper: ModuleType) -> float | None:
+    """Seconds the scraper's cached pages may be served without revalidation."""
+    ttl = getattr(scraper, "CACHE_TTL_SECONDS", None)
+    if isinstance(ttl, (int, float)) and not isinstance(ttl, bool) and ttl >= 0:
+        return float(ttl)
+    return None
+
+
 def run_scraper_safely(scraper: ModuleType) -> list[Event]:
     """Run a single scraper, catching and recording any errors."""
-    import traceback
     scraper_name = scraper.__name__.split(".")[-1]
     category = scraper.__name__.split(".")[1]  # e.g., "music" from "scrapers.music.control"
     events_url = getattr(scraper, "EVENTS_URL", None)
-    reset_fetch_failures()
+    rate_limit = getattr(scraper, "RATE_LIMIT", None)
+    rate_limited_url = events_url or getattr(scraper, "BASE_URL", None)
+    if isinstance(rate_limit, RateLimit) and isinstance(rate_limited_url, str):
+        set_rate_limit(rate_limited_url, rate_limit)
+    open_circuit = (
+        open_circuit_summary(events_url) if isinstance(events_url, str) else None
+    )
+    if open_circuit:
+        # An earlier scraper already found this host down; don't retry it.
+        message = f"Skipped: {open_circuit}"
+        print(f"⚠️  Scraper '{scraper_name}' failed: {message}")
+        record_scraper_error(ScraperError(
+            scraper_name=scraper_name,
+            error_message=message,
+            traceback=message,
+            category=category,
+            events_url=events_url,
+        ))
+        return []
+    started = time.monotonic()
+    cpu_started = time.thread_time()
+    events: list[Event] = []
+    scraped = False
+    with fetch_context(
+        scraper_name,
+        scraper_time_budget(scraper),
+        scraper_cache_ttl(scraper),
+    ) as fetches:
+        try:
+            fingerprint, listing_html = check_listing_fingerprint(scraper)
+            if fingerprint is not None:
+                reused = reuse_previous_events(scraper, category, fingerprint)
+                if reused is not None:
+                    print(
+                        f"ℹ️  Scraper '{scraper_name}' listing unchanged; "
+                        f"reusing {len(reused)} events from the last run"
+                    )
+                    events = reused
+                    return events
+            scraped = True
+            events = _run_scraper(
+                scraper, scraper_name, category, events_url, fingerprint, listing_html
+            )
+            return events
+        finally:
+            key = scraper_key(scraper)
+            with scraper_results_lock:
+                if scraped and not fetches.circuit_skips:
+                    scrapers_ran.add(key)
+                scraper_fetch_contexts[key] = fetches
+                scraper_wall_seconds[key] = time.monotonic() - started
+                scraper_parse_seconds[key] = time.thread_time() - cpu_started
+                scraper_event_counts[key] = len(events)
+
+
+def _run_scraper(
+    scraper: ModuleType,
+    scraper_name: str,
+    category: str,
+    events_url: str | None,
+    fingerprint: str | None = None,
+    listing_html: str | None = None,
+) -> list[Event]:
+    """Scrape inside the scraper's fetch context and judge the outcome."""
+    import traceback
     try:
-        events = scraper.scrape()
+        if listing_html is not None:
+            events = scraper.scrape(listing_html=listing_html)
+        else:
+            events = scraper.scrape()
         fetch_failures = get_fetch_failures()
+        fetches = current_fetch_context()
+        if fetches.budget_exhausted:
+            message = (
+                f"Time budget of {fetches.time_budget:g}s exceeded; "
+                f"kept {len(events)} event(s) scraped before the deadline"
+            )
+            print(f"⚠️  Scraper '{scraper_name}' failed: {message}")
+            record_scraper_error(ScraperError(
+                scraper_name=scraper_name,
+                error_message=message,
+                traceback="\n".join(fetch_failures) or message,
+                category=category,
+                events_url=events_url,
+            ))
+            return events
         if fetch_failures:
             message = (
                 f"Scrape output may be incomplete after "
                 f"{len(fetch_failures)} failed request(s): {fetch_failures[-1]}"
             )
             print(f"⚠️  Scraper '{scraper_name}' failed: {message}")
-            scraper_errors.append(ScraperError(
+            record_scraper_error(ScraperError(
                 scraper_name=scraper_name,
                 error_message=message,
                 traceback="\n".join(fetch_failures),
@@ -121,7 +351,7 @@ def run_scraper_safely(scraper: ModuleType) -> list[Event]:
                     f"Scraper returned 0 events; expected at least {min_expected}"
                 )
                 print(f"⚠️  Scraper '{scraper_name}' failed: {message}")
-                scraper_errors.append(ScraperError(
+                record_scraper_error(ScraperError(
                     scraper_name=scraper_name,
                     error_message=message,
                     traceback=message,
@@ -131,13 +361,17 @@ def run_scraper_safely(scraper: ModuleType) -> list[Event]:
                 return events
             else:
                 print(f"ℹ️  Scraper '{scraper_name}' returned 0 events (venue may have no upcoming events)")
-        successful_scraper_sources[category].update(
-            get_scraper_sources(scraper, events)
-        )
+        sources = get_scraper_sources(scraper, events)
+        with scraper_results_lock:
+            successful_scraper_sources[category].update(sources)
+            if fingerprint is not None:
+                fresh_fingerprints[scraper_key(scraper)] = fingerprint_entry(
+                    fingerprint, sources
+                )
         return events
     except Exception as e:
         print(f"⚠️  Scraper '{scraper_name}' failed: {e}")
-        scraper_errors.append(ScraperError(
+        record_scraper_error(ScraperError(
             scraper_name=scraper_name,
             error_message=str(e),
             traceback=traceback.format_exc(),
@@ -147,72 +381,185 @@ def run_scraper_safely(scraper: ModuleType) -> list[Event]:
         return []
 
 
-def run_music_scrapers(group: int | None = None) -> list[Event]:
-    """Run music scrapers and collect events.
+def run_scrapers(
+    scrapers: list[ModuleType],
+    workers: int = 1,
+    on_result: Callable[[int, list[Event]], None] | None = None,
+) -> list[list[Event]]:
+    """Run scrapers on up to ``workers`` threads.
 
-    Args:
-        group: If specified (1 or 2), only run scrapers from that group.
-               If None, run all scrapers.
+    Returns one event list per scraper, in the order the scrapers were given,
+    so output does not depend on which scraper finishes first. ``on_result``
+    is called with each scraper's index and events as soon as it finishes.
     """
-    events: list[Event] = []
-    run_festivals = should_run_festival_scrapers()
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
 
-    if group is not None:
-        # Run only scrapers from the specified group
-        scrapers = SCRAPER_GROUPS[group]["music"]
-        # Add festival scrapers to group 1 on their weekly/monthly refresh.
-        if group == 1 and run_festivals:
-            scrapers = scrapers + [bfh, garana, jazzinthepark, jfr, rockstadt]
-    else:
-        # Run all scrapers
-        scrapers = [ateneul, bfh, control, enescu, eventbook_music, expirat, hardrock, iabilet, operanb, quantic, jfr, garana, jazzinthepark, jazzx, rockstadt]
+    def run(index: int, scraper: ModuleType) -> list[Event]:
+        events = run_scraper_safely(scraper)
+        if on_result is not None:
+            on_result(index, events)
+        return events
 
-    for scraper in scrapers:
-        if scraper in FESTIVAL_SCRAPERS and not run_festivals:
-            continue
-        events.extend(run_scraper_safely(scraper))
+    if workers == 1 or len(scrapers) <= 1:
+        return [run(index, scraper) for index, scraper in enumerate(scrapers)]
 
-    if not run_festivals:
-        print("  (skipping festival scrapers - refreshed Sundays and on the 1st)")
-    return events
+    results: list[list[Event]] = [[] for _ in scrapers]
+    pending: queue.SimpleQueue = queue.SimpleQueue()
+    for index, scraper in enumerate(scrapers):
+        pending.put((index, scraper))
+
+    def work() -> None:
+        try:
+            while True:
+                try:
+                    index, scraper = pending.get_nowait()
+                except queue.Empty:
+                    return
+                results[index] = run(index, scraper)
+        finally:
+            # Sync Playwright is bound to the thread that started it.
+            close_browser_pool()
+
+    threads = [
+        threading.Thread(target=work, name=f"scraper-worker-{number}")
+        for number in range(min(workers, len(scrapers)))
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
 
 
-def run_theatre_scrapers(group: int | None = None) -> list[Event]:
-    """Run theatre scrapers and collect events.
+def select_scrapers(
+    category: str,
+    group: int | None = None,
+    only: set[str] | None = None,
+) -> list[ScraperSpec]:
+    """Scrapers of one category due for this run, festivals only on refresh days.
 
-    Args:
-        group: If specified (1 or 2), only run scrapers from that group.
-               If None, run all scrapers.
+    Scrapers named in ``only`` are the only ones picked, and run even when
+    their festival is not due.
     """
-    events: list[Event] = []
+    due = scraper_specs(category, group)
+    if only:
+        return [spec for spec in due if matches(spec, only)]
+    if any(spec.festival for spec in due) and not should_run_festival_scrapers():
+        print("  (skipping festival scrapers - refreshed Sundays and on the 1st)")
+        due = [spec for spec in due if not spec.festival]
+    return due
 
-    if group is not None:
-        scrapers = SCRAPER_GROUPS[group]["theatre"]
-    else:
-        scrapers = [bulandra, cuibul, eventbook_theatre, godot, grivita53, metropolis, nottara, teatrulmic, tnb]
 
-    for scraper in scrapers:
-        events.extend(run_scraper_safely(scraper))
-    return events
+def _flatten(results: list[list[Event]]) -> list[Event]:
+    return [event for events in results for event in events]
 
 
-def run_culture_scrapers(group: int | None = None) -> list[Event]:
-    """Run culture scrapers and collect events.
+def run_category_scrapers(
+    category: str,
+    group: int | None = None,
+    workers: int = 1,
+) -> list[Event]:
+    """Run one category's scrapers and collect events.
 
     Args:
-        group: If specified (1 or 2), only run scrapers from that group.
+        group: If specified, only run scrapers from that static group.
                If None, run all scrapers.
+        workers: Number of scrapers to run at the same time.
     """
-    events: list[Event] = []
+    scrapers = [spec.load() for spec in select_scrapers(category, group)]
+    return _flatten(run_scrapers(scrapers, workers))
 
-    if group is not None:
-        scrapers = SCRAPER_GROUPS[group]["culture"]
+
+def run_music_scrapers(group: int | None = None, workers: int = 1) -> list[Event]:
+    return run_category_scrapers("music", group, workers)
+
+
+def run_theatre_scrapers(group: int | None = None, workers: int = 1) -> list[Event]:
+    return run_category_scrapers("theatre", group, workers)
+
+
+def run_culture_scrapers(group: int | None = None, workers: int = 1) -> list[Event]:
+    return run_category_scrapers("culture", group, workers)
+
+
+def scrapers_for_run(
+    group: int | None = None,
+    shards: int | None = None,
+    only: set[str] | None = None,
+    skip: set[str] | None = None,
+) -> dict[str, list[ScraperSpec]]:
+    """Scrapers to run per category, without importing any of them.
+
+    Without ``shards`` this is the static group split (or every scraper
+    when ``group`` is None). With ``shards`` every due scraper is bin-packed
+    into that many shards by its recorded run time, and ``group`` picks one
+    of them (1-based). ``only`` and ``skip`` hold scraper names ("control")
+    or keys ("music.control") to narrow the selection down.
+    """
+    if shards is None:
+        selected = {
+            category: select_scrapers(category, group, only)
+            for category in CATEGORIES
+        }
     else:
-        scrapers = [arcub, elvirepopescu, improteca, mare, mnac]
+        everything = scrapers_for_run(only=only)
+        history = load_history(SCRAPER_HISTORY_FILE)
+        plan = balance_shards(
+            {
+                spec.key: estimate_seconds(history, spec.key, spec.weight)
+                for specs in everything.values()
+                for spec in specs
+            },
+            shards,
+        )
+        chosen = set(plan[group - 1]) if group is not None else set().union(*plan)
+        selected = {
+            category: [spec for spec in specs if spec.key in chosen]
+            for category, specs in everything.items()
+        }
+    if skip:
+        selected = {
+            category: [spec for spec in specs if not matches(spec, skip)]
+            for category, specs in selected.items()
+        }
+    return selected
 
-    for scraper in scrapers:
-        events.extend(run_scraper_safely(scraper))
-    return events
+
+def run_all_scrapers(
+    group: int | None = None,
+    workers: int = DEFAULT_SCRAPER_WORKERS,
+    shards: int | None = None,
+    on_result: Callable[[str, int, list[Event]], None] | None = None,
+    only: set[str] | None = None,
+    skip: set[str] | None = None,
+) -> tuple[list[Event], list[Event], list[Event]]:
+    """Run music, theatre and culture scrapers together on one worker pool.
+
+    Only the selected scraper modules are imported. Returns (music, theatre,
+    culture) events. ``on_result`` gets each scraper's category, index in
+    the run order and events as soon as that scraper finishes.
+    """
+    selected = scrapers_for_run(group, shards, only, skip)
+    music = [spec.load() for spec in selected["music"]]
+    theatre = [spec.load() for spec in selected["theatre"]]
+    culture = [spec.load() for spec in selected["culture"]]
+    categories = (
+        ["music"] * len(music) + ["theatre"] * len(theatre) + ["culture"] * len(culture)
+    )
+
+    def hand_over(index: int, events: list[Event]) -> None:
+        if on_result is not None:
+            on_result(categories[index], index, events)
+
+    results = run_scrapers(music + theatre + culture, workers, hand_over)
+    theatre_start = len(music)
+    culture_start = theatre_start + len(theatre)
+    return (
+        _flatten(results[:theatre_start]),
+        _flatten(results[theatre_start:culture_start]),
+        _flatten(results[culture_start:]),
+    )
 
 
 def enrich_with_spotify(events: list[Event]) -> list[Event]:
@@ -223,7 +570,7 @@ def enrich_with_spotify(events: list[Event]) -> list[Event]:
     
     enriched: list[Event] = []
     for event in events:
-        if event.category == "music" and event.artist:
+        if event.category == "music" and event.artist and not event.spotify_url:
             spotify_url = search_artist(event.artist)
             enriched.append(replace(event, spotify_url=spotify_url))
         else:
@@ -332,12 +679,18 @@ def save_results(
     culture_events: list[Event],
     existing_events: dict[str, list[dict]],
     group: int | None = None,
+    groups: int | None = None,
+    events_file: Path | None = None,
 ) -> None:
     """Merge new events with existing and save to events.json.
 
     Args:
         group: If specified, save to artifacts/events_group_{N}.json without merging.
                Used for parallel execution where merge happens in a separate step.
+        groups: Total number of groups in this parallel run (recorded in the
+                artifact so the merge can tell when shards are missing).
+        events_file: Where an ungrouped run saves the merged events
+                     (default: EVENTS_FILE).
     """
     if group is not None:
         # Save to group-specific artifact file (no merge with existing)
@@ -347,6 +700,8 @@ def save_results(
         data = {
             "scraped_at": datetime.now().isoformat(),
             "group": group,
+            "groups": groups or len(STATIC_GROUPS),
+            "fingerprints": fresh_fingerprints,
             "successful_sources": {
                 category: sorted(sources)
                 for category, sources in successful_scraper_sources.items()
@@ -362,7 +717,8 @@ def save_results(
         return
 
     # Normal flow: merge with existing events
-    DATA_DIR.mkdir(exist_ok=True)
+    events_file = events_file or EVENTS_FILE
+    events_file.parent.mkdir(parents=True, exist_ok=True)
 
     merged_music = replace_source_events(
         existing_events["music_events"],
@@ -394,7 +750,7 @@ def save_results(
         "culture_events": merged_culture,
     }
 
-    with open(EVENTS_FILE, "w") as f:
+    with open(events_file, "w") as f:
         json.dump(data, f, indent=2, default=str)
 
 
@@ -413,33 +769,57 @@ def get_new_events(
     return new_events
 
 
-def merge_group_artifacts() -> None:
-    """Merge events from group artifact files into the main events.json.
+GROUP_ARTIFACT_PATTERN = "events_group_*.json"
 
-    This is called after parallel scraper jobs complete to combine their results.
-    """
-    print("Merging group artifacts...")
 
-    group_files = {
-        group_num: ARTIFACTS_DIR / f"events_group_{group_num}.json"
-        for group_num in [1, 2]
-    }
-    missing_files = [path for path in group_files.values() if not path.exists()]
+def discover_group_artifacts(expected_groups: int | None = None) -> dict[int, Path]:
+    """Find the events_group_N.json shards to merge, refusing incomplete sets.
+
+    Without ``expected_groups`` the shard count is the highest shard number
+    found (at least the number of static groups); each artifact's own
+    ``groups`` field is checked against it while merging.
+    """
+    found: dict[int, Path] = {}
+    for path in ARTIFACTS_DIR.glob(GROUP_ARTIFACT_PATTERN):
+        number = path.stem.removeprefix("events_group_")
+        if number.isdigit():
+            found[int(number)] = path
+
+    if expected_groups is None:
+        expected_groups = max([len(STATIC_GROUPS), *found])
+    expected = range(1, expected_groups + 1)
+    missing_files = [
+        ARTIFACTS_DIR / f"events_group_{number}.json"
+        for number in expected
+        if number not in found
+    ]
     if missing_files:
         missing = ", ".join(path.name for path in missing_files)
         raise FileNotFoundError(
             f"Missing required group artifact(s): {missing}. Refusing partial merge."
         )
+    unexpected = sorted(number for number in found if number not in expected)
+    if unexpected:
+        raise ValueError(
+            f"Unexpected group artifact(s) {unexpected} for a "
+            f"{expected_groups}-group run. Refusing partial merge."
+        )
+    return {number: found[number] for number in expected}
 
-    # Load existing events
-    existing_events = load_existing_events()
-    print(f"Loaded {sum(len(v) for v in existing_events.values())} existing events")
 
-    existing_by_category = {
-        "music": list(existing_events["music_events"]),
-        "theatre": list(existing_events["theatre_events"]),
-        "culture": list(existing_events["culture_events"]),
-    }
+def merge_group_artifacts(expected_groups: int | None = None) -> None:
+    """Merge events from group artifact files into the main events.json.
+
+    This is called after parallel scraper jobs complete to combine their results.
+    Shards are read one at a time and only events from their successful
+    sources are kept, so memory grows with the merged output rather than
+    with the raw artifacts. Nothing is written unless every shard is valid.
+    """
+    print("Merging group artifacts...")
+
+    group_files = discover_group_artifacts(expected_groups)
+    group_count = len(group_files)
+
     fresh_by_category: dict[str, list[dict]] = {
         "music": [],
         "theatre": [],
@@ -450,12 +830,19 @@ def merge_group_artifacts() -> None:
         "theatre": set(),
         "culture": set(),
     }
+    shard_fingerprints: dict[str, dict] = {}
 
     # Load and merge each group file
     for group_num, group_file in group_files.items():
         with open(group_file) as f:
             group_data = json.load(f)
 
+        declared_groups = group_data.get("groups")
+        if declared_groups is not None and declared_groups != group_count:
+            raise ValueError(
+                f"Group {group_num} artifact belongs to a {declared_groups}-group "
+                f"run but {group_count} artifact(s) were found. Refusing partial merge."
+            )
         successful_sources = group_data.get("successful_sources")
         if not isinstance(successful_sources, dict):
             raise ValueError(
@@ -482,22 +869,29 @@ def merge_group_artifacts() -> None:
                 for event in group_data.get(f"{category}_events", [])
                 if event.get("source") in successful_source_set
             )
+        shard_fingerprints.update(group_data.get("fingerprints") or {})
+        del group_data
+
+    # Load existing events, keeping only sources no shard refreshed
+    existing_events = load_existing_events()
+    print(f"Loaded {sum(len(v) for v in existing_events.values())} existing events")
 
     all_music = [
         event
-        for event in existing_by_category["music"]
+        for event in existing_events["music_events"]
         if event.get("source") not in replacement_sources["music"]
     ] + fresh_by_category["music"]
     all_theatre = [
         event
-        for event in existing_by_category["theatre"]
+        for event in existing_events["theatre_events"]
         if event.get("source") not in replacement_sources["theatre"]
     ] + fresh_by_category["theatre"]
     all_culture = [
         event
-        for event in existing_by_category["culture"]
+        for event in existing_events["culture_events"]
         if event.get("source") not in replacement_sources["culture"]
     ] + fresh_by_category["culture"]
+    del existing_events, fresh_by_category
 
     # Deduplicate by key
     def dedup_by_key(events: list[dict]) -> list[dict]:
@@ -523,18 +917,126 @@ def merge_group_artifacts() -> None:
 
     # Save merged results
     DATA_DIR.mkdir(exist_ok=True)
-    data = {
+    write_events_file(EVENTS_FILE, {
         "scraped_at": datetime.now().isoformat(),
         "music_events": all_music,
         "theatre_events": all_theatre,
         "culture_events": all_culture,
-    }
-
-    with open(EVENTS_FILE, "w") as f:
-        json.dump(data, f, indent=2, default=str)
+    })
 
     print(f"Saved merged events to {EVENTS_FILE}")
 
+    if shard_fingerprints:
+        save_fingerprints(
+            FINGERPRINTS_FILE,
+            {**load_fingerprints(FINGERPRINTS_FILE), **shard_fingerprints},
+        )
+
+
+def write_events_file(path: Path, data: dict) -> None:
+    """Write ``data`` exactly as json.dump(indent=2) would, one event at a time.
+
+    Events are encoded individually instead of building the whole document
+    in memory, and the file is swapped in atomically so readers never see a
+    half-written events.json.
+    """
+    partial = path.with_name(f"{path.name}.partial")
+    with open(partial, "w") as f:
+        f.write("{")
+        for index, (name, value) in enumerate(data.items()):
+            f.write("," if index else "")
+            f.write(f"\n  {json.dumps(name)}: ")
+            if not isinstance(value, list) or not value:
+                encoded = json.dumps(value, indent=2, default=str)
+                f.write(encoded.replace("\n", "\n  "))
+                continue
+            f.write("[")
+            for position, item in enumerate(value):
+                encoded = json.dumps(item, indent=2, default=str)
+                f.write("," if position else "")
+                f.write("\n    " + encoded.replace("\n", "\n    "))
+            f.write("\n  ]")
+        f.write("\n}")
+    os.replace(partial, path)
+
+
+def run_metrics_file(group: int | None = None) -> Path:
+    suffix = f"_group_{group}" if group else ""
+    return ARTIFACTS_DIR / f"run_metrics{suffix}.json"
+
+
+def scraper_metrics() -> dict[str, dict]:
+    """Per-scraper wall/parse time, fetch counts and events of this run."""
+    scrapers = {}
+    for key, seconds in sorted(scraper_wall_seconds.items()):
+        fetches = scraper_fetch_contexts.get(key) or FetchContext()
+        scrapers[key] = {
+            "wall_seconds": round(seconds, 2),
+            "parse_seconds": round(scraper_parse_seconds.get(key, 0.0), 2),
+            "fetch_seconds": round(fetches.fetch_seconds, 2),
+            "events": scraper_event_counts.get(key, 0),
+            "http_requests": fetches.http_requests,
+            "rendered_pages": fetches.rendered_pages,
+            "bytes_received": fetches.bytes_received,
+            "retries": fetches.retries,
+            "reader_fallbacks": fetches.reader_fallbacks,
+            "cache_hits": fetches.cache_hits,
+            "circuit_skips": fetches.circuit_skips,
+            "ran": key in scrapers_ran,
+        }
+    return scrapers
+
+
+def save_run_metrics(
+    group: int | None = None,
+    stage_seconds: dict[str, float] | None = None,
+    resumed: bool = False,
+) -> Path:
+    """Write run_metrics[_group_N].json: per-scraper and per-stage metrics.
+
+    A resumed run did not scrape, so it keeps the scraper metrics already in
+    the file and only updates the stages it ran.
+    """
+    ARTIFACTS_DIR.mkdir(exist_ok=True)
+    output_file = run_metrics_file(group)
+    scrapers = scraper_metrics()
+    stages = {}
+    if resumed and output_file.exists():
+        with open(output_file) as f:
+            previous = json.load(f)
+        scrapers = previous.get("scrapers", {})
+        stages = previous.get("stages", {})
+    stages.update({
+        stage: round(seconds, 2) for stage, seconds in (stage_seconds or {}).items()
+    })
+    with open(output_file, "w") as f:
+        json.dump({
+            "recorded_at": datetime.now().isoformat(),
+            "group": group,
+            "stages": stages,
+            "scrapers": scrapers,
+        }, f, indent=2)
+    return output_file
+
+
+def update_scraper_history(metrics_files: list[Path]) -> None:
+    """Fold the scraper wall times of run metrics into SCRAPER_HISTORY_FILE.
+
+    Scrapers that did not run (their listing was unchanged, or an open
+    circuit cut them short) took near-zero time that says nothing about
+    their real duration, so they add no sample.
+    """
+    history = load_history(SCRAPER_HISTORY_FILE)
+    for metrics_file in metrics_files:
+        with open(metrics_file) as f:
+            scrapers = json.load(f).get("scrapers", {})
+        history = record_runs(history, {
+            key: float(timing["wall_seconds"])
+            for key, timing in scrapers.items()
+            if timing.get("ran", True)
+        })
+    save_history(SCRAPER_HISTORY_FILE, history)
+
 
 def save_scraper_errors(errors: list[ScraperError]) -> None:
     """Save scraper errors to JSON for the fix-scrapers workflow."""
@@ -549,75 +1051,221 @@ def save_scraper_errors(errors: list[ScraperError]) -> None:
         }, f, indent=2)
 
 
+def _scraper_names(value: str) -> set[str]:
+    return {name.strip() for name in value.split(",") if name.strip()}
+
+
 def main() -> None:
     """Main orchestrator."""
     parser = argparse.ArgumentParser(description="Scrape cultural events")
     parser.add_argument(
         "--group",
         type=int,
-        choices=[1, 2],
-        help="Run only scrapers from the specified group (1 or 2) for parallel execution",
+        help="Run only scrapers from the specified group (1 or 2, or 1..K with --groups) for parallel execution",
+    )
+    parser.add_argument(
+        "--groups",
+        type=int,
+        metavar="K",
+        help="Split scrapers into K shards balanced by recorded run times instead of the static groups",
     )
     parser.add_argument(
         "--merge",
         action="store_true",
-        help="Merge group artifact files into the main events.json (run after parallel scraping)",
+        help="Merge every events_group_N.json artifact into the main events.json (run after parallel scraping)",
     )
     parser.add_argument(
         "--dry-run",
         action="store_true",
         help="Show what scrapers would run without actually running them",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.environ.get("SCRAPER_WORKERS", DEFAULT_SCRAPER_WORKERS)),
+        help="Number of scrapers to run concurrently (default: %(default)s)",
+    )
+    archive = parser.add_mutually_exclusive_group()
+    archive.add_argument(
+        "--record",
+        type=Path,
+        metavar="ARCHIVE",
+        help="Record every HTTP and browser response of this run into ARCHIVE",
+    )
+    archive.add_argument(
+        "--replay",
+        type=Path,
+        metavar="ARCHIVE",
+        help="Serve this run from a recorded ARCHIVE without touching the network",
+    )
+    parser.add_argument(
+        "--only",
+        type=_scraper_names,
+        metavar="NAMES",
+        help="Run only these comma-separated scrapers (e.g. control,iabilet or theatre.eventbook), festivals included",
+    )
+    parser.add_argument(
+        "--skip",
+        type=_scraper_names,
+        metavar="NAMES",
+        help="Leave out these comma-separated scrapers (e.g. ateneul)",
+    )
+    parser.add_argument(
+        "--resume-from",
+        choices=STAGES,
+        metavar="STAGE",
+        help=(
+            "Redo only this stage and the ones after it, starting from the "
+            f"checkpoints of the last run (stages: {', '.join(STAGES)})"
+        ),
+    )
     args = parser.parse_args()
+    if args.resume_from and args.merge:
+        parser.error("--resume-from cannot be combined with --merge")
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.groups is not None:
+        if args.groups < 1:
+            parser.error("--groups must be at least 1")
+        if args.group is not None and not 1 <= args.group <= args.groups:
+            parser.error(f"--group must be between 1 and {args.groups}")
+    elif args.group is not None and args.group not in STATIC_GROUPS:
+        parser.error(f"--group must be one of {list(STATIC_GROUPS)}")
+    for option, names in (("--only", args.only), ("--skip", args.skip)):
+        unknown = unknown_names(names or set())
+        if unknown:
+            parser.error(f"{option}: unknown scraper(s) {', '.join(unknown)}")
 
     if args.merge:
-        merge_group_artifacts()
+        merge_group_artifacts(args.groups)
+        metrics_files = sorted(ARTIFACTS_DIR.glob("**/run_metrics_group_*.json"))
+        if metrics_files:
+            update_scraper_history(metrics_files)
+            print(f"Updated scraper run history from {len(metrics_files)} shard(s)")
         return
 
+    cache_dir = os.environ.get("HTTP_CACHE_DIR")
+    if args.record or args.replay:
+        # Cache hits never reach the archive, so archived runs go uncached.
+        enable_http_archive(args.record or args.replay, replay=bool(args.replay))
+    elif cache_dir:
+        enable_response_cache(Path(cache_dir))
+    try:
+        run_pipeline(args)
+    finally:
+        close_browser_pool()
+        close_http_clients()
+        disable_response_cache()
+        disable_http_archive()
+
+
+@contextmanager
+def timed(stage_seconds: dict[str, float], stage: str) -> Iterator[None]:
+    """Add the block's wall time to ``stage_seconds[stage]``."""
+    started = time.monotonic()
+    try:
+        yield
+    finally:
+        stage_seconds[stage] = (
+            stage_seconds.get(stage, 0.0) + time.monotonic() - started
+        )
+
+
+def checkpoint_dir(group: int | None = None) -> Path:
+    """Where this run's stage checkpoints live; each group keeps its own."""
+    return CHECKPOINTS_DIR / f"group_{group}" if group else CHECKPOINTS_DIR
+
+
+def events_checkpoint(events: dict[str, list[Event]]) -> dict:
+    return {
+        f"{category}_events": [asdict(e) for e in category_events]
+        for category, category_events in events.items()
+    }
+
+
+def events_from_checkpoint(data: dict) -> dict[str, list[Event]]:
+    return {
+        category: [event_from_dict(e) for e in data[f"{category}_events"]]
+        for category in successful_scraper_sources
+    }
+
+
+def scrape_state() -> dict:
+    """Per-run scraper outcomes that later stages and the exit code need."""
+    return {
+        "scraper_errors": [asdict(error) for error in scraper_errors],
+        "successful_sources": {
+            category: sorted(sources)
+            for category, sources in successful_scraper_sources.items()
+        },
+        "fingerprints": fresh_fingerprints,
+    }
+
+
+def restore_scrape_state(data: dict) -> None:
+    scraper_errors.extend(
+        ScraperError(**error) for error in data.get("scraper_errors", [])
+    )
+    for category, sources in data.get("successful_sources", {}).items():
+        successful_scraper_sources[category].update(sources)
+    fresh_fingerprints.update(data.get("fingerprints", {}))
+
+
+def is_production_run(args: argparse.Namespace) -> bool:
+    """Whether a run scrapes every due scraper from the network.
+
+    Only such runs may update the committed data files: scraper run times
+    of a partial or replayed run say nothing about a scheduled one.
+    """
+    return not (args.only or args.skip or args.replay)
+
+
+def run_pipeline(args: argparse.Namespace) -> None:
+    """Scrape, deduplicate, enrich and save one (grouped) run."""
     group = args.group
 
     scraper_errors.clear()
+    scraper_fetch_contexts.clear()
+    scraper_wall_seconds.clear()
+    scraper_parse_seconds.clear()
+    scraper_event_counts.clear()
+    scrapers_ran.clear()
+    previous_fingerprints.clear()
+    fresh_fingerprints.clear()
     for sources in successful_scraper_sources.values():
         sources.clear()
 
     if args.dry_run:
         print("=== DRY RUN - showing what would run ===\n")
-        run_festivals = should_run_festival_scrapers()
 
-        if group:
+        if group and args.groups:
+            print(f"Shard {group} of {args.groups} (balanced from {SCRAPER_HISTORY_FILE.name}):")
+        elif group:
             print(f"Group {group} scrapers:")
-            music_scrapers = SCRAPER_GROUPS[group]["music"]
-            if group == 1 and run_festivals:
-                music_scrapers = music_scrapers + [bfh, garana, jazzinthepark, jfr, rockstadt]
-            theatre_scrapers = SCRAPER_GROUPS[group]["theatre"]
-            culture_scrapers = SCRAPER_GROUPS[group]["culture"]
         else:
             print("All scrapers (no group specified):")
-            music_scrapers = [ateneul, bfh, control, enescu, eventbook_music, expirat, hardrock, iabilet, operanb, quantic, jfr, garana, jazzinthepark, jazzx, rockstadt]
-            theatre_scrapers = [bulandra, cuibul, eventbook_theatre, godot, grivita53, metropolis, nottara, teatrulmic, tnb]
-            culture_scrapers = [arcub, elvirepopescu, improteca, mare, mnac]
-
-        # Filter out festivals if not running
-        if not run_festivals:
-            music_scrapers = [s for s in music_scrapers if s not in FESTIVAL_SCRAPERS]
+        selected = scrapers_for_run(group, args.groups, args.only, args.skip)
+        music_scrapers = selected["music"]
+        theatre_scrapers = selected["theatre"]
+        culture_scrapers = selected["culture"]
 
         print(f"\nMusic ({len(music_scrapers)}):")
         for s in music_scrapers:
-            print(f"  - {s.__name__.split('.')[-1]}")
+            print(f"  - {s.name}")
 
         print(f"\nTheatre ({len(theatre_scrapers)}):")
         for s in theatre_scrapers:
-            print(f"  - {s.__name__.split('.')[-1]}")
+            print(f"  - {s.name}")
 
         print(f"\nCulture ({len(culture_scrapers)}):")
         for s in culture_scrapers:
-            print(f"  - {s.__name__.split('.')[-1]}")
+            print(f"  - {s.name}")
 
         print(f"\nTotal: {len(music_scrapers) + len(theatre_scrapers) + len(culture_scrapers)} scrapers")
-        if not run_festivals:
-            print("(festival scrapers skipped - refreshed Sundays and on the 1st)")
         return
 
+    resume_from = args.resume_from
+    checkpoints = checkpoint_dir(group)
     if group:
         print(f"Running scraper group {group}...")
 
@@ -625,48 +1273,135 @@ def main() -> None:
     existing_events = load_existing_events()
     previous_keys = load_previous_event_keys(existing_events)
     print(f"Loaded {len(previous_keys)} existing events")
+    previous_fingerprints.update(load_fingerprints(FINGERPRINTS_FILE))
+
+    events: dict[str, list[Event]] = {}
+    resumed_stage = previous_stage(resume_from) if resume_from else None
+    if resumed_stage:
+        print(
+            f"Resuming from {resume_from}; loading checkpoints from {checkpoints}"
+        )
+        scraped = load_checkpoint(checkpoints, "scrape")
+        restore_scrape_state(scraped)
+        events = events_from_checkpoint(
+            scraped
+            if resumed_stage == "scrape"
+            else load_checkpoint(checkpoints, resumed_stage)
+        )
+
+    stage_seconds: dict[str, float] = {}
+    # Each scraper's results are deduplicated, and theatre/culture detail
+    # pages fetched, while the other scrapers are still running.
+    streaming: dict[str, StreamingDedup] = {}
+    enrichment = None
+    if runs_stage("scrape", resume_from):
+        streaming = {category: StreamingDedup() for category in previous_events}
+        enrichment = EnrichmentPool()
+
+    def on_scraper_result(category: str, index: int, results: list[Event]) -> None:
+        streaming[category].add(index, results)
+        enrichment.submit(results)
 
-    print("Running music scrapers...")
-    music_events = run_music_scrapers(group)
-    print(f"Found {len(music_events)} music events")
-
-    print("Running theatre scrapers...")
-    theatre_events = run_theatre_scrapers(group)
-    print(f"Found {len(theatre_events)} theatre events")
-
-    print("Running culture scrapers...")
-    culture_events = run_culture_scrapers(group)
-    print(f"Found {len(culture_events)} culture events")
-
-    print("Deduplicating events...")
-    deduped_music = stage1_dedup(music_events)
-    deduped_music = llm_dedup(deduped_music)
-    deduped_theatre = stage1_dedup(theatre_events)
-    deduped_culture = stage1_dedup(culture_events)
-    print(f"After dedup: {len(deduped_music)} music, {len(deduped_theatre)} theatre, {len(deduped_culture)} culture")
-
-    print("Enriching music events with Spotify links...")
-    deduped_music = enrich_with_spotify(deduped_music)
-    spotify_count = sum(1 for e in deduped_music if e.spotify_url)
-    print(f"Found {spotify_count} artists on Spotify")
-
-    print("Enriching theatre/culture events with details...")
-    deduped_theatre = enrich_events(deduped_theatre)
-    deduped_culture = enrich_events(deduped_culture)
-    theatre_enriched = sum(1 for e in deduped_theatre if e.description or e.image_url)
-    culture_enriched = sum(1 for e in deduped_culture if e.description or e.image_url)
-    print(f"Enriched {theatre_enriched} theatre, {culture_enriched} culture events")
-
-    new_music = get_new_events(deduped_music, previous_keys)
-    new_theatre = get_new_events(deduped_theatre, previous_keys)
-    new_culture = get_new_events(deduped_culture, previous_keys)
+    try:
+        if runs_stage("scrape", resume_from):
+            for category in previous_events:
+                previous_events[category] = existing_events[f"{category}_events"]
+            print(f"Running scrapers ({args.workers} at a time)...")
+            with timed(stage_seconds, "scrape"):
+                music_events, theatre_events, culture_events = run_all_scrapers(
+                    group,
+                    args.workers,
+                    args.groups,
+                    on_scraper_result,
+                    args.only,
+                    args.skip,
+                )
+            metrics_file = save_run_metrics(group, stage_seconds)
+            if not group and is_production_run(args):
+                update_scraper_history([metrics_file])
+            events = {
+                "music": music_events,
+                "theatre": theatre_events,
+                "culture": culture_events,
+            }
+            save_checkpoint(
+                checkpoints,
+                "scrape",
+                {**scrape_state(), **events_checkpoint(events)},
+            )
+            print(f"Found {len(music_events)} music events")
+            print(f"Found {len(theatre_events)} theatre events")
+            print(f"Found {len(culture_events)} culture events")
+
+        if runs_stage("dedup", resume_from):
+            print("Deduplicating events...")
+            with timed(stage_seconds, "dedup"):
+                events = {
+                    category: (
+                        streaming[category].result()
+                        if streaming
+                        else stage1_dedup(category_events)
+                    )
+                    for category, category_events in events.items()
+                }
+            with timed(stage_seconds, "llm_dedup"):
+                events["music"] = llm_dedup(events["music"])
+            save_checkpoint(checkpoints, "dedup", events_checkpoint(events))
+            print(f"After dedup: {len(events['music'])} music, {len(events['theatre'])} theatre, {len(events['culture'])} culture")
+
+        if runs_stage("enrich", resume_from):
+            print("Enriching music events with Spotify links...")
+            with timed(stage_seconds, "spotify"):
+                events["music"] = enrich_with_spotify(events["music"])
+            spotify_count = sum(1 for e in events["music"] if e.spotify_url)
+            print(f"Found {spotify_count} artists on Spotify")
+
+            print("Enriching theatre/culture events with details...")
+            # Most detail pages were fetched while the scrapers were still
+            # running; the AI fallback only runs for events dedup kept.
+            with timed(stage_seconds, "enrich"):
+                prefetched = enrichment.finish() if enrichment else {}
+                events["theatre"] = enrich_events(events["theatre"], prefetched)
+                events["culture"] = enrich_events(events["culture"], prefetched)
+            save_checkpoint(checkpoints, "enrich", events_checkpoint(events))
+            theatre_enriched = sum(1 for e in events["theatre"] if e.description or e.image_url)
+            culture_enriched = sum(1 for e in events["culture"] if e.description or e.image_url)
+            print(f"Enriched {theatre_enriched} theatre, {culture_enriched} culture events")
+    finally:
+        for dedup in streaming.values():
+            dedup.close()
+        if enrichment:
+            enrichment.cancel()
+
+    new_music = get_new_events(events["music"], previous_keys)
+    new_theatre = get_new_events(events["theatre"], previous_keys)
+    new_culture = get_new_events(events["culture"], previous_keys)
     print(f"New events: {len(new_music)} music, {len(new_theatre)} theatre, {len(new_culture)} culture")
 
     if group:
         print(f"Saving group {group} results to artifact...")
     else:
         print("Saving results (merging new events and removing past events)...")
-    save_results(deduped_music, deduped_theatre, deduped_culture, existing_events, group)
+    with timed(stage_seconds, "save"):
+        save_results(
+            events["music"],
+            events["theatre"],
+            events["culture"],
+            existing_events,
+            group,
+            args.groups,
+            REPLAY_EVENTS_FILE if args.replay else None,
+        )
+    save_run_metrics(
+        group,
+        stage_seconds,
+        resumed=not runs_stage("scrape", resume_from),
+    )
+    if not group and not args.replay:
+        save_fingerprints(
+            FINGERPRINTS_FILE,
+            {**previous_fingerprints, **fresh_fingerprints},
+        )
 
     if scraper_errors:
         print(f"\n⚠️  {len(scraper_errors)} scraper(s) had issues:")
@@ -11,6 +11,8 @@ BASE_URL = "https://mare.ro"
 EXHIBITIONS_URL = f"{BASE_URL}/exhibitions-2/"
 MIN_EXPECTED_EVENTS = 1
 EXPANSION_DAYS = 30
+# Exhibitions run for months; a cached copy may be reused for two days.
+CACHE_TTL_SECONDS = 2 * 24 * 3600
 
 ENGLISH_WEEKDAYS = {
     "monday": 0,
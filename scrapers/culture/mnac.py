@@ -18,6 +18,8 @@ CURRENT_EXHIBITIONS_URL = (
 VISITING_HOURS_URL = f"{BASE_URL}/public/text/get?nodeId=11"
 MIN_EXPECTED_EVENTS = 1
 EXPANSION_DAYS = 30
+# Exhibitions run for months; a cached copy may be reused for two days.
+CACHE_TTL_SECONDS = 2 * 24 * 3600
 BUCHAREST_TZ = ZoneInfo("Europe/Bucharest")
 
 
@@ -67,6 +67,8 @@ def scrape() -> list[Event]:
             needs_js=True,
             scroll_count=50,
             scroll_item_selector='a[href*="/hub/event/"]',
+            # Infinite scroll is triggered by layout, so keep the stylesheets.
+            allow_resource_types={"stylesheet"},
         )
     except Exception as e:
         print(f"Failed to fetch Ateneul Român events: {e}")
@@ -9,6 +9,9 @@ from services.http import fetch_page
 BASE_URL = "https://www.control-club.ro"
 EVENTS_URL = f"{BASE_URL}/events/"
 MIN_EXPECTED_EVENTS = 1
+# Most of a run is spent on detail pages; while the listing is unchanged the
+# last run's events are reused instead.
+FINGERPRINT_SELECTOR = ".events-list-view"
 
 
 def parse_date_header(header_text: str) -> datetime | None:
@@ -153,13 +156,16 @@ def parse_event(event_div: BeautifulSoup, event_date: datetime, room: str) -> Ev
     )
 
 
-def scrape() -> list[Event]:
-    """Fetch upcoming events from Control Club."""
+def scrape(listing_html: str | None = None) -> list[Event]:
+    """Fetch upcoming events from Control Club.
+
+    ``listing_html`` is the events page when the caller already fetched it.
+    """
     events: list[Event] = []
     seen_urls: set[str] = set()
     
     try:
-        html = fetch_page(EVENTS_URL)
+        html = listing_html if listing_html is not None else fetch_page(EVENTS_URL)
     except Exception as e:
         print(f"Failed to fetch Control Club events: {e}")
         return events
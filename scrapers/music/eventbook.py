@@ -4,13 +4,14 @@ from datetime import datetime
 from bs4 import BeautifulSoup
 
 from models import Event
-from services.http import fetch_page
+from services.http import RateLimit, fetch_page
 
 BASE_URL = "https://eventbook.ro"
 BUCHAREST_URL = f"{BASE_URL}/city/bucuresti"
 MAX_PAGES = 50
 DATE_ICON_LABELS = {"calendar_month", "schedule"}
 MIN_EXPECTED_EVENTS = 1
+RATE_LIMIT = RateLimit(requests_per_second=2.0, burst=2, max_in_flight=2)
 
 
 def parse_date(date_str: str) -> datetime | None:
@@ -6,13 +6,14 @@ from urllib.parse import urlencode, urljoin
 from bs4 import BeautifulSoup
 
 from models import Event
-from services.http import fetch_page
+from services.http import RateLimit, fetch_page
 
 BASE_URL = "https://www.iabilet.ro"
 BUCHAREST_URL = f"{BASE_URL}/bilete-in-bucuresti/"
 MAX_PAGES = 50
 MAX_PAGINATION_PASSES = 3
 MIN_EXPECTED_EVENTS = 1
+RATE_LIMIT = RateLimit(requests_per_second=2.0, burst=2, max_in_flight=2)
 
 MUSIC_CATEGORIES = (
     "concerte-pop",
@@ -0,0 +1,113 @@
+"""Every scheduled scraper, described without importing it.
+
+Each ScraperSpec names a module under ``scrapers/`` together with the
+metadata the scheduler needs: its category, whether it is an annual
+festival (refreshed weekly), its static group and a rough run time used
+to balance shards before any history exists. Modules are imported by
+``ScraperSpec.load`` only once a run has selected them.
+"""
+
+import importlib
+from dataclasses import dataclass
+from types import ModuleType
+
+CATEGORIES = ("music", "theatre", "culture")
+DEFAULT_WEIGHT_SECONDS = 60.0
+
+
+@dataclass(frozen=True)
+class ScraperSpec:
+    category: str
+    name: str
+    group: int
+    festival: bool = False
+    weight: float = DEFAULT_WEIGHT_SECONDS
+
+    @property
+    def key(self) -> str:
+        """Stable id such as "music.eventbook" (names repeat per category)."""
+        return f"{self.category}.{self.name}"
+
+    @property
+    def module_name(self) -> str:
+        return f"scrapers.{self.key}"
+
+    def load(self) -> ModuleType:
+        return importlib.import_module(self.module_name)
+
+
+# Listed in run order, each static group in its historical order with the
+# weekly festivals after group 1's regular scrapers. Stage-1 dedup keeps the
+# first event for a repeated key and the cross-source URL/Control pass breaks
+# source_priority ties by first seen, so the order still picks a winner
+# there. Clusters of similar events resolve by source_priority instead.
+# Group 1: Heavy scrapers = ateneul (50 scrolls), enescu (20 clicks)
+# Group 2: Heavy scrapers = operanb (4 pages), tnb (2 pages)
+SCRAPERS: tuple[ScraperSpec, ...] = (
+    ScraperSpec("music", "ateneul", group=1, weight=600.0),
+    ScraperSpec("music", "enescu", group=1, weight=300.0),
+    ScraperSpec("music", "eventbook", group=1),
+    ScraperSpec("music", "control", group=1),
+    ScraperSpec("music", "hardrock", group=1),
+    ScraperSpec("music", "jazzx", group=1),
+    ScraperSpec("music", "bfh", group=1, festival=True),
+    ScraperSpec("music", "garana", group=1, festival=True),
+    ScraperSpec("music", "jazzinthepark", group=1, festival=True),
+    ScraperSpec("music", "jfr", group=1, festival=True),
+    ScraperSpec("music", "rockstadt", group=1, festival=True),
+    ScraperSpec("music", "operanb", group=2, weight=240.0),
+    ScraperSpec("music", "expirat", group=2),
+    ScraperSpec("music", "quantic", group=2),
+    ScraperSpec("music", "iabilet", group=2),
+    ScraperSpec("theatre", "bulandra", group=1),
+    ScraperSpec("theatre", "cuibul", group=1),
+    ScraperSpec("theatre", "eventbook", group=1),
+    ScraperSpec("theatre", "godot", group=1),
+    ScraperSpec("theatre", "grivita53", group=1),
+    ScraperSpec("theatre", "metropolis", group=2),
+    ScraperSpec("theatre", "nottara", group=2),
+    ScraperSpec("theatre", "teatrulmic", group=2),
+    ScraperSpec("theatre", "tnb", group=2, weight=180.0),
+    ScraperSpec("culture", "arcub", group=1),
+    ScraperSpec("culture", "elvirepopescu", group=2),
+    ScraperSpec("culture", "improteca", group=2),
+    ScraperSpec("culture", "mare", group=1),
+    ScraperSpec("culture", "mnac", group=1),
+)
+
+STATIC_GROUPS = tuple(sorted({spec.group for spec in SCRAPERS}))
+
+
+def get_spec(key: str) -> ScraperSpec:
+    """Look up a scraper by key, e.g. "theatre.tnb"; raises KeyError."""
+    for spec in SCRAPERS:
+        if spec.key == key:
+            return spec
+    raise KeyError(key)
+
+
+def scraper_specs(
+    category: str | None = None,
+    group: int | None = None,
+    festivals: bool = True,
+) -> list[ScraperSpec]:
+    """Registered scrapers in run order, optionally narrowed down."""
+    return [
+        spec
+        for spec in SCRAPERS
+        if (category is None or spec.category == category)
+        and (group is None or spec.group == group)
+        and (festivals or not spec.festival)
+    ]
+
+
+def matches(spec: ScraperSpec, names: set[str]) -> bool:
+    """Whether a CLI name ("control" or "music.control") picks ``spec``."""
+    return spec.name in names or spec.key in names
+
+
+def unknown_names(names: set[str]) -> list[str]:
+    """The names that match no registered scraper."""
+    return sorted(
+        name for name in names if not any(matches(spec, {name}) for spec in SCRAPERS)
+    )
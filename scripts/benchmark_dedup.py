@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Benchmark stage-1 dedup on synthetic feeds of growing size.
+
+Usage:
+    python scripts/benchmark_dedup.py                      # 10k..100k events
+    python scripts/benchmark_dedup.py --sizes 5000,20000
+    python scripts/benchmark_dedup.py --full               # include cross-source pass
+"""
+
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from models import Event
+from services.dedup import dedup_similar, stage1_dedup
+
+DEFAULT_SIZES = (10_000, 25_000, 50_000, 100_000)
+SOURCES = ("iabilet", "eventbook", "control", "expirat", "quantic", "hardrock")
+VENUES = (
+    "Control Club",
+    "Club Control",
+    "Expirat Halele Carol",
+    "Quantic Club",
+    "Berăria H",
+    "Sala Palatului",
+    "Arenele Romane",
+    "Hard Rock Cafe",
+    "Teatrul National Bucuresti",
+    "TNB",
+)
+SHOW_TIMES = ((19, 0), (20, 0), (21, 30), (0, 0))
+
+
+def synthetic_events(count: int, seed: int = 0, days: int = 365) -> list[Event]:
+    """A feed where about a quarter of the events repeat an earlier one.
+
+    Repeats come from another source, with a venue alias and small spelling
+    differences, as the real aggregators produce them.
+    """
+    rng = random.Random(seed)
+    start = datetime(2026, 1, 1)
+    artists = [f"Artist {index:05d}" for index in range(max(count // 3, 1))]
+    events: list[Event] = []
+    for index in range(count):
+        if events and rng.random() < 0.25:
+            original = rng.choice(events)
+            artist = original.artist or original.title
+            if rng.random() < 0.5:
+                artist = artist.upper()
+            events.append(Event(
+                title=f"{artist} live",
+                artist=artist,
+                venue=rng.choice(VENUES),
+                date=original.date,
+                url=f"https://{rng.choice(SOURCES)}.example/{index}",
+                source=rng.choice(SOURCES),
+                category="music",
+            ))
+            continue
+        hour, minute = rng.choice(SHOW_TIMES)
+        day = start + timedelta(days=rng.randrange(days))
+        artist = rng.choice(artists)
+        events.append(Event(
+            title=f"{artist} live",
+            artist=artist,
+            venue=rng.choice(VENUES),
+            date=day.replace(hour=hour, minute=minute),
+            url=f"https://{rng.choice(SOURCES)}.example/{index}",
+            source=rng.choice(SOURCES),
+            category="music",
+        ))
+    return events
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument(
+        "--sizes",
+        default=",".join(str(size) for size in DEFAULT_SIZES),
+        help="Comma-separated feed sizes (default: %(default)s)",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Time the whole stage1_dedup, cross-source pass included",
+    )
+    args = parser.parse_args()
+
+    dedup = stage1_dedup if args.full else dedup_similar
+    print(f"{'events':>8} {'kept':>8} {'seconds':>9} {'events/s':>10}")
+    for size in (int(value) for value in args.sizes.split(",")):
+        events = synthetic_events(size, args.seed)
+        started = time.perf_counter()
+        kept = dedup(events)
+        elapsed = time.perf_counter() - started
+        print(f"{size:>8} {len(kept):>8} {elapsed:>9.2f} {size / elapsed:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
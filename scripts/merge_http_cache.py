@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""Combine the HTTP response caches produced by parallel scraper groups."""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from services.http_cache import CACHE_FILENAME, ResponseCache
+
+
+def merge_cache_dirs(input_dir: Path, output_dir: Path) -> int:
+    """Merge every nested cache database into ``output_dir``; returns entries read.
+
+    Shards are rebalanced from run history, so a host may be fetched by a
+    different group on the next run. Merging gives every group one cache
+    holding all hosts; an entry stored by both shards keeps the newer body.
+    """
+    output_file = output_dir / CACHE_FILENAME
+    cache = ResponseCache(output_dir)
+    try:
+        return sum(
+            cache.merge(cache_file)
+            for cache_file in sorted(input_dir.glob(f"**/{CACHE_FILENAME}"))
+            if cache_file.resolve() != output_file.resolve()
+        )
+    finally:
+        cache.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--input-dir", type=Path, required=True)
+    parser.add_argument("--output-dir", type=Path, required=True)
+    args = parser.parse_args()
+
+    print(merge_cache_dirs(args.input_dir, args.output_dir))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Combine run metrics artifacts produced by parallel scraper groups."""
+
+import argparse
+import json
+from datetime import datetime
+from pathlib import Path
+
+SUMMED_FIELDS = (
+    "wall_seconds",
+    "parse_seconds",
+    "fetch_seconds",
+    "events",
+    "http_requests",
+    "rendered_pages",
+    "bytes_received",
+    "retries",
+    "reader_fallbacks",
+    "cache_hits",
+    "circuit_skips",
+)
+
+
+def merge_metrics_files(input_dir: Path, output_file: Path) -> int:
+    """Merge every nested run_metrics*.json file; returns the scraper count.
+
+    Scrapers are keyed by their scraper key, so each appears once (a later
+    shard wins if two report the same scraper). Stage timings are kept per
+    shard and summed into ``stages``, and ``totals`` adds up every scraper.
+    """
+    scrapers: dict[str, dict] = {}
+    shards: list[dict] = []
+    stages: dict[str, float] = {}
+
+    for metrics_file in sorted(input_dir.glob("**/run_metrics*.json")):
+        if metrics_file.resolve() == output_file.resolve():
+            continue
+        data = json.loads(metrics_file.read_text())
+        scrapers.update(data.get("scrapers", {}))
+        shard_stages = data.get("stages", {})
+        shards.append({"group": data.get("group"), "stages": shard_stages})
+        for stage, seconds in shard_stages.items():
+            stages[stage] = round(stages.get(stage, 0.0) + seconds, 2)
+
+    if not shards:
+        return 0
+
+    totals = {
+        name: round(sum(metrics.get(name, 0) for metrics in scrapers.values()), 2)
+        for name in SUMMED_FIELDS
+    }
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    output_file.write_text(
+        json.dumps(
+            {
+                "timestamp": datetime.now().isoformat(),
+                "stages": stages,
+                "shards": shards,
+                "totals": totals,
+                "scrapers": dict(sorted(scrapers.items())),
+            },
+            indent=2,
+        )
+    )
+    return len(scrapers)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--input-dir", type=Path, required=True)
+    parser.add_argument("--output", type=Path, required=True)
+    args = parser.parse_args()
+
+    print(merge_metrics_files(args.input_dir, args.output))
+
+
+if __name__ == "__main__":
+    main()
@@ -11,7 +11,6 @@ import argparse
 import os
 import sys
 from pathlib import Path
-from types import ModuleType
 
 from dotenv import load_dotenv
 
@@ -20,21 +19,12 @@ load_dotenv(Path(__file__).parent.parent / ".env")
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from models import Event
-from main import FESTIVAL_SCRAPERS, SCRAPER_GROUPS
+from scrapers.registry import CATEGORIES, scraper_specs
 from services.email import ScraperError, send_scraper_alert
 
-
-def registered_scrapers(category: str) -> list[ModuleType]:
-    """Return each scheduled scraper once, preserving group order."""
-    scrapers = SCRAPER_GROUPS[1][category] + SCRAPER_GROUPS[2][category]
-    if category == "music":
-        scrapers += sorted(FESTIVAL_SCRAPERS, key=lambda scraper: scraper.__name__)
-    return list(dict.fromkeys(scrapers))
-
-
 SCRAPERS = {
-    category: registered_scrapers(category)
-    for category in ("music", "theatre", "culture")
+    category: [spec.load() for spec in scraper_specs(category)]
+    for category in CATEGORIES
 }
 
 
@@ -0,0 +1,58 @@
+"""Checkpoints between pipeline stages, so a failed run can be resumed.
+
+The pipeline runs scrape → dedup → enrich → save. Each stage before save
+writes its output to ``<directory>/<stage>.json``; ``--resume-from <stage>``
+loads the checkpoint of the stage before it and redoes only what follows.
+"""
+
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+
+STAGES = ("scrape", "dedup", "enrich", "save")
+
+
+def previous_stage(stage: str) -> str | None:
+    """The stage whose checkpoint feeds ``stage`` (None for the first)."""
+    index = STAGES.index(stage)
+    return STAGES[index - 1] if index else None
+
+
+def runs_stage(stage: str, resume_from: str | None) -> bool:
+    """Whether ``stage`` is redone when resuming from ``resume_from``."""
+    if resume_from is None:
+        return True
+    return STAGES.index(stage) >= STAGES.index(resume_from)
+
+
+def checkpoint_path(directory: Path, stage: str) -> Path:
+    return directory / f"{stage}.json"
+
+
+def save_checkpoint(directory: Path, stage: str, data: dict) -> Path:
+    """Write a stage's output, replacing any earlier checkpoint atomically."""
+    directory.mkdir(parents=True, exist_ok=True)
+    path = checkpoint_path(directory, stage)
+    partial = path.with_name(f"{path.name}.partial")
+    with open(partial, "w") as f:
+        json.dump(
+            {"stage": stage, "saved_at": datetime.now().isoformat(), **data},
+            f,
+            indent=2,
+            default=str,
+        )
+    os.replace(partial, path)
+    return path
+
+
+def load_checkpoint(directory: Path, stage: str) -> dict:
+    """Read a stage's checkpoint or raise FileNotFoundError."""
+    path = checkpoint_path(directory, stage)
+    if not path.exists():
+        raise FileNotFoundError(
+            f"No {stage} checkpoint at {path}; run the pipeline from an "
+            f"earlier stage first"
+        )
+    with open(path) as f:
+        return json.load(f)
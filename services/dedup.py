@@ -1,98 +1,33 @@
 import json
 import os
-import re
+import threading
 from collections import Counter
-from datetime import date, datetime
-from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from datetime import date, datetime, time
 
+import numpy as np
 from google import genai
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 
 from models import Event
+from services.normalization import event_view
 
 SOURCE_PRIORITY = {
     "eventbook": 10,
     "jfr": 20,
     "control": 20,
 }
-TRACKING_QUERY_KEYS = {"fbclid", "gclid"}
 CONTROL_TICKET_SOURCES = frozenset({"control", "eventbook"})
 MAX_DOOR_SHOW_DELTA_SECONDS = 90 * 60
 ControlScheduleKey = tuple[str, date, str, str]
-
-# Canonical venue names -> list of known aliases/variations
-VENUE_ALIASES: dict[str, list[str]] = {
-    "control": ["control club", "control bucuresti", "club control"],
-    "expirat": ["expirat club", "club expirat", "expirat halele carol"],
-    "quantic": ["quantic club", "club quantic", "quantic bucuresti"],
-    "beraria h": ["beraria h bucuresti", "berăria h"],
-    "arenele romane": ["arenele romane bucuresti"],
-    "sala palatului": ["sala palatului bucuresti"],
-    "romexpo": ["romexpo bucuresti", "pavilion romexpo"],
-    "opera nationala bucuresti": ["opera nb", "opera nationala"],
-    "grivita 53": ["g53", "teatrul grivita", "teatrul grivita 53"],
-    "tnb": ["teatrul national bucuresti", "teatrul nb", "teatrul national"]
-}
-
-# Build reverse lookup: alias -> canonical name
-_ALIAS_TO_CANONICAL: dict[str, str] = {}
-for canonical, aliases in VENUE_ALIASES.items():
-    _ALIAS_TO_CANONICAL[canonical] = canonical
-    for alias in aliases:
-        _ALIAS_TO_CANONICAL[alias] = canonical
-
-
-def sanitize_venue(venue: str) -> str:
-    """Normalize venue name: lowercase, remove extra whitespace, punctuation."""
-    venue = venue.lower().strip()
-    venue = re.sub(r"[^\w\s]", "", venue)  # remove punctuation
-    venue = re.sub(r"\s+", " ", venue)  # collapse whitespace
-    return venue
-
-
-def normalize_venue(venue: str) -> str:
-    """Sanitize and resolve to canonical venue name if known."""
-    sanitized = sanitize_venue(venue)
-    return _ALIAS_TO_CANONICAL.get(sanitized, sanitized)
+IDENTITY_MATCH_THRESHOLD = 85
+VENUE_MATCH_THRESHOLD = 80
+DEDUP_WORKERS = -1
+SIMILARITY_ROW_CHUNK = 512
 
 
 def normalize_for_dedup(event: Event) -> str:
     """Create a normalized key for exact deduplication."""
-    identity = (event.artist or event.title).lower().strip()
-    venue = normalize_venue(event.venue)
-    date_str = event.date.strftime("%Y-%m-%dT%H:%M")
-    return f"{event.source}|{identity}|{date_str}|{venue}"
-
-
-def canonicalize_url(url: str) -> str:
-    """Normalize URL spelling without discarding identity-bearing query params."""
-    try:
-        parsed = urlsplit(url.strip())
-        hostname = parsed.hostname
-        if not hostname:
-            return url.strip()
-
-        hostname = hostname.casefold().removeprefix("www.")
-        port = parsed.port
-        if port and not (
-            (parsed.scheme.casefold() == "http" and port == 80)
-            or (parsed.scheme.casefold() == "https" and port == 443)
-        ):
-            hostname = f"{hostname}:{port}"
-
-        path = re.sub(r"/{2,}", "/", parsed.path or "/")
-        if path != "/":
-            path = path.rstrip("/")
-
-        query = urlencode(sorted(
-            (key, value)
-            for key, value in parse_qsl(parsed.query, keep_blank_values=True)
-            if not key.casefold().startswith("utm_")
-            and key.casefold() not in TRACKING_QUERY_KEYS
-        ))
-        return urlunsplit(("https", hostname, path, query, ""))
-    except ValueError:
-        return url.strip()
+    return event_view(event).dedup_key
 
 
 def source_priority(event: Event) -> int:
@@ -100,51 +35,14 @@ def source_priority(event: Event) -> int:
     return SOURCE_PRIORITY.get(event.source, 0)
 
 
-def normalize_control_title(title: str) -> str:
-    """Remove known Control/Eventbook packaging while retaining artist identity."""
-    title = re.sub(
-        r"\s*\|\s*(?:live at control|control club)\s*\|.*$",
-        "",
-        title,
-        flags=re.IGNORECASE,
-    )
-    title = re.sub(
-        r"^\s*(?:ctrl\s+)?live\s*:\s*",
-        "",
-        title,
-        flags=re.IGNORECASE,
-    )
-    title = re.sub(
-        r"\[(?:[A-Z]{2,3}(?:/[A-Z]{2,3})*|Algeria)\]",
-        " ",
-        title,
-    )
-    title = re.sub(r"\((?:[A-Z]{2,3}(?:/[A-Z]{2,3})*)\)", " ", title)
-    title = re.sub(
-        r"\blive(?=\s*\+\s*special guests\b)",
-        " ",
-        title,
-        flags=re.IGNORECASE,
-    )
-    title = re.sub(r"[^\w]+", " ", title.casefold(), flags=re.UNICODE)
-    return " ".join(title.split())
-
-
-def control_venue_family(venue: str) -> str:
-    """Map Control room-qualified names to the ticket feed's venue root."""
-    sanitized = sanitize_venue(venue)
-    if normalize_venue(venue) == "control" or sanitized.startswith("control club "):
-        return "control"
-    return normalize_venue(venue)
-
-
 def control_schedule_key(event: Event) -> ControlScheduleKey | None:
     """Build the coarse key used only for the Control/Eventbook source pair."""
     if event.source not in CONTROL_TICKET_SOURCES:
         return None
 
-    title = normalize_control_title(event.title)
-    venue = control_venue_family(event.venue)
+    view = event_view(event)
+    title = view.control_title
+    venue = view.control_venue
     if not title or venue != "control":
         return None
     return event.source, event.date.date(), title, venue
@@ -175,35 +73,87 @@ def is_unique_control_ticket_overlap(
 
 
 def dedup_preferred_cross_source(events: list[Event]) -> list[Event]:
-    """Apply deterministic cross-source rules and retain the preferred record."""
+    """Apply deterministic cross-source rules and retain the preferred record.
+
+    Each event merges into the earliest kept slot it matches, either by
+    (date, canonical URL) or as the unique Control/Eventbook counterpart.
+    Both are looked up in dicts that follow slot replacements, so every
+    event costs a couple of lookups rather than a scan of the kept list.
+    """
+    return [event for _, event in _preferred_cross_source_slots(events)]
+
+
+def _preferred_cross_source_slots(events: list[Event]) -> list[tuple[int, Event]]:
+    """Kept events of dedup_preferred_cross_source with their slot's first index."""
     schedule_counts = Counter(
         key for event in events if (key := control_schedule_key(event)) is not None
     )
     deduped: list[Event] = []
+    slot_first: list[int] = []
+    slot_keys: list[tuple[tuple[datetime, str] | None, ControlScheduleKey | None]] = []
+    slots_by_url: dict[tuple[datetime, str], list[int]] = {}
+    slot_by_schedule: dict[ControlScheduleKey, int] = {}
+
+    def index_slot(slot: int, event: Event, canonical_url: str) -> None:
+        url_key = (event.date, canonical_url) if canonical_url else None
+        schedule_key = control_schedule_key(event)
+        if schedule_counts.get(schedule_key) != 1:
+            schedule_key = None
+        if url_key:
+            slots_by_url.setdefault(url_key, []).append(slot)
+        if schedule_key:
+            slot_by_schedule[schedule_key] = slot
+        slot_keys[slot] = (url_key, schedule_key)
+
+    def unindex_slot(slot: int) -> None:
+        url_key, schedule_key = slot_keys[slot]
+        if url_key:
+            slots_by_url[url_key].remove(slot)
+        if schedule_key:
+            del slot_by_schedule[schedule_key]
+
+    for index, event in enumerate(events):
+        canonical_url = event_view(event).canonical_url
+        candidates = (
+            list(slots_by_url.get((event.date, canonical_url), ()))
+            if canonical_url
+            else []
+        )
+        counterpart = _control_counterpart(event, schedule_counts, slot_by_schedule)
+        if counterpart is not None and is_unique_control_ticket_overlap(
+            event,
+            deduped[counterpart],
+            schedule_counts,
+        ):
+            candidates.append(counterpart)
+
+        if candidates:
+            slot = min(candidates)
+            if source_priority(event) > source_priority(deduped[slot]):
+                unindex_slot(slot)
+                deduped[slot] = event
+                index_slot(slot, event, canonical_url)
+            continue
 
-    for event in events:
-        canonical_url = canonicalize_url(event.url)
-        is_duplicate = False
-        for existing_index, existing in enumerate(deduped):
-            same_canonical_occurrence = (
-                event.date == existing.date
-                and canonical_url
-                and canonical_url == canonicalize_url(existing.url)
-            )
-            if same_canonical_occurrence or is_unique_control_ticket_overlap(
-                event,
-                existing,
-                schedule_counts,
-            ):
-                if source_priority(event) > source_priority(existing):
-                    deduped[existing_index] = event
-                is_duplicate = True
-                break
-
-        if not is_duplicate:
-            deduped.append(event)
-
-    return deduped
+        deduped.append(event)
+        slot_first.append(index)
+        slot_keys.append((None, None))
+        index_slot(len(deduped) - 1, event, canonical_url)
+
+    return list(zip(slot_first, deduped))
+
+
+def _control_counterpart(
+    event: Event,
+    schedule_counts: Counter[ControlScheduleKey],
+    slot_by_schedule: dict[ControlScheduleKey, int],
+) -> int | None:
+    """Slot of the other Control/Eventbook feed's listing of the same show."""
+    key = control_schedule_key(event)
+    if key is None or schedule_counts[key] != 1:
+        return None
+    (other_source,) = CONTROL_TICKET_SOURCES - {key[0]}
+    return slot_by_schedule.get((other_source, *key[1:]))
 
 
 def event_from_serialized(record: dict) -> Event | None:
@@ -267,56 +217,298 @@ def stage1_dedup(events: list[Event]) -> list[Event]:
     if not events:
         return []
 
-    events = dedup_preferred_cross_source(events)
-    seen_keys: set[str] = set()
-    deduped: list[Event] = []
+    return [event for _, event in _stage1_slots(events)]
+
+
+def _stage1_slots(events: list[Event]) -> list[tuple[int, Event]]:
+    """Kept events of stage1_dedup with the earliest input index each absorbed."""
+    preferred = _preferred_cross_source_slots(events)
+    return [
+        (preferred[slot][0], event)
+        for slot, event in _similar_slots([event for _, event in preferred])
+    ]
+
+
+# Where an event sits in a run: (scraper index, position in its results).
+RunPosition = tuple[int, int]
+
+
+class StreamingDedup:
+    """Stage-1 dedup of scraper results as each scraper finishes.
+
+    Both stage-1 passes only match events of the same day, so every day is
+    deduplicated on its own. A worker thread redoes the days that new
+    results touched while other scrapers are still running, and result()
+    only finishes the days touched last. Events are ordered by their
+    RunPosition, so result() equals stage1_dedup of all results
+    concatenated in scraper order, whichever scraper finished first.
+    """
+
+    def __init__(self):
+        self._days: dict[date, list[tuple[RunPosition, Event]]] = {}
+        self._kept: dict[date, list[tuple[RunPosition, Event]]] = {}
+        self._dirty: set[date] = set()
+        self._closed = False
+        self._changed = threading.Condition()
+        self._thread = threading.Thread(target=self._work, name="stage1-dedup")
+        self._thread.start()
+
+    def add(self, index: int, events: list[Event]) -> None:
+        """Add the results of the scraper at ``index`` in the run order."""
+        with self._changed:
+            for position, event in enumerate(events):
+                day = event.date.date()
+                self._days.setdefault(day, []).append(((index, position), event))
+                self._dirty.add(day)
+            self._changed.notify()
+
+    def result(self) -> list[Event]:
+        """Finish the days still pending and return every kept event."""
+        self.close()
+        for day in self._dirty:
+            self._kept[day] = _dedup_run_day(self._days[day])
+        self._dirty.clear()
+        kept = [entry for entries in self._kept.values() for entry in entries]
+        return [event for _, event in sorted(kept, key=lambda entry: entry[0])]
+
+    def close(self) -> None:
+        """Stop the worker thread; days it has not redone stay pending."""
+        with self._changed:
+            self._closed = True
+            self._changed.notify()
+        self._thread.join()
+
+    def _work(self) -> None:
+        while True:
+            with self._changed:
+                while not self._dirty and not self._closed:
+                    self._changed.wait()
+                if self._closed:
+                    return
+                day = self._dirty.pop()
+                entries = list(self._days[day])
+            kept = _dedup_run_day(entries)
+            with self._changed:
+                # Results that arrived meanwhile marked the day dirty again.
+                self._kept[day] = kept
+
+
+def _dedup_run_day(
+    entries: list[tuple[RunPosition, Event]],
+) -> list[tuple[RunPosition, Event]]:
+    entries = sorted(entries, key=lambda entry: entry[0])
+    return [
+        (entries[index][0], event)
+        for index, event in _stage1_slots([event for _, event in entries])
+    ]
+
+
+def dedup_similar(
+    events: list[Event], workers: int = DEDUP_WORKERS
+) -> list[Event]:
+    """Collapse each cluster of matching same-day events into one event.
+
+    Two events match when they can be the same performance and their
+    identity and venue are similar. Matches chain (union-find), so A~B and
+    B~C put all three in one cluster, which keeps its highest
+    source_priority event. The kept set does not depend on input order;
+    each cluster's event sits where the cluster first appears in the input.
+    ``workers`` is passed to ``process.cdist`` (-1 uses every core).
+    """
+    return [event for _, event in _similar_slots(events, workers)]
+
+
+def _similar_slots(
+    events: list[Event], workers: int = DEDUP_WORKERS
+) -> list[tuple[int, Event]]:
+    """Kept events of dedup_similar with their cluster's earliest index."""
+    days: dict[date, list[int]] = {}
+    for index, event in enumerate(events):
+        days.setdefault(event.date.date(), []).append(index)
+
+    # Each cluster's representative takes the place of its earliest member.
+    kept: dict[int, Event] = {}
+    for indices in days.values():
+        day_events = [events[index] for index in indices]
+        for slot, position in _dedup_day(day_events, workers):
+            kept[indices[slot]] = day_events[position]
+
+    return sorted(kept.items())
+
+
+def _dedup_day(day_events: list[Event], workers: int) -> list[tuple[int, int]]:
+    """(earliest member, representative) positions per cluster of one day."""
+    if len(day_events) == 1:
+        return [(0, 0)]
+
+    # Work in a canonical order so edges, and therefore clusters and
+    # representatives, come out the same whatever order the scrapers ran in.
+    order = sorted(
+        range(len(day_events)),
+        key=lambda position: _canonical_order(day_events[position]),
+    )
+    events = [day_events[position] for position in order]
+    views = [event_view(event) for event in events]
+    clusters = _DuplicateClusters(events)
+
+    # Rows sharing an exact-match key are one listing repeated: join them
+    # up front and score only the first of each.
+    first_with_key: dict[str, int] = {}
+    scored: list[int] = []
+    for position, view in enumerate(views):
+        first = first_with_key.setdefault(view.dedup_key, position)
+        if first == position:
+            scored.append(position)
+        else:
+            clusters.union(first, position)
+
+    identities = [views[position].identity for position in scored]
+    venues = [views[position].venue for position in scored]
+    source_ids = _value_ids([events[position].source for position in scored])
+    times = [events[position].date.time() for position in scored]
+    time_ids = _value_ids(times)
+    midnight = np.array([value == datetime.min.time() for value in times])
+    count = len(scored)
+
+    # (score, i, j) for every matching pair i < j, strongest first.
+    edges: list[tuple[float, int, int]] = []
+    # Rows are scored in chunks, so festival days do not need the whole
+    # square matrix in memory at once.
+    for start in range(0, count, SIMILARITY_ROW_CHUNK):
+        stop = min(start + SIMILARITY_ROW_CHUNK, count)
+        rows = slice(start, stop)
+        identity_ratio = process.cdist(
+            identities[rows],
+            identities,
+            scorer=fuzz.ratio,
+            dtype=np.float64,
+            workers=workers,
+        )
+        # Identical venues score 100, so canonical matches pass this too.
+        venue_ratio = process.cdist(
+            venues[rows],
+            venues,
+            scorer=fuzz.ratio,
+            dtype=np.float64,
+            workers=workers,
+        )
+        # Same source: the exact time must match. Across sources a
+        # date-only (midnight) listing matches any time that day.
+        same_time = time_ids[rows, None] == time_ids[None, :]
+        same_source = source_ids[rows, None] == source_ids[None, :]
+        date_only = midnight[rows, None] | midnight[None, :]
+        same_occurrence = same_time | (~same_source & date_only)
+        later = np.arange(start, stop)[:, None] < np.arange(count)[None, :]
+        similar = (
+            later
+            & same_occurrence
+            & (identity_ratio > IDENTITY_MATCH_THRESHOLD)
+            & (venue_ratio > VENUE_MATCH_THRESHOLD)
+        )
+        scores = identity_ratio + venue_ratio
+        for row, column in zip(*np.nonzero(similar)):
+            edges.append((
+                float(scores[row, column]),
+                scored[start + int(row)],
+                scored[int(column)],
+            ))
+
+    edges.sort(key=lambda edge: (-edge[0], edge[1], edge[2]))
+    for _, first, second in edges:
+        clusters.union(first, second)
+
+    return [
+        (min(order[member] for member in members), order[representative])
+        for representative, members in clusters.representatives()
+    ]
+
+
+def _canonical_order(event: Event) -> tuple:
+    view = event_view(event)
+    return (
+        event.date,
+        event.source,
+        view.canonical_url,
+        event.title,
+        event.artist or "",
+        event.venue,
+    )
 
-    for event in events:
-        key = normalize_for_dedup(event)
-        if key in seen_keys:
-            continue
 
-        is_duplicate = False
-        event_venue_norm = normalize_venue(event.venue)
-        for existing in deduped:
-            if event.source == existing.source:
-                if event.date != existing.date:
-                    continue
-            else:
-                if event.date.date() != existing.date.date():
-                    continue
-                event_time = event.date.time()
-                existing_time = existing.date.time()
-                midnight = datetime.min.time()
-                if (
-                    event_time != midnight
-                    and existing_time != midnight
-                    and event_time != existing_time
-                ):
-                    continue
-
-            identity_ratio = fuzz.ratio(
-                (event.artist or event.title).lower(),
-                (existing.artist or existing.title).lower(),
-            )
-            existing_venue_norm = normalize_venue(existing.venue)
-
-            # If both resolve to same canonical venue, it's a match
-            if event_venue_norm == existing_venue_norm and identity_ratio > 85:
-                is_duplicate = True
-                break
-
-            # Otherwise fall back to fuzzy venue matching
-            venue_ratio = fuzz.ratio(event_venue_norm, existing_venue_norm)
-            if identity_ratio > 85 and venue_ratio > 80:
-                is_duplicate = True
-                break
-
-        if not is_duplicate:
-            seen_keys.add(key)
-            deduped.append(event)
-
-    return deduped
+class _DuplicateClusters:
+    """Union-find over one day's events that never merges two performances.
+
+    A cluster holds at most one known (non-midnight) time and one time per
+    source, so a date-only listing cannot chain a matinee to an evening show.
+    """
+
+    def __init__(self, events: list[Event]):
+        self.events = events
+        self.parent = list(range(len(events)))
+        self.known_time: list[time | None] = [
+            None if event.date.time() == datetime.min.time() else event.date.time()
+            for event in events
+        ]
+        self.source_times: list[dict[str, time]] = [
+            {event.source: event.date.time()} for event in events
+        ]
+
+    def find(self, index: int) -> int:
+        root = index
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while self.parent[index] != root:
+            self.parent[index], index = root, self.parent[index]
+        return root
+
+    def union(self, first: int, second: int) -> bool:
+        """Merge two events' clusters unless that would join performances."""
+        first, second = self.find(first), self.find(second)
+        if first == second:
+            return True
+
+        first_time, second_time = self.known_time[first], self.known_time[second]
+        if first_time and second_time and first_time != second_time:
+            return False
+        first_sources = self.source_times[first]
+        second_sources = self.source_times[second]
+        if any(
+            first_sources[source] != source_time
+            for source, source_time in second_sources.items()
+            if source in first_sources
+        ):
+            return False
+
+        if len(first_sources) < len(second_sources):
+            first, second = second, first
+        self.parent[second] = first
+        self.known_time[first] = first_time or second_time
+        self.source_times[first].update(self.source_times[second])
+        return True
+
+    def representatives(self) -> list[tuple[int, list[int]]]:
+        """Each cluster's best event and its members.
+
+        The best event has the highest source_priority, then a known time;
+        remaining ties go to the earliest in canonical order.
+        """
+        members: dict[int, list[int]] = {}
+        for index in range(len(self.events)):
+            members.setdefault(self.find(index), []).append(index)
+        return [
+            (max(cluster, key=lambda index: (*self._rank(index), -index)), cluster)
+            for cluster in members.values()
+        ]
+
+    def _rank(self, index: int) -> tuple[int, bool]:
+        event = self.events[index]
+        return source_priority(event), event.date.time() != datetime.min.time()
+
+
+def _value_ids(values: list) -> np.ndarray:
+    """Small integer ids such that equal values share an id."""
+    ids: dict = {}
+    return np.array([ids.setdefault(value, len(ids)) for value in values])
 
 
 def llm_dedup(events: list[Event]) -> list[Event]:
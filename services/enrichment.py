@@ -6,14 +6,24 @@ Falls back to Gemini AI for generating descriptions when none found.
 
 import json
 import os
+import queue
 import re
+import threading
 from dataclasses import replace
+from datetime import datetime
 
 from bs4 import BeautifulSoup
 from google import genai
 
 from models import Event
-from services.http import fetch_page, HttpError
+from services.http import close_browser_pool, fetch_page, HttpError
+from services.normalization import event_view
+
+# Synopses and posters rarely change, so a cached render is reused for a week.
+DETAIL_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+DEFAULT_ENRICHMENT_WORKERS = 2
+# Events waiting for an enrichment worker; scrapers block once it is full.
+ENRICHMENT_QUEUE_SIZE = 64
 
 
 def extract_bulandra(soup: BeautifulSoup, url: str) -> dict:
@@ -535,7 +545,14 @@ def scrape_event_details(event: Event) -> dict:
     
     try:
         # Most theatre sites need JS rendering
-        html = fetch_page(event.url, needs_js=True, timeout=15000)
+        html = fetch_page(
+            event.url,
+            needs_js=True,
+            timeout=15000,
+            cache_ttl=DETAIL_CACHE_TTL_SECONDS,
+            # Enrichment is optional; it must not get a host's scrapers skipped.
+            trip_circuit=False,
+        )
     except HttpError as e:
         print(f"  Failed to fetch {event.url}: {e}")
         return {"description": None, "image_url": None, "video_url": None}
@@ -584,8 +601,12 @@ Răspunde DOAR cu descrierea, fără prefixe sau explicații."""
         return None
 
 
-def enrich_event(event: Event) -> Event:
-    """Enrich a single event with description, image, and video."""
+def enrich_event(event: Event, details: dict | None = None) -> Event:
+    """Enrich a single event with description, image, and video.
+
+    ``details`` are the event's scrape_event_details when they were already
+    fetched (see EnrichmentPool); otherwise the detail page is fetched here.
+    """
     # Skip music events
     if event.category == "music":
         return event
@@ -595,7 +616,8 @@ def enrich_event(event: Event) -> Event:
         return event
     
     # Try to scrape from source page
-    details = scrape_event_details(event)
+    if details is None:
+        details = scrape_event_details(event)
     
     description = details.get("description")
     description_source = "scraped" if description else None
@@ -619,9 +641,113 @@ def enrich_event(event: Event) -> Event:
     )
 
 
-def enrich_events(events: list[Event]) -> list[Event]:
-    """Enrich all theatre/culture events with additional details."""
+def needs_enrichment(event: Event) -> bool:
+    return event.category in ("theatre", "culture") and not (
+        event.description or event.image_url or event.video_url
+    )
+
+
+EnrichmentKey = tuple[datetime, str]
+
+
+def enrichment_key(event: Event) -> EnrichmentKey:
+    """Identify an event as cross-source dedup does: by date and canonical URL.
+
+    The pool runs before dedup, so listings of one performance from several
+    sources share a key and their detail page is fetched only once.
+    """
+    canonical_url = event_view(event).canonical_url
+    return (event.date, canonical_url or f"{event.source}|{event.title}")
+
+
+class EnrichmentPool:
+    """Fetch theatre/culture detail pages on worker threads while scrapers run.
+
+    Scrapers submit their events as they finish; submit blocks while the
+    queue is full, so enrichment applies backpressure instead of buffering
+    a whole run. finish() waits for the stragglers and returns the
+    scrape_event_details by enrichment_key, for enrich_events to reuse.
+    Only pages are fetched here: the AI fallback waits for dedup, so it
+    never runs for a listing that dedup drops.
+    """
+
+    def __init__(
+        self,
+        workers: int = DEFAULT_ENRICHMENT_WORKERS,
+        maxsize: int = ENRICHMENT_QUEUE_SIZE,
+    ):
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self._pending: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._results: dict[EnrichmentKey, dict] = {}
+        self._submitted: set[EnrichmentKey] = set()
+        self._lock = threading.Lock()
+        self._cancelled = threading.Event()
+        self._threads = [
+            threading.Thread(target=self._work, name=f"enrichment-worker-{number}")
+            for number in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, events: list[Event]) -> None:
+        """Queue the events that still need enrichment; safe from any thread."""
+        for event in events:
+            if not needs_enrichment(event):
+                continue
+            key = enrichment_key(event)
+            with self._lock:
+                if key in self._submitted:
+                    continue
+                self._submitted.add(key)
+            self._pending.put(event)
+
+    def finish(self) -> dict[EnrichmentKey, dict]:
+        """Wait for every queued event and return the details fetched."""
+        self._stop()
+        return dict(self._results)
+
+    def cancel(self) -> None:
+        """Drop queued events and stop the workers after their current one."""
+        self._cancelled.set()
+        self._stop()
+
+    def _stop(self) -> None:
+        if not any(thread.is_alive() for thread in self._threads):
+            return
+        for _ in self._threads:
+            self._pending.put(None)
+        for thread in self._threads:
+            thread.join()
+
+    def _work(self) -> None:
+        try:
+            while (event := self._pending.get()) is not None:
+                if self._cancelled.is_set():
+                    continue
+                try:
+                    details = scrape_event_details(event)
+                except Exception as e:
+                    print(f"  Enrichment failed for {event.title}: {e}")
+                    continue
+                with self._lock:
+                    self._results[enrichment_key(event)] = details
+        finally:
+            # Sync Playwright is bound to the thread that started it.
+            close_browser_pool()
+
+
+def enrich_events(
+    events: list[Event],
+    prefetched: dict[EnrichmentKey, dict] | None = None,
+) -> list[Event]:
+    """Enrich all theatre/culture events with additional details.
+
+    Detail pages an EnrichmentPool fetched during scraping are taken from
+    ``prefetched`` instead of being fetched again.
+    """
     enriched: list[Event] = []
+    prefetched = prefetched or {}
     
     theatre_culture = [e for e in events if e.category in ("theatre", "culture")]
     total = len(theatre_culture)
@@ -629,7 +755,7 @@ def enrich_events(events: list[Event]) -> list[Event]:
     for i, event in enumerate(events):
         if event.category in ("theatre", "culture"):
             print(f"  [{i+1}/{total}] Enriching: {event.title[:40]}...", end=" ", flush=True)
-            enriched_event = enrich_event(event)
+            enriched_event = enrich_event(event, prefetched.get(enrichment_key(event)))
             status = "✓" if enriched_event.description or enriched_event.image_url else "○"
             print(status)
             enriched.append(enriched_event)
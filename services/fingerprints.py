@@ -0,0 +1,75 @@
+"""Listing-page fingerprints for skipping scrapers whose source is unchanged.
+
+A scraper opts in by defining ``FINGERPRINT_SELECTOR``: the CSS selector of
+the part of its listing page that holds the programme. The text under that
+selector is hashed; when the hash matches the one stored after the last
+successful run, that run's events can be reused instead of scraping again.
+"""
+
+import hashlib
+import json
+import re
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+# Even unchanged listings are re-scraped this often, so details that live
+# outside the fingerprinted markup (detail pages, prices) cannot go stale.
+MAX_FINGERPRINT_AGE_DAYS = 7
+
+
+def listing_fingerprint(html: str, selector: str) -> str | None:
+    """Hash the whitespace-normalised text under ``selector``.
+
+    Returns None when nothing matches, since an empty programme is more
+    likely a layout change than an unchanged page.
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    parts = [element.get_text(" ", strip=True) for element in soup.select(selector)]
+    if not parts:
+        return None
+    text = re.sub(r"\s+", " ", "\n".join(parts)).strip()
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def load_fingerprints(path: Path) -> dict[str, dict]:
+    """Return stored fingerprints keyed by scraper key."""
+    if not path.exists():
+        return {}
+    with open(path) as f:
+        return json.load(f).get("scrapers", {})
+
+
+def save_fingerprints(path: Path, fingerprints: dict[str, dict]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(
+            {
+                "updated_at": datetime.now().isoformat(),
+                "scrapers": dict(sorted(fingerprints.items())),
+            },
+            f,
+            indent=2,
+        )
+
+
+def fingerprint_entry(fingerprint: str, sources: set[str]) -> dict:
+    """What is stored for a scraper after a successful run."""
+    return {
+        "fingerprint": fingerprint,
+        "sources": sorted(sources),
+        "recorded_at": datetime.now().isoformat(),
+    }
+
+
+def is_unchanged(entry: dict | None, fingerprint: str, now: datetime | None = None) -> bool:
+    """Whether a stored entry matches ``fingerprint`` and is recent enough."""
+    if not entry or entry.get("fingerprint") != fingerprint:
+        return False
+    try:
+        recorded_at = datetime.fromisoformat(entry["recorded_at"])
+    except (KeyError, TypeError, ValueError):
+        return False
+    reference = now or datetime.now()
+    return reference - recorded_at < timedelta(days=MAX_FINGERPRINT_AGE_DAYS)
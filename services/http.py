@@ -1,4 +1,23 @@
+import asyncio
+import json
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager, nullcontext
+from contextvars import ContextVar, copy_context
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from fnmatch import fnmatch
+from importlib.util import find_spec
+from pathlib import Path
+from typing import AsyncIterator, Generator, Iterable, Iterator
+from urllib.parse import urlsplit
+from weakref import WeakKeyDictionary
+
 import httpx
+from playwright.async_api import async_playwright
 from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
 from tenacity import (
     retry,
@@ -7,33 +26,501 @@ from tenacity import (
     retry_if_exception,
 )
 
+from services.http_archive import (
+    ArchiveTransport,
+    AsyncArchiveTransport,
+    HttpArchive,
+)
+from services.http_cache import DEFAULT_MAX_BYTES, ResponseCache, cache_key
+
 RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
 MAX_RETRIES = 3
 HTML_READER_BASE_URL = "https://r.jina.ai/"
 HTML_READER_HEADERS = {"X-Return-Format": "html"}
-_fetch_failures: list[str] = []
+HTTP_TIMEOUT_SECONDS = 30.0
+HTTP_POOL_LIMITS = httpx.Limits(
+    max_connections=10,
+    max_keepalive_connections=5,
+    keepalive_expiry=30.0,
+)
+# HTTP/2 needs the optional ``h2`` package (``pip install httpx[http2]``).
+HTTP2_ENABLED = find_spec("h2") is not None
+# Cached bodies are revalidated with ETag/Last-Modified unless a caller opts
+# into serving them unchecked for a number of seconds.
+CACHE_DEFAULT_TTL_SECONDS = 0.0
+BROWSER_TIMEZONE = "Europe/Bucharest"
+BROWSER_MAX_PAGES = 4
+BROWSER_CONTEXT_MAX_NAVIGATIONS = 25
+DEFAULT_FETCH_CONCURRENCY = 8
+# Rendered pages settle on network idle; "load more" rounds end as soon as the
+# DOM grows, with a timeout that adapts to how fast the site responds and
+# doubles after every round without growth.
+JS_SETTLE_TIMEOUT_MS = 3000
+JS_INTERACTION_BUDGET_MS = 90000
+GROWTH_INITIAL_TIMEOUT_MS = 2500
+GROWTH_MIN_TIMEOUT_MS = 750
+GROWTH_MAX_TIMEOUT_MS = 5000
+IDLE_ROUNDS_TO_STOP = 3
+# Scrapers only read page.content(), so these never affect what we parse.
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+BLOCKED_TRACKER_DOMAINS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googlesyndication.com",
+    "doubleclick.net",
+    "facebook.net",
+    "hotjar.com",
+    "clarity.ms",
+    "tiktok.com",
+    "hs-analytics.net",
+    "cookiebot.com",
+)
+RETRY_AFTER_STATUS_CODES = {429, 503}
+MAX_RETRY_AFTER_SECONDS = 60.0
+IN_FLIGHT_POLL_SECONDS = 0.05
+CIRCUIT_FAILURE_THRESHOLD = 4
+
+
+@dataclass
+class FetchContext:
+    """Fetch activity attributed to one scraper run.
+
+    Request counters cover every network attempt, including retries;
+    replayed rendered pages are not counted. ``cache_hits`` counts bodies
+    served from the response cache (fresh or revalidated with a 304), and
+    ``reader_fallbacks`` pages requested through HTML_READER_BASE_URL, and
+    ``circuit_skips`` fetches refused because the host's circuit was open.
+    ``cache_ttl`` is the owning scraper's default for fetch_page(cache_ttl=).
+    """
+
+    name: str | None = None
+    cache_ttl: float | None = None
+    deadline: float | None = None
+    time_budget: float | None = None
+    budget_exhausted: bool = False
+    failures: list[str] = field(default_factory=list)
+    http_requests: int = 0
+    rendered_pages: int = 0
+    bytes_received: int = 0
+    fetch_seconds: float = 0.0
+    retries: int = 0
+    reader_fallbacks: int = 0
+    cache_hits: int = 0
+    circuit_skips: int = 0
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock,
+        repr=False,
+        compare=False,
+    )
+
+    def record_request(self, kind: str, seconds: float, size: int) -> None:
+        with self._lock:
+            if kind == "rendered":
+                self.rendered_pages += 1
+            else:
+                self.http_requests += 1
+            self.bytes_received += size
+            self.fetch_seconds += seconds
+
+    def record_failure(self, message: str) -> None:
+        with self._lock:
+            self.failures.append(message)
+
+    def count(self, counter: str) -> None:
+        """Add one to a counter such as ``retries``."""
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def remaining_seconds(self) -> float | None:
+        """Seconds left before the deadline, or None without a time budget."""
+        if self.deadline is None:
+            return None
+        return self.deadline - time.monotonic()
+
+    def out_of_time(self) -> bool:
+        remaining = self.remaining_seconds()
+        return remaining is not None and remaining <= 0
+
+
+# Context-local so concurrent scrapers (threads or asyncio tasks) each see
+# their own fetches; asyncio tasks inherit the context of their scraper.
+_fetch_context: ContextVar[FetchContext | None] = ContextVar(
+    "fetch_context",
+    default=None,
+)
+
+
+def current_fetch_context() -> FetchContext:
+    """Return the fetch context of the running scraper, creating one if unset."""
+    context = _fetch_context.get()
+    if context is None:
+        context = FetchContext()
+        _fetch_context.set(context)
+    return context
+
+
+@contextmanager
+def fetch_context(
+    name: str | None = None,
+    time_budget: float | None = None,
+    cache_ttl: float | None = None,
+) -> Iterator[FetchContext]:
+    """Attribute every fetch made inside the block to a fresh context.
+
+    With ``time_budget`` (seconds), fetches made after the budget has run out
+    fail immediately and earlier ones have their timeouts cut to fit it.
+    ``cache_ttl`` replaces CACHE_DEFAULT_TTL_SECONDS for fetches inside the
+    block that do not pass their own.
+    """
+    context = FetchContext(
+        name=name,
+        cache_ttl=cache_ttl,
+        deadline=None if time_budget is None else time.monotonic() + time_budget,
+        time_budget=time_budget,
+    )
+    token = _fetch_context.set(context)
+    try:
+        yield context
+    finally:
+        _fetch_context.reset(token)
 
 
 def reset_fetch_failures() -> None:
-    """Clear request failures before starting one scraper."""
-    _fetch_failures.clear()
+    """Start a fresh fetch context for the current scraper run."""
+    _fetch_context.set(FetchContext())
 
 
 def get_fetch_failures() -> list[str]:
     """Return request failures recorded during the current scraper run."""
-    return list(_fetch_failures)
+    return list(current_fetch_context().failures)
 
 
 def _record_fetch_failure(message: str) -> None:
-    _fetch_failures.append(message)
+    current_fetch_context().record_failure(message)
+
+
+def _guard_deadline(url: str) -> None:
+    """Fail fast once the running scraper has used up its time budget."""
+    context = current_fetch_context()
+    if not context.out_of_time():
+        return
+    context.budget_exhausted = True
+    raise HttpError(
+        f"Time budget of {context.time_budget:g}s exhausted; skipped {url}"
+    )
+
+
+def _clamp_timeout_ms(timeout_ms: int) -> int:
+    """Shorten a Playwright timeout so it cannot outlast the time budget."""
+    remaining = current_fetch_context().remaining_seconds()
+    if remaining is None:
+        return timeout_ms
+    return max(1, min(timeout_ms, int(remaining * 1000)))
+
+
+def _request_timeout() -> float:
+    """Per-request httpx timeout, capped by the remaining time budget."""
+    remaining = current_fetch_context().remaining_seconds()
+    if remaining is None:
+        return HTTP_TIMEOUT_SECONDS
+    return max(0.001, min(HTTP_TIMEOUT_SECONDS, remaining))
+
+
+def _count_retry(retry_state) -> None:
+    current_fetch_context().count("retries")
+
+
+def _stop_at_deadline(retry_state) -> bool:
+    """Stop retrying when the next backoff would outlast the time budget."""
+    remaining = current_fetch_context().remaining_seconds()
+    return remaining is not None and remaining <= (retry_state.upcoming_sleep or 0)
+
+
+class _RequestTally:
+    """Time one network attempt and charge it to the current fetch context."""
+
+    def __init__(self, kind: str):
+        self.kind = kind
+        self.size = 0
+
+    def __enter__(self) -> "_RequestTally":
+        self.started = time.monotonic()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        current_fetch_context().record_request(
+            self.kind,
+            time.monotonic() - self.started,
+            self.size,
+        )
+
+    async def __aenter__(self) -> "_RequestTally":
+        return self.__enter__()
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.__exit__(*exc_info)
 
 
 class HttpError(Exception):
     """HTTP request failed after retries."""
 
-    def __init__(self, message: str, status_code: int | None = None):
+    def __init__(
+        self,
+        message: str,
+        status_code: int | None = None,
+        retry_after: float | None = None,
+    ):
         super().__init__(message)
         self.status_code = status_code
+        self.retry_after = retry_after
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Politeness budget for one host: a token bucket plus an in-flight cap.
+
+    Scraper modules can declare ``RATE_LIMIT = RateLimit(...)`` next to
+    ``EVENTS_URL``; it then applies to that URL's host.
+    """
+
+    requests_per_second: float
+    burst: int = 1
+    max_in_flight: int = 4
+
+
+DEFAULT_RATE_LIMIT = RateLimit(requests_per_second=5.0, burst=5, max_in_flight=6)
+# The reader proxy is shared by every scraper's fallback path.
+HOST_RATE_LIMITS = {
+    "r.jina.ai": RateLimit(requests_per_second=0.3, burst=3, max_in_flight=2),
+}
+
+
+class HostLimiter:
+    """Token bucket and max-in-flight governor for requests to one host."""
+
+    def __init__(self, limit: RateLimit, clock=time.monotonic):
+        self.limit = limit
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = float(limit.burst)
+        self._updated = clock()
+        self._blocked_until = 0.0
+        self._in_flight = 0
+
+    def try_acquire(self) -> float:
+        """Take a slot and return 0, or return the seconds to wait first."""
+        with self._lock:
+            now = self._clock()
+            if now < self._blocked_until:
+                return self._blocked_until - now
+            if self._in_flight >= self.limit.max_in_flight:
+                return IN_FLIGHT_POLL_SECONDS
+            self._tokens = min(
+                float(self.limit.burst),
+                self._tokens + (now - self._updated) * self.limit.requests_per_second,
+            )
+            self._updated = now
+            if self._tokens < 1:
+                return (1 - self._tokens) / self.limit.requests_per_second
+            self._tokens -= 1
+            self._in_flight += 1
+            return 0.0
+
+    def release(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    def defer(self, seconds: float) -> None:
+        """Hold every request to this host back, e.g. for a Retry-After."""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, self._clock() + seconds)
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        while (delay := self.try_acquire()) > 0:
+            time.sleep(delay)
+        try:
+            yield
+        finally:
+            self.release()
+
+    @asynccontextmanager
+    async def aslot(self) -> AsyncIterator[None]:
+        while (delay := self.try_acquire()) > 0:
+            await asyncio.sleep(delay)
+        try:
+            yield
+        finally:
+            self.release()
+
+
+_rate_limits: dict[str, RateLimit] = dict(HOST_RATE_LIMITS)
+_host_limiters: dict[str, HostLimiter] = {}
+_host_limiters_lock = threading.Lock()
+
+
+def _hostname(url: str) -> str:
+    hostname = urlsplit(url).hostname if "://" in url else url
+    return (hostname or "").casefold().removeprefix("www.")
+
+
+def set_rate_limit(url: str, limit: RateLimit) -> None:
+    """Apply a rate limit to the host of ``url`` (a URL or bare hostname)."""
+    host = _hostname(url)
+    with _host_limiters_lock:
+        _rate_limits[host] = limit
+        limiter = _host_limiters.get(host)
+        if limiter is not None:
+            limiter.limit = limit
+
+
+def get_host_limiter(url: str) -> HostLimiter:
+    """Return the shared limiter governing requests to the URL's host."""
+    host = _hostname(url)
+    with _host_limiters_lock:
+        limiter = _host_limiters.get(host)
+        if limiter is None:
+            limiter = HostLimiter(_rate_limits.get(host, DEFAULT_RATE_LIMIT))
+            _host_limiters[host] = limiter
+        return limiter
+
+
+def reset_rate_limits() -> None:
+    """Forget per-source overrides and limiter state."""
+    with _host_limiters_lock:
+        _rate_limits.clear()
+        _rate_limits.update(HOST_RATE_LIMITS)
+        _host_limiters.clear()
+
+
+def _parse_retry_after(value: object) -> float | None:
+    """Read a Retry-After header given in seconds or as an HTTP date."""
+    if not isinstance(value, str) or not value.strip():
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        seconds = (when - datetime.now(timezone.utc)).total_seconds()
+    return max(0.0, min(seconds, MAX_RETRY_AFTER_SECONDS))
+
+
+def _retry_after_for(e: BaseException | None) -> float | None:
+    if isinstance(e, httpx.HTTPStatusError):
+        if e.response.status_code in RETRY_AFTER_STATUS_CODES:
+            return _parse_retry_after(e.response.headers.get("Retry-After"))
+        return None
+    if isinstance(e, HttpError):
+        return e.retry_after
+    return None
+
+
+_backoff = wait_exponential(multiplier=1, min=1, max=10)
+
+
+def _wait_before_retry(retry_state) -> float:
+    """Honor the server's Retry-After, falling back to exponential backoff."""
+    outcome = retry_state.outcome
+    retry_after = _retry_after_for(outcome.exception() if outcome else None)
+    if retry_after is not None:
+        return retry_after
+    return _backoff(retry_state)
+
+
+_http_clients: dict[str, httpx.Client] = {}
+_http_clients_lock = threading.Lock()
+
+
+def _host_key(url: str) -> str:
+    parsed = urlsplit(url)
+    return f"{parsed.scheme.lower()}://{parsed.netloc.lower()}"
+
+
+def get_http_client(url: str) -> httpx.Client:
+    """Return the shared keep-alive client for the URL's scheme and host."""
+    key = _host_key(url)
+    with _http_clients_lock:
+        client = _http_clients.get(key)
+        if client is None or client.is_closed:
+            client = httpx.Client(
+                http2=HTTP2_ENABLED,
+                limits=HTTP_POOL_LIMITS,
+                timeout=HTTP_TIMEOUT_SECONDS,
+                follow_redirects=True,
+                transport=_archive_transport(),
+            )
+            _http_clients[key] = client
+        return client
+
+
+_archive: HttpArchive | None = None
+
+
+def enable_http_archive(path: Path, replay: bool = False) -> HttpArchive:
+    """Record every response into ``path``, or replay a run from it offline.
+
+    Pooled clients are rebuilt so that all httpx traffic goes through the
+    archive; rendered pages are archived by the Playwright fetchers.
+    """
+    global _archive
+    disable_http_archive()
+    close_http_clients()
+    _archive = HttpArchive.replay(path) if replay else HttpArchive.record(path)
+    return _archive
+
+
+def disable_http_archive() -> None:
+    """Write out a recording (if any) and go back to the live network."""
+    global _archive
+    archive, _archive = _archive, None
+    if archive is not None:
+        close_http_clients()
+        archive.save()
+
+
+def _replaying() -> bool:
+    return _archive is not None and _archive.replaying
+
+
+def _archive_transport() -> httpx.BaseTransport | None:
+    if _archive is None:
+        return None
+    return ArchiveTransport(
+        _archive,
+        httpx.HTTPTransport(http2=HTTP2_ENABLED, limits=HTTP_POOL_LIMITS),
+    )
+
+
+def _async_archive_transport() -> httpx.AsyncBaseTransport | None:
+    if _archive is None:
+        return None
+    return AsyncArchiveTransport(
+        _archive,
+        httpx.AsyncHTTPTransport(http2=HTTP2_ENABLED, limits=HTTP_POOL_LIMITS),
+    )
+
+
+def _host_slot(url: str):
+    # Replayed runs never touch the origin, so they skip its rate limit.
+    return nullcontext() if _replaying() else get_host_limiter(url).slot()
+
+
+def _ahost_slot(url: str):
+    return nullcontext() if _replaying() else get_host_limiter(url).aslot()
+
+
+def close_http_clients() -> None:
+    """Close every pooled HTTP client and drop its idle connections."""
+    with _http_clients_lock:
+        clients = list(_http_clients.values())
+        _http_clients.clear()
+    for client in clients:
+        client.close()
 
 
 def _is_retryable_httpx(e: BaseException) -> bool:
@@ -52,31 +539,499 @@ def _is_retryable_playwright(e: BaseException) -> bool:
     )
 
 
+def _defer_host_for_retry_after(url: str, status_code: int, headers) -> None:
+    if status_code not in RETRY_AFTER_STATUS_CODES:
+        return
+    retry_after = _parse_retry_after(headers.get("Retry-After"))
+    if retry_after:
+        get_host_limiter(url).defer(retry_after)
+
+
+def _rendered_status_error(url: str, status: int, response) -> HttpError:
+    """Build the HttpError for a rendered page, keeping any Retry-After."""
+    retry_after = None
+    if status in RETRY_AFTER_STATUS_CODES:
+        headers = getattr(response, "headers", None)
+        if isinstance(headers, dict):
+            retry_after = _parse_retry_after(headers.get("retry-after"))
+            if retry_after:
+                get_host_limiter(url).defer(retry_after)
+    return HttpError(
+        f"HTTP {status} for {url}",
+        status_code=status,
+        retry_after=retry_after,
+    )
+
+
 @retry(
-    stop=stop_after_attempt(MAX_RETRIES),
-    wait=wait_exponential(multiplier=1, min=1, max=10),
+    stop=stop_after_attempt(MAX_RETRIES) | _stop_at_deadline,
+    wait=_wait_before_retry,
+    before_sleep=_count_retry,
     retry=retry_if_exception(_is_retryable_httpx),
     reraise=True,
 )
-def _fetch_http(url: str, headers: dict[str, str] | None = None) -> str:
-    """Fetch page via HTTP with retry."""
-    response = httpx.get(
-        url,
-        headers=headers,
-        follow_redirects=True,
-        timeout=30.0,
+def _fetch_http(
+    url: str,
+    headers: dict[str, str] | None = None,
+) -> httpx.Response:
+    """Fetch page via HTTP with retry; 304 is returned for revalidation."""
+    with _host_slot(url), _RequestTally("http") as tally:
+        response = get_http_client(url).get(
+            url,
+            headers=headers,
+            timeout=_request_timeout(),
+        )
+        tally.size = len(response.content)
+    _defer_host_for_retry_after(url, response.status_code, response.headers)
+    if response.status_code != 304:
+        response.raise_for_status()
+    return response
+
+
+_response_cache: ResponseCache | None = None
+
+
+def enable_response_cache(
+    directory: Path,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+) -> ResponseCache:
+    """Serve fetch_page from an on-disk cache stored under ``directory``."""
+    global _response_cache
+    disable_response_cache()
+    _response_cache = ResponseCache(directory, max_bytes=max_bytes)
+    return _response_cache
+
+
+def disable_response_cache() -> None:
+    """Close the response cache; later fetches always hit the network."""
+    global _response_cache
+    if _response_cache is not None:
+        _response_cache.close()
+        _response_cache = None
+
+
+class _PooledContext:
+    """Browser context plus the number of navigations it has served."""
+
+    def __init__(self, context, key: tuple[tuple[str, str], ...]):
+        self.context = context
+        self.key = key
+        self.navigations = 0
+
+
+class BrowserPool:
+    """Long-lived Chromium instance that lends pages from reusable contexts.
+
+    Contexts are keyed by their extra HTTP headers and recycled after
+    ``max_navigations`` page loads so cookies and caches cannot grow unbounded.
+    The sync Playwright API is bound to the thread that started it, so a pool
+    must only be used from the thread that created it.
+    """
+
+    def __init__(
+        self,
+        max_pages: int = BROWSER_MAX_PAGES,
+        max_navigations: int = BROWSER_CONTEXT_MAX_NAVIGATIONS,
+    ):
+        if max_pages < 1:
+            raise ValueError("max_pages must be at least 1")
+        if max_navigations < 1:
+            raise ValueError("max_navigations must be at least 1")
+        self.max_pages = max_pages
+        self.max_navigations = max_navigations
+        self._playwright = None
+        self._browser = None
+        self._idle_contexts: list[_PooledContext] = []
+        self._open_pages = 0
+
+    def _ensure_browser(self):
+        if self._browser is not None and self._browser.is_connected():
+            return self._browser
+        if self._playwright is None:
+            self._playwright = sync_playwright().start()
+        self._browser = self._playwright.chromium.launch()
+        self._idle_contexts.clear()
+        return self._browser
+
+    def _borrow_context(self, headers: dict[str, str] | None) -> _PooledContext:
+        key = tuple(sorted((headers or {}).items()))
+        for index, pooled in enumerate(self._idle_contexts):
+            if pooled.key == key:
+                return self._idle_contexts.pop(index)
+
+        browser = self._ensure_browser()
+        options: dict = {"timezone_id": BROWSER_TIMEZONE}
+        if headers:
+            options["extra_http_headers"] = headers
+        return _PooledContext(browser.new_context(**options), key)
+
+    def _return_context(self, pooled: _PooledContext, healthy: bool) -> None:
+        pooled.navigations += 1
+        if (
+            not healthy
+            or pooled.navigations >= self.max_navigations
+            or len(self._idle_contexts) >= self.max_pages
+        ):
+            _close_quietly(pooled.context)
+            return
+        self._idle_contexts.append(pooled)
+
+    @contextmanager
+    def page(self, headers: dict[str, str] | None = None) -> Iterator:
+        """Borrow a fresh page; its context returns to the pool afterwards."""
+        if self._open_pages >= self.max_pages:
+            raise HttpError(
+                f"Browser pool exhausted ({self.max_pages} open pages)"
+            )
+        pooled = self._borrow_context(headers)
+        self._open_pages += 1
+        page = None
+        healthy = False
+        try:
+            page = pooled.context.new_page()
+            yield page
+            healthy = True
+        finally:
+            self._open_pages -= 1
+            if page is not None:
+                _close_quietly(page)
+            self._return_context(pooled, healthy)
+
+    def close(self) -> None:
+        """Close every pooled context, the browser and the Playwright driver."""
+        for pooled in self._idle_contexts:
+            _close_quietly(pooled.context)
+        self._idle_contexts.clear()
+        if self._browser is not None:
+            _close_quietly(self._browser)
+            self._browser = None
+        if self._playwright is not None:
+            try:
+                self._playwright.stop()
+            except Exception:
+                pass
+            self._playwright = None
+
+
+def _close_quietly(resource) -> None:
+    try:
+        resource.close()
+    except Exception:
+        pass
+
+
+_browser_state = threading.local()
+
+
+def get_browser_pool() -> BrowserPool:
+    """Return this thread's browser pool, starting it on first use."""
+    pool = getattr(_browser_state, "pool", None)
+    if pool is None:
+        pool = _browser_state.pool = BrowserPool()
+    return pool
+
+
+def close_browser_pool() -> None:
+    """Shut down this thread's browser; the next JS fetch starts a new one.
+
+    Worker threads that rendered pages must call this before they exit.
+    """
+    pool = getattr(_browser_state, "pool", None)
+    if pool is not None:
+        _browser_state.pool = None
+        pool.close()
+
+
+_SCROLL_JS = "window.scrollTo(0, document.body.scrollHeight)"
+_PROGRESS_JS = """
+(selector) => selector
+    ? document.querySelectorAll(selector).length
+    : document.getElementsByTagName("*").length
+"""
+# Resolves as soon as a DOM mutation grows the page past ``previous`` items
+# (or elements, without a selector), or with false once ``timeoutMs`` passes.
+_GROWTH_JS = """
+([selector, previous, timeoutMs]) => new Promise((resolve) => {
+    const count = () => selector
+        ? document.querySelectorAll(selector).length
+        : document.getElementsByTagName("*").length;
+    if (count() > previous) {
+        resolve(true);
+        return;
+    }
+    const observer = new MutationObserver(() => {
+        if (count() > previous) {
+            observer.disconnect();
+            clearTimeout(timer);
+            resolve(true);
+        }
+    });
+    const timer = setTimeout(() => {
+        observer.disconnect();
+        resolve(count() > previous);
+    }, timeoutMs);
+    observer.observe(document.documentElement, { childList: true, subtree: true });
+})
+"""
+
+
+class _GrowthWaiter:
+    """Adaptive timeout and time budget for "load more" interactions."""
+
+    def __init__(self, budget_ms: int):
+        self.deadline = time.monotonic() + budget_ms / 1000
+        self.timeout_ms = GROWTH_INITIAL_TIMEOUT_MS
+        self.idle_rounds = 0
+
+    @property
+    def remaining_ms(self) -> float:
+        return max(0.0, (self.deadline - time.monotonic()) * 1000)
+
+    @property
+    def exhausted(self) -> bool:
+        return self.idle_rounds >= IDLE_ROUNDS_TO_STOP or self.remaining_ms <= 0
+
+    def next_timeout_ms(self) -> int:
+        return int(min(self.timeout_ms, self.remaining_ms))
+
+    def record(self, grew: bool, elapsed_ms: float) -> None:
+        if not grew:
+            # Slow listings may just need longer; wait twice as long next time.
+            self.idle_rounds += 1
+            self.timeout_ms = min(GROWTH_MAX_TIMEOUT_MS, self.timeout_ms * 2)
+            return
+        self.idle_rounds = 0
+        # Give the next round a few times the latency the site just showed.
+        self.timeout_ms = min(
+            GROWTH_MAX_TIMEOUT_MS,
+            max(GROWTH_MIN_TIMEOUT_MS, elapsed_ms * 3),
+        )
+
+
+def _render_steps(
+    page,
+    url: str,
+    timeout: int,
+    wait_selector: str | None,
+    click_selector: str | None,
+    click_count: int,
+    scroll_count: int,
+    scroll_item_selector: str | None,
+    interaction_budget_ms: int,
+) -> Generator:
+    """Load a page, click "load more" and scroll, then return its HTML.
+
+    Shared by the sync and async renderers: every page call is yielded and
+    the driver (_run_render_steps or _arun_render_steps) sends back its
+    result, awaiting it first on an async page, or throws its exception in.
+    """
+    response = yield page.goto(url, timeout=timeout, wait_until="domcontentloaded")
+    status = getattr(response, "status", None)
+    if isinstance(status, int) and status >= 400:
+        raise _rendered_status_error(url, status, response)
+    if wait_selector:
+        yield page.wait_for_selector(wait_selector, timeout=timeout)
+    else:
+        try:
+            yield page.wait_for_load_state("networkidle", timeout=JS_SETTLE_TIMEOUT_MS)
+        except PlaywrightTimeout:
+            pass
+
+    waiter = _GrowthWaiter(interaction_budget_ms)
+
+    def wait_for_growth(before) -> Generator:
+        started = time.monotonic()
+        grew = yield page.evaluate(
+            _GROWTH_JS,
+            [scroll_item_selector, before, waiter.next_timeout_ms()],
+        )
+        waiter.record(bool(grew), (time.monotonic() - started) * 1000)
+
+    if click_selector and click_count > 0:
+        for _ in range(click_count):
+            if waiter.exhausted:
+                break
+            try:
+                button = page.locator(click_selector).first
+                if not (yield button.is_visible()):
+                    break
+                before = yield page.evaluate(_PROGRESS_JS, scroll_item_selector)
+                yield button.click()
+            except Exception:
+                break
+            yield from wait_for_growth(before)
+
+    if scroll_count > 0:
+        waiter.idle_rounds = 0
+        for _ in range(scroll_count):
+            if waiter.exhausted:
+                break
+            before = yield page.evaluate(_PROGRESS_JS, scroll_item_selector)
+            yield page.evaluate(_SCROLL_JS)
+            yield from wait_for_growth(before)
+
+    return (yield page.content())
+
+
+def _run_render_steps(steps: Generator) -> str:
+    # Sync page calls have already run by the time they are yielded.
+    result = None
+    while True:
+        try:
+            result = steps.send(result)
+        except StopIteration as stop:
+            return stop.value
+
+
+async def _arun_render_steps(steps: Generator) -> str:
+    result = None
+    error: Exception | None = None
+    while True:
+        try:
+            awaitable = steps.throw(error) if error is not None else steps.send(result)
+        except StopIteration as stop:
+            return stop.value
+        try:
+            result, error = await awaitable, None
+        except Exception as e:
+            result, error = None, e
+
+
+@dataclass(frozen=True)
+class CapturedResponse:
+    """A network response recorded while rendering a page."""
+
+    url: str
+    status: int
+    body: str
+
+    def json(self):
+        return json.loads(self.body)
+
+
+@dataclass
+class RenderedPage:
+    """Rendered HTML together with the responses captured during navigation."""
+
+    html: str
+    responses: list[CapturedResponse]
+
+    def json_bodies(self) -> list:
+        """Decoded bodies of captured responses that hold JSON, in arrival order."""
+        bodies = []
+        for response in self.responses:
+            try:
+                bodies.append(response.json())
+            except ValueError:
+                continue
+        return bodies
+
+
+def _matches_capture(url: str, capture: tuple[str | re.Pattern, ...]) -> bool:
+    for pattern in capture:
+        if isinstance(pattern, re.Pattern):
+            if pattern.search(url):
+                return True
+        elif fnmatch(url, pattern):
+            return True
+    return False
+
+
+def _read_captured(response) -> CapturedResponse | None:
+    # Redirects and responses evicted by the browser have no body to read.
+    try:
+        body = response.text()
+    except Exception:
+        return None
+    return CapturedResponse(url=response.url, status=response.status, body=body)
+
+
+def _rendered_archive_key(
+    url: str,
+    headers: dict[str, str] | None,
+    wait_selector: str | None,
+    click_selector: str | None,
+    click_count: int,
+    scroll_count: int,
+    scroll_item_selector: str | None,
+    allow_resource_types: frozenset[str],
+    capture: tuple[str | re.Pattern, ...] = (),
+) -> str:
+    render_mode = _render_mode(
+        True,
+        wait_selector,
+        click_selector,
+        click_count,
+        scroll_count,
+        scroll_item_selector,
+        allow_resource_types,
     )
-    response.raise_for_status()
-    return response.text
+    patterns = [getattr(pattern, "pattern", pattern) for pattern in capture]
+    return cache_key(url, headers, json.dumps([render_mode, patterns]))
+
+
+def _record_rendered(key: str, url: str, rendered: RenderedPage) -> None:
+    if _archive is None:
+        return
+    _archive.store(
+        key,
+        {
+            "kind": "rendered",
+            "url": url,
+            "html": rendered.html,
+            "responses": [
+                [response.url, response.status, response.body]
+                for response in rendered.responses
+            ],
+        },
+    )
+
+
+def _replay_rendered(key: str, url: str) -> RenderedPage:
+    entry = _archive.lookup(key, url)
+    return RenderedPage(
+        html=entry["html"],
+        responses=[
+            CapturedResponse(url=response_url, status=status, body=body)
+            for response_url, status, body in entry["responses"]
+        ],
+    )
+
+
+def _is_blocked_request(
+    resource_type: str,
+    url: str,
+    allow_resource_types: frozenset[str],
+) -> bool:
+    """Whether a browser subrequest is dead weight for an HTML scrape."""
+    if (
+        resource_type in BLOCKED_RESOURCE_TYPES
+        and resource_type not in allow_resource_types
+    ):
+        return True
+    host = _hostname(url)
+    return any(
+        host == domain or host.endswith(f".{domain}")
+        for domain in BLOCKED_TRACKER_DOMAINS
+    )
+
+
+def _route_request(route, allow_resource_types: frozenset[str]) -> None:
+    request = route.request
+    if _is_blocked_request(request.resource_type, request.url, allow_resource_types):
+        route.abort()
+    else:
+        route.continue_()
 
 
 @retry(
-    stop=stop_after_attempt(MAX_RETRIES),
-    wait=wait_exponential(multiplier=1, min=1, max=10),
+    stop=stop_after_attempt(MAX_RETRIES) | _stop_at_deadline,
+    wait=_wait_before_retry,
+    before_sleep=_count_retry,
     retry=retry_if_exception(_is_retryable_playwright),
     reraise=True,
 )
-def _fetch_js(
+def _render_js(
     url: str,
     timeout: int,
     headers: dict[str, str] | None = None,
@@ -85,8 +1040,11 @@ def _fetch_js(
     click_count: int = 0,
     scroll_count: int = 0,
     scroll_item_selector: str | None = None,
-) -> str:
-    """Fetch JS-rendered page with retry.
+    allow_resource_types: frozenset[str] = frozenset(),
+    interaction_budget_ms: int = JS_INTERACTION_BUDGET_MS,
+    capture: tuple[str | re.Pattern, ...] = (),
+) -> RenderedPage:
+    """Render a JS page with retry, recording responses that match ``capture``.
     
     Args:
         url: Page URL to fetch
@@ -96,69 +1054,304 @@ def _fetch_js(
         click_count: Number of times to click the button (0 = don't click)
         scroll_count: Number of times to scroll (for infinite scroll pages)
         scroll_item_selector: Optional selector to count items for scroll completion
+        allow_resource_types: Blocked resource types this page still needs
+        interaction_budget_ms: Total time allowed for clicking and scrolling
+        capture: URL globs or compiled patterns of responses to record
     """
-    with sync_playwright() as p:
-        browser = p.chromium.launch()
-        page = (
-            browser.new_page(
-                extra_http_headers=headers,
-                timezone_id="Europe/Bucharest",
+    archive_key = _rendered_archive_key(
+        url,
+        headers,
+        wait_selector,
+        click_selector,
+        click_count,
+        scroll_count,
+        scroll_item_selector,
+        allow_resource_types,
+        capture,
+    )
+    if _replaying():
+        return _replay_rendered(archive_key, url)
+    with (
+        _host_slot(url),
+        _RequestTally("rendered") as tally,
+        get_browser_pool().page(headers) as page,
+    ):
+        page.route(
+            "**/*",
+            lambda route: _route_request(route, allow_resource_types),
+        )
+        matched: list = []
+        if capture:
+            page.on(
+                "response",
+                lambda response: (
+                    matched.append(response)
+                    if _matches_capture(response.url, capture)
+                    else None
+                ),
             )
-            if headers
-            else browser.new_page(timezone_id="Europe/Bucharest")
+        html = _run_render_steps(_render_steps(
+            page,
+            url,
+            timeout,
+            wait_selector,
+            click_selector,
+            click_count,
+            scroll_count,
+            scroll_item_selector,
+            interaction_budget_ms,
+        ))
+        tally.size = len(html.encode("utf-8"))
+        rendered = RenderedPage(
+            html=html,
+            responses=[
+                captured
+                for captured in map(_read_captured, matched)
+                if captured is not None
+            ],
         )
-        response = page.goto(url, timeout=timeout, wait_until="domcontentloaded")
-        status = getattr(response, "status", None)
-        if isinstance(status, int) and status >= 400:
-            raise HttpError(f"HTTP {status} for {url}", status_code=status)
-        if wait_selector:
-            page.wait_for_selector(wait_selector, timeout=timeout)
-        else:
-            page.wait_for_timeout(3000)
-
-        if click_selector and click_count > 0:
-            for _ in range(click_count):
-                try:
-                    button = page.locator(click_selector).first
-                    if button.is_visible():
-                        button.click()
-                        page.wait_for_timeout(2000)
-                    else:
-                        break
-                except Exception:
-                    break
+    _record_rendered(archive_key, url, rendered)
+    return rendered
+
+
+def _fetch_js(
+    url: str,
+    timeout: int,
+    headers: dict[str, str] | None = None,
+    wait_selector: str | None = None,
+    click_selector: str | None = None,
+    click_count: int = 0,
+    scroll_count: int = 0,
+    scroll_item_selector: str | None = None,
+    allow_resource_types: frozenset[str] = frozenset(),
+    interaction_budget_ms: int = JS_INTERACTION_BUDGET_MS,
+) -> str:
+    """Fetch JS-rendered page with retry (see _render_js)."""
+    return _render_js(
+        url,
+        timeout,
+        headers,
+        wait_selector,
+        click_selector,
+        click_count,
+        scroll_count,
+        scroll_item_selector,
+        allow_resource_types,
+        interaction_budget_ms,
+    ).html
+
+
+def _render_mode(
+    needs_js: bool,
+    wait_selector: str | None,
+    click_selector: str | None,
+    click_count: int,
+    scroll_count: int,
+    scroll_item_selector: str | None,
+    allow_resource_types: frozenset[str] = frozenset(),
+) -> str:
+    if not needs_js:
+        return "http"
+    return json.dumps([
+        "js",
+        wait_selector,
+        click_selector,
+        click_count,
+        scroll_count,
+        scroll_item_selector,
+        sorted(allow_resource_types),
+    ])
+
+
+class _CacheLookup:
+    """Cache state for one fetch: the key, any stored entry and its TTL."""
+
+    def __init__(
+        self,
+        url: str,
+        headers: dict[str, str] | None,
+        render_mode: str,
+        cache_ttl: float | None,
+    ):
+        self.url = url
+        if cache_ttl is None:
+            cache_ttl = current_fetch_context().cache_ttl
+        self.ttl = CACHE_DEFAULT_TTL_SECONDS if cache_ttl is None else cache_ttl
+        self.cache = _response_cache
+        self.key: str | None = None
+        self.cached = None
+        if self.cache is not None:
+            self.key = cache_key(url, headers, render_mode)
+            self.cached = self.cache.get(self.key)
+
+    def fresh_body(self) -> str | None:
+        if self.cached is not None and self.cached.is_fresh(self.ttl):
+            return self.cached.body
+        return None
+
+    def request_headers(
+        self,
+        headers: dict[str, str] | None,
+    ) -> dict[str, str] | None:
+        if self.cached is None:
+            return headers
+        return {**(headers or {}), **self.cached.validators()}
+
+    def store_rendered(self, html: str) -> None:
+        # Rendered pages carry no validators, so only a TTL makes them reusable.
+        if self.cache is not None and self.key is not None and self.ttl > 0:
+            self.cache.put(self.key, self.url, html)
+
+    def finish_http(self, response: httpx.Response, record_failure: bool) -> str:
+        if response.status_code == 304:
+            if self.cache is None or self.key is None or self.cached is None:
+                message = f"HTTP 304 without a cached body for {self.url}"
+                if record_failure:
+                    _record_fetch_failure(message)
+                raise HttpError(message, status_code=304)
+            self.cache.refresh(self.key)
+            current_fetch_context().count("cache_hits")
+            return self.cached.body
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if self.cache is not None and self.key is not None and (
+            etag or last_modified or self.ttl > 0
+        ):
+            self.cache.put(self.key, self.url, response.text, etag, last_modified)
+        return response.text
+
+
+class CircuitBreaker:
+    """Counts consecutive terminal failures for one host.
+
+    Once ``threshold`` requests in a row have failed after their retries, the
+    circuit opens and stays open for the rest of the process, so later fetches
+    fail immediately instead of burning retries on a dead site.
+    """
+
+    def __init__(self, host: str, threshold: int = CIRCUIT_FAILURE_THRESHOLD):
+        self.host = host
+        self.threshold = threshold
+        self.consecutive_failures = 0
+        self.is_open = False
+        self._lock = threading.Lock()
+
+    @property
+    def summary(self) -> str:
+        return (
+            f"Circuit open for {self.host} after {self.consecutive_failures} "
+            f"consecutive failed request(s)"
+        )
+
+    def record_success(self) -> None:
+        with self._lock:
+            if not self.is_open:
+                self.consecutive_failures = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.consecutive_failures += 1
+            if self.consecutive_failures >= self.threshold:
+                self.is_open = True
+
+
+_circuit_breakers: dict[str, CircuitBreaker] = {}
+_circuit_breakers_lock = threading.Lock()
+
+
+def _circuit_breaker(url: str) -> CircuitBreaker:
+    host = _hostname(url)
+    with _circuit_breakers_lock:
+        breaker = _circuit_breakers.get(host)
+        if breaker is None:
+            breaker = CircuitBreaker(host)
+            _circuit_breakers[host] = breaker
+        return breaker
+
+
+def is_circuit_open(url: str) -> bool:
+    """Whether requests to the URL's host are currently short-circuited."""
+    return _circuit_breaker(url).is_open
 
-        if scroll_count > 0:
-            no_change_count = 0
-            prev_item_count = 0
-            for _ in range(scroll_count):
-                page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                page.wait_for_timeout(2000)
-                if scroll_item_selector:
-                    item_count = page.evaluate(
-                        f"document.querySelectorAll('{scroll_item_selector}').length"
-                    )
-                    if item_count == prev_item_count:
-                        no_change_count += 1
-                        if no_change_count >= 3:
-                            break
-                    else:
-                        no_change_count = 0
-                        prev_item_count = item_count
-                else:
-                    prev_height = page.evaluate("document.body.scrollHeight")
-                    page.wait_for_timeout(500)
-                    new_height = page.evaluate("document.body.scrollHeight")
-                    if new_height == prev_height:
-                        no_change_count += 1
-                        if no_change_count >= 3:
-                            break
-                    else:
-                        no_change_count = 0
-
-        content = page.content()
-        browser.close()
-        return content
+
+def open_circuit_summary(url: str) -> str | None:
+    """Describe the open circuit for the URL's host, or None if it is closed."""
+    breaker = _circuit_breaker(url)
+    return breaker.summary if breaker.is_open else None
+
+
+def get_open_circuits() -> dict[str, str]:
+    """Map each host with an open circuit to its summary message."""
+    with _circuit_breakers_lock:
+        breakers = list(_circuit_breakers.values())
+    return {breaker.host: breaker.summary for breaker in breakers if breaker.is_open}
+
+
+def reset_circuit_breakers() -> None:
+    """Close every circuit, e.g. between independent runs in one process."""
+    with _circuit_breakers_lock:
+        _circuit_breakers.clear()
+
+
+def _guard_circuit(url: str, record_failure: bool) -> None:
+    """Fail fast for an open host, recording its summary once per scraper."""
+    breaker = _circuit_breaker(url)
+    if not breaker.is_open:
+        return
+    summary = breaker.summary
+    current_fetch_context().count("circuit_skips")
+    if record_failure and summary not in current_fetch_context().failures:
+        _record_fetch_failure(summary)
+    raise HttpError(f"{summary}; skipped {url}")
+
+
+def _counts_against_circuit(error: HttpError) -> bool:
+    # Client errors such as 404 prove the host is up; only outages count.
+    status = error.status_code
+    return status is None or status == 429 or status >= 500
+
+
+def _trips_circuit(trip_circuit: bool) -> bool:
+    # Replayed runs never touch the origin, so an archive miss says nothing
+    # about the host's health and must not refuse requests that were recorded.
+    return trip_circuit and not _replaying()
+
+
+def _record_circuit_success(url: str, trip_circuit: bool = True) -> None:
+    if _trips_circuit(trip_circuit):
+        _circuit_breaker(url).record_success()
+
+
+def _fetch_error(
+    e: Exception,
+    url: str,
+    record_failure: bool,
+    trip_circuit: bool = True,
+) -> HttpError:
+    """Convert a terminal fetch exception into a recorded HttpError."""
+    if isinstance(e, HttpError):
+        error = e
+    elif isinstance(e, httpx.HTTPStatusError):
+        error = HttpError(
+            f"HTTP {e.response.status_code} for {url}",
+            status_code=e.response.status_code,
+        )
+    else:
+        error = HttpError(f"Failed to fetch {url}: {e}")
+    context = current_fetch_context()
+    if context.out_of_time():
+        # Cut short by the scraper's time budget, not by the host.
+        context.budget_exhausted = True
+    elif _trips_circuit(trip_circuit):
+        breaker = _circuit_breaker(url)
+        if _counts_against_circuit(error):
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+    if record_failure:
+        _record_fetch_failure(str(error))
+    return error
 
 
 def fetch_page(
@@ -172,6 +1365,10 @@ def fetch_page(
     scroll_count: int = 0,
     scroll_item_selector: str | None = None,
     record_failure: bool = True,
+    cache_ttl: float | None = None,
+    allow_resource_types: Iterable[str] = (),
+    interaction_budget_ms: int = JS_INTERACTION_BUDGET_MS,
+    trip_circuit: bool = True,
 ) -> str:
     """Fetch a page, using Playwright for JS-heavy sites.
 
@@ -189,10 +1386,46 @@ def fetch_page(
         scroll_count: Number of times to scroll (for infinite scroll pages)
         scroll_item_selector: Optional selector to count items for scroll completion
         record_failure: Whether a terminal failure should fail the owning scraper
+        cache_ttl: Seconds a cached body may be served without revalidation
+            when the response cache is enabled (None = the scraper's
+            CACHE_TTL_SECONDS, else CACHE_DEFAULT_TTL_SECONDS)
+        allow_resource_types: Playwright resource types to load even though
+            they are blocked by default (see BLOCKED_RESOURCE_TYPES)
+        interaction_budget_ms: Time budget in milliseconds for all clicking and
+            scrolling; the page is returned as loaded so far once it runs out
+        trip_circuit: Whether the outcome counts toward the host's circuit
+            breaker; optional fetches (e.g. enrichment) pass False so their
+            failures cannot get a host's scrapers skipped
     """
+    allowed_types = frozenset(allow_resource_types)
+    lookup = _CacheLookup(
+        url,
+        headers,
+        _render_mode(
+            needs_js,
+            wait_selector,
+            click_selector,
+            click_count,
+            scroll_count,
+            scroll_item_selector,
+            allowed_types,
+        ),
+        cache_ttl,
+    )
+    if url.startswith(HTML_READER_BASE_URL):
+        current_fetch_context().count("reader_fallbacks")
+    fresh = lookup.fresh_body()
+    if fresh is not None:
+        current_fetch_context().count("cache_hits")
+        return fresh
+    _guard_deadline(url)
+    _guard_circuit(url, record_failure)
+    timeout = _clamp_timeout_ms(timeout)
+    interaction_budget_ms = _clamp_timeout_ms(interaction_budget_ms)
+
     if needs_js:
         try:
-            return _fetch_js(
+            html = _fetch_js(
                 url,
                 timeout,
                 headers,
@@ -201,32 +1434,74 @@ def fetch_page(
                 click_count,
                 scroll_count,
                 scroll_item_selector,
+                allowed_types,
+                interaction_budget_ms,
             )
-        except HttpError as e:
-            if record_failure:
-                _record_fetch_failure(str(e))
-            raise
-        except Exception as e:
-            message = f"Failed to fetch {url}: {e}"
-            if record_failure:
-                _record_fetch_failure(message)
-            raise HttpError(message) from e
-    else:
-        try:
-            return _fetch_http(url, headers)
-        except httpx.HTTPStatusError as e:
-            message = f"HTTP {e.response.status_code} for {url}"
-            if record_failure:
-                _record_fetch_failure(message)
-            raise HttpError(
-                message,
-                status_code=e.response.status_code,
-            ) from e
         except Exception as e:
-            message = f"Failed to fetch {url}: {e}"
-            if record_failure:
-                _record_fetch_failure(message)
-            raise HttpError(message) from e
+            error = _fetch_error(e, url, record_failure, trip_circuit)
+            if error is e:
+                raise
+            raise error from e
+        _record_circuit_success(url, trip_circuit)
+        lookup.store_rendered(html)
+        return html
+
+    try:
+        response = _fetch_http(url, lookup.request_headers(headers))
+    except Exception as e:
+        raise _fetch_error(e, url, record_failure, trip_circuit) from e
+    _record_circuit_success(url, trip_circuit)
+    return lookup.finish_http(response, record_failure)
+
+
+def fetch_page_responses(
+    url: str,
+    capture: Iterable[str | re.Pattern],
+    timeout: int = 30000,
+    headers: dict[str, str] | None = None,
+    wait_selector: str | None = None,
+    click_selector: str | None = None,
+    click_count: int = 0,
+    scroll_count: int = 0,
+    scroll_item_selector: str | None = None,
+    record_failure: bool = True,
+    allow_resource_types: Iterable[str] = (),
+    interaction_budget_ms: int = JS_INTERACTION_BUDGET_MS,
+) -> RenderedPage:
+    """Render a page and record the XHR/fetch responses it loads.
+
+    Many JS-heavy sites render from a JSON feed the browser already downloads;
+    reading that feed is cheaper and sturdier than parsing the rendered DOM.
+    Responses whose URL matches one of ``capture`` (globs such as
+    ``"**/api/events*"`` or compiled regexes) are returned with the HTML.
+    Rendered pages with captures are never cached. The remaining arguments
+    behave as in fetch_page with ``needs_js=True``.
+    """
+    _guard_deadline(url)
+    _guard_circuit(url, record_failure)
+    timeout = _clamp_timeout_ms(timeout)
+    interaction_budget_ms = _clamp_timeout_ms(interaction_budget_ms)
+    try:
+        rendered = _render_js(
+            url,
+            timeout,
+            headers,
+            wait_selector,
+            click_selector,
+            click_count,
+            scroll_count,
+            scroll_item_selector,
+            frozenset(allow_resource_types),
+            interaction_budget_ms,
+            tuple(capture),
+        )
+    except Exception as e:
+        error = _fetch_error(e, url, record_failure)
+        if error is e:
+            raise
+        raise error from e
+    _record_circuit_success(url)
+    return rendered
 
 
 def fetch_page_with_reader_fallback(
@@ -245,3 +1520,392 @@ def fetch_page_with_reader_fallback(
         timeout=timeout,
         headers=HTML_READER_HEADERS,
     )
+
+
+# Scrapers on different threads each run their own event loop; every loop
+# keeps its own clients and browser, closed only from that loop.
+_async_http_clients: WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[str, httpx.AsyncClient]
+] = WeakKeyDictionary()
+_async_http_clients_lock = threading.Lock()
+
+
+def _get_async_http_client(url: str) -> httpx.AsyncClient:
+    """Return the keep-alive async client for the host on the running loop."""
+    loop = asyncio.get_running_loop()
+    key = _host_key(url)
+    with _async_http_clients_lock:
+        clients = _async_http_clients.setdefault(loop, {})
+    client = clients.get(key)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            http2=HTTP2_ENABLED,
+            limits=HTTP_POOL_LIMITS,
+            timeout=HTTP_TIMEOUT_SECONDS,
+            follow_redirects=True,
+            transport=_async_archive_transport(),
+        )
+        clients[key] = client
+    return client
+
+
+async def aclose_http_clients() -> None:
+    """Close the async clients owned by the running loop."""
+    with _async_http_clients_lock:
+        clients = _async_http_clients.pop(asyncio.get_running_loop(), {})
+    for client in clients.values():
+        await client.aclose()
+
+
+@retry(
+    stop=stop_after_attempt(MAX_RETRIES) | _stop_at_deadline,
+    wait=_wait_before_retry,
+    before_sleep=_count_retry,
+    retry=retry_if_exception(_is_retryable_httpx),
+    reraise=True,
+)
+async def _afetch_http(
+    url: str,
+    headers: dict[str, str] | None = None,
+) -> httpx.Response:
+    """Async counterpart of _fetch_http."""
+    async with _ahost_slot(url), _RequestTally("http") as tally:
+        response = await _get_async_http_client(url).get(
+            url,
+            headers=headers,
+            timeout=_request_timeout(),
+        )
+        tally.size = len(response.content)
+    _defer_host_for_retry_after(url, response.status_code, response.headers)
+    if response.status_code != 304:
+        response.raise_for_status()
+    return response
+
+
+class AsyncBrowserPool:
+    """Async Playwright browser whose pages are shared by concurrent fetches.
+
+    Unlike BrowserPool, borrowing a page waits for a free slot instead of
+    failing, because concurrent coroutines are expected to contend for pages.
+    """
+
+    def __init__(
+        self,
+        max_pages: int = BROWSER_MAX_PAGES,
+        max_navigations: int = BROWSER_CONTEXT_MAX_NAVIGATIONS,
+    ):
+        if max_pages < 1:
+            raise ValueError("max_pages must be at least 1")
+        if max_navigations < 1:
+            raise ValueError("max_navigations must be at least 1")
+        self.max_pages = max_pages
+        self.max_navigations = max_navigations
+        self._playwright = None
+        self._browser = None
+        self._idle_contexts: list[_PooledContext] = []
+        self._slots = asyncio.Semaphore(max_pages)
+        self._launch_lock = asyncio.Lock()
+
+    async def _ensure_browser(self):
+        async with self._launch_lock:
+            if self._browser is not None and self._browser.is_connected():
+                return self._browser
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+            self._browser = await self._playwright.chromium.launch()
+            self._idle_contexts.clear()
+            return self._browser
+
+    async def _borrow_context(
+        self,
+        headers: dict[str, str] | None,
+    ) -> _PooledContext:
+        key = tuple(sorted((headers or {}).items()))
+        for index, pooled in enumerate(self._idle_contexts):
+            if pooled.key == key:
+                return self._idle_contexts.pop(index)
+
+        browser = await self._ensure_browser()
+        options: dict = {"timezone_id": BROWSER_TIMEZONE}
+        if headers:
+            options["extra_http_headers"] = headers
+        return _PooledContext(await browser.new_context(**options), key)
+
+    async def _return_context(self, pooled: _PooledContext, healthy: bool) -> None:
+        pooled.navigations += 1
+        if (
+            not healthy
+            or pooled.navigations >= self.max_navigations
+            or len(self._idle_contexts) >= self.max_pages
+        ):
+            await _aclose_quietly(pooled.context)
+            return
+        self._idle_contexts.append(pooled)
+
+    @asynccontextmanager
+    async def page(self, headers: dict[str, str] | None = None) -> AsyncIterator:
+        """Borrow a fresh page once one of ``max_pages`` slots is free."""
+        async with self._slots:
+            pooled = await self._borrow_context(headers)
+            page = None
+            healthy = False
+            try:
+                page = await pooled.context.new_page()
+                yield page
+                healthy = True
+            finally:
+                if page is not None:
+                    await _aclose_quietly(page)
+                await self._return_context(pooled, healthy)
+
+    async def close(self) -> None:
+        """Close every pooled context, the browser and the Playwright driver."""
+        for pooled in self._idle_contexts:
+            await _aclose_quietly(pooled.context)
+        self._idle_contexts.clear()
+        if self._browser is not None:
+            await _aclose_quietly(self._browser)
+            self._browser = None
+        if self._playwright is not None:
+            try:
+                await self._playwright.stop()
+            except Exception:
+                pass
+            self._playwright = None
+
+
+async def _aclose_quietly(resource) -> None:
+    try:
+        await resource.close()
+    except Exception:
+        pass
+
+
+_async_browser_pools: WeakKeyDictionary[
+    asyncio.AbstractEventLoop, AsyncBrowserPool
+] = WeakKeyDictionary()
+_async_browser_pools_lock = threading.Lock()
+
+
+def get_async_browser_pool() -> AsyncBrowserPool:
+    """Return the browser pool bound to the running event loop."""
+    loop = asyncio.get_running_loop()
+    with _async_browser_pools_lock:
+        pool = _async_browser_pools.get(loop)
+        if pool is None:
+            pool = _async_browser_pools[loop] = AsyncBrowserPool()
+    return pool
+
+
+async def aclose_browser_pool() -> None:
+    """Shut down the running loop's async browser, if it started one."""
+    with _async_browser_pools_lock:
+        pool = _async_browser_pools.pop(asyncio.get_running_loop(), None)
+    if pool is not None:
+        await pool.close()
+
+
+async def _aroute_request(route, allow_resource_types: frozenset[str]) -> None:
+    request = route.request
+    if _is_blocked_request(request.resource_type, request.url, allow_resource_types):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+@retry(
+    stop=stop_after_attempt(MAX_RETRIES) | _stop_at_deadline,
+    wait=_wait_before_retry,
+    before_sleep=_count_retry,
+    retry=retry_if_exception(_is_retryable_playwright),
+    reraise=True,
+)
+async def _afetch_js(
+    url: str,
+    timeout: int,
+    headers: dict[str, str] | None = None,
+    wait_selector: str | None = None,
+    click_selector: str | None = None,
+    click_count: int = 0,
+    scroll_count: int = 0,
+    scroll_item_selector: str | None = None,
+    allow_resource_types: frozenset[str] = frozenset(),
+    interaction_budget_ms: int = JS_INTERACTION_BUDGET_MS,
+) -> str:
+    """Async counterpart of _fetch_js."""
+    archive_key = _rendered_archive_key(
+        url,
+        headers,
+        wait_selector,
+        click_selector,
+        click_count,
+        scroll_count,
+        scroll_item_selector,
+        allow_resource_types,
+    )
+    if _replaying():
+        return _replay_rendered(archive_key, url).html
+    async with (
+        _ahost_slot(url),
+        _RequestTally("rendered") as tally,
+        get_async_browser_pool().page(headers) as page,
+    ):
+        await page.route(
+            "**/*",
+            lambda route: _aroute_request(route, allow_resource_types),
+        )
+        html = await _arun_render_steps(_render_steps(
+            page,
+            url,
+            timeout,
+            wait_selector,
+            click_selector,
+            click_count,
+            scroll_count,
+            scroll_item_selector,
+            interaction_budget_ms,
+        ))
+        tally.size = len(html.encode("utf-8"))
+    _record_rendered(archive_key, url, RenderedPage(html=html, responses=[]))
+    return html
+
+
+async def afetch_page(
+    url: str,
+    needs_js: bool = False,
+    timeout: int = 30000,
+    headers: dict[str, str] | None = None,
+    wait_selector: str | None = None,
+    click_selector: str | None = None,
+    click_count: int = 0,
+    scroll_count: int = 0,
+    scroll_item_selector: str | None = None,
+    record_failure: bool = True,
+    cache_ttl: float | None = None,
+    allow_resource_types: Iterable[str] = (),
+    interaction_budget_ms: int = JS_INTERACTION_BUDGET_MS,
+    trip_circuit: bool = True,
+) -> str:
+    """Asyncio-native fetch_page with the same retries, cache and failure records."""
+    allowed_types = frozenset(allow_resource_types)
+    lookup = _CacheLookup(
+        url,
+        headers,
+        _render_mode(
+            needs_js,
+            wait_selector,
+            click_selector,
+            click_count,
+            scroll_count,
+            scroll_item_selector,
+            allowed_types,
+        ),
+        cache_ttl,
+    )
+    if url.startswith(HTML_READER_BASE_URL):
+        current_fetch_context().count("reader_fallbacks")
+    fresh = lookup.fresh_body()
+    if fresh is not None:
+        current_fetch_context().count("cache_hits")
+        return fresh
+    _guard_deadline(url)
+    _guard_circuit(url, record_failure)
+    timeout = _clamp_timeout_ms(timeout)
+    interaction_budget_ms = _clamp_timeout_ms(interaction_budget_ms)
+
+    if needs_js:
+        try:
+            html = await _afetch_js(
+                url,
+                timeout,
+                headers,
+                wait_selector,
+                click_selector,
+                click_count,
+                scroll_count,
+                scroll_item_selector,
+                allowed_types,
+                interaction_budget_ms,
+            )
+        except Exception as e:
+            error = _fetch_error(e, url, record_failure, trip_circuit)
+            if error is e:
+                raise
+            raise error from e
+        _record_circuit_success(url, trip_circuit)
+        lookup.store_rendered(html)
+        return html
+
+    try:
+        response = await _afetch_http(url, lookup.request_headers(headers))
+    except Exception as e:
+        raise _fetch_error(e, url, record_failure, trip_circuit) from e
+    _record_circuit_success(url, trip_circuit)
+    return lookup.finish_http(response, record_failure)
+
+
+async def afetch_page_with_reader_fallback(
+    url: str,
+    expected_text: str,
+    needs_js: bool = False,
+    timeout: int = 30000,
+) -> str:
+    """Async counterpart of fetch_page_with_reader_fallback."""
+    html = await afetch_page(url, needs_js=needs_js, timeout=timeout)
+    if expected_text in html:
+        return html
+
+    return await afetch_page(
+        f"{HTML_READER_BASE_URL}{url}",
+        timeout=timeout,
+        headers=HTML_READER_HEADERS,
+    )
+
+
+async def afetch_many(
+    urls: list[str],
+    concurrency: int = DEFAULT_FETCH_CONCURRENCY,
+    **fetch_kwargs,
+) -> list[str | HttpError]:
+    """Fetch URLs with at most ``concurrency`` in flight, in input order.
+
+    A failed URL yields its HttpError in place of the body so one broken
+    detail page does not discard the others.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch_one(url: str) -> str | HttpError:
+        async with semaphore:
+            try:
+                return await afetch_page(url, **fetch_kwargs)
+            except HttpError as e:
+                return e
+
+    return list(await asyncio.gather(*(fetch_one(url) for url in urls)))
+
+
+def fetch_many(
+    urls: list[str],
+    concurrency: int = DEFAULT_FETCH_CONCURRENCY,
+    **fetch_kwargs,
+) -> list[str | HttpError]:
+    """Synchronous entry point for afetch_many, for use from scrape().
+
+    The fetches run on a new event loop in a thread of their own, so this
+    also works where a loop is already running, such as a thread whose sync
+    Playwright browser has rendered a page. The caller's fetch context (and
+    so its counters, failures and deadline) carries over to that thread.
+    """
+
+    async def run() -> list[str | HttpError]:
+        try:
+            return await afetch_many(urls, concurrency, **fetch_kwargs)
+        finally:
+            await aclose_http_clients()
+            await aclose_browser_pool()
+
+    context = copy_context()
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="fetch-many") as executor:
+        return executor.submit(context.run, asyncio.run, run()).result()
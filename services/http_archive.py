@@ -0,0 +1,197 @@
+"""Record/replay archive for running the pipeline without the network.
+
+While recording, every httpx exchange and every rendered Playwright page is
+written to a gzip-compressed JSON-lines file, keyed by the request that
+produced it. While replaying, the same requests are answered from that file
+and anything missing fails with ArchiveMiss instead of reaching the network.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+
+import httpx
+
+ARCHIVE_FORMAT_VERSION = 1
+
+# Bodies are stored decoded, so transfer-level headers no longer apply.
+DROPPED_HEADERS = {
+    "connection",
+    "content-encoding",
+    "content-length",
+    "keep-alive",
+    "set-cookie",
+    "transfer-encoding",
+}
+
+# Token endpoints answer a credentialed request with secrets that must not end
+# up in an archive meant to be shared; replays only need the shape.
+REDACTED_RESPONSE_FIELDS = {"access_token", "id_token", "refresh_token"}
+REDACTED = "redacted"
+
+
+class ArchiveMiss(LookupError):
+    """A replayed request has no recorded response."""
+
+
+def request_key(method: str, url: str, body: bytes = b"") -> str:
+    """Identify an HTTP exchange by method, URL and request body."""
+    digest = hashlib.sha256()
+    for part in (method.upper().encode(), url.encode("utf-8"), body):
+        digest.update(part)
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _recorded_content(request: httpx.Request, response: httpx.Response) -> bytes:
+    """Response body to archive, with issued credentials redacted."""
+    if "authorization" not in request.headers:
+        return response.content
+    try:
+        payload = json.loads(response.content)
+    except ValueError:
+        return response.content
+    if not isinstance(payload, dict) or not REDACTED_RESPONSE_FIELDS & payload.keys():
+        return response.content
+    for field in REDACTED_RESPONSE_FIELDS & payload.keys():
+        payload[field] = REDACTED
+    return json.dumps(payload).encode()
+
+
+def _encode_body(content: bytes) -> str:
+    # surrogateescape round-trips arbitrary bytes through a JSON string.
+    return content.decode("utf-8", "surrogateescape")
+
+
+def _decode_body(body: str) -> bytes:
+    return body.encode("utf-8", "surrogateescape")
+
+
+class HttpArchive:
+    """Recorded responses for one run, loaded from or saved to ``path``."""
+
+    def __init__(self, path: Path, replaying: bool):
+        self.path = Path(path)
+        self.replaying = replaying
+        self._entries: dict[str, dict] = {}
+        self._lock = threading.Lock()
+        if replaying:
+            self._load()
+
+    @classmethod
+    def record(cls, path: Path) -> "HttpArchive":
+        return cls(path, replaying=False)
+
+    @classmethod
+    def replay(cls, path: Path) -> "HttpArchive":
+        return cls(path, replaying=True)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, key: str, url: str) -> dict:
+        """Return the entry recorded under ``key`` or raise ArchiveMiss."""
+        entry = self._entries.get(key)
+        if entry is None:
+            raise ArchiveMiss(f"No archived response for {url}")
+        return entry
+
+    def store(self, key: str, entry: dict) -> None:
+        """Keep the latest response for a request; later ones win."""
+        if self.replaying:
+            return
+        with self._lock:
+            self._entries[key] = entry
+
+    def store_exchange(self, request: httpx.Request, response: httpx.Response) -> None:
+        self.store(
+            request_key(request.method, str(request.url), request.content),
+            {
+                "kind": "http",
+                "url": str(request.url),
+                "status": response.status_code,
+                "headers": [
+                    [name, value]
+                    for name, value in response.headers.items()
+                    if name.lower() not in DROPPED_HEADERS
+                ],
+                "body": _encode_body(_recorded_content(request, response)),
+            },
+        )
+
+    def replay_exchange(self, request: httpx.Request) -> httpx.Response:
+        url = str(request.url)
+        entry = self.lookup(request_key(request.method, url, request.content), url)
+        return httpx.Response(
+            entry["status"],
+            headers=entry["headers"],
+            content=_decode_body(entry["body"]),
+            request=request,
+        )
+
+    def save(self) -> None:
+        """Write the recorded entries, replacing the file atomically."""
+        if self.replaying:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        partial = self.path.with_name(f"{self.path.name}.partial")
+        with self._lock:
+            entries = list(self._entries.items())
+        with gzip.open(partial, "wt", encoding="utf-8") as handle:
+            handle.write(json.dumps({"version": ARCHIVE_FORMAT_VERSION}) + "\n")
+            for key, entry in entries:
+                handle.write(json.dumps({"key": key, **entry}) + "\n")
+        os.replace(partial, self.path)
+
+    def _load(self) -> None:
+        with gzip.open(self.path, "rt", encoding="utf-8") as handle:
+            header = json.loads(handle.readline())
+            if header.get("version") != ARCHIVE_FORMAT_VERSION:
+                raise ValueError(
+                    f"Unsupported archive version {header.get('version')!r} "
+                    f"in {self.path}"
+                )
+            for line in handle:
+                entry = json.loads(line)
+                self._entries[entry.pop("key")] = entry
+
+
+class ArchiveTransport(httpx.BaseTransport):
+    """httpx transport that records through, or replays from, an archive."""
+
+    def __init__(self, archive: HttpArchive, transport: httpx.BaseTransport):
+        self.archive = archive
+        self.transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if self.archive.replaying:
+            return self.archive.replay_exchange(request)
+        response = self.transport.handle_request(request)
+        response.read()
+        self.archive.store_exchange(request, response)
+        return response
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncArchiveTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of ArchiveTransport."""
+
+    def __init__(self, archive: HttpArchive, transport: httpx.AsyncBaseTransport):
+        self.archive = archive
+        self.transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if self.archive.replaying:
+            return self.archive.replay_exchange(request)
+        response = await self.transport.handle_async_request(request)
+        await response.aread()
+        self.archive.store_exchange(request, response)
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
@@ -0,0 +1,204 @@
+"""Persistent response cache used underneath fetch_page.
+
+Bodies are stored in a small SQLite database together with the validators
+(``ETag``/``Last-Modified``) needed to revalidate them on the next run. The
+cache is bounded by total body size and evicts the least recently used
+entries first.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024
+CACHE_FILENAME = "responses.sqlite3"
+
+
+@dataclass
+class CachedResponse:
+    body: str
+    etag: str | None
+    last_modified: str | None
+    stored_at: float
+
+    def is_fresh(self, ttl_seconds: float, now: float | None = None) -> bool:
+        """Whether the body may be served without asking the origin."""
+        if ttl_seconds <= 0:
+            return False
+        reference = time.time() if now is None else now
+        return reference - self.stored_at < ttl_seconds
+
+    def validators(self) -> dict[str, str]:
+        """Conditional request headers that let the origin answer 304."""
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def cache_key(
+    url: str,
+    headers: dict[str, str] | None,
+    render_mode: str,
+) -> str:
+    """Hash everything that can change the body returned for a request."""
+    payload = json.dumps(
+        [url, sorted((headers or {}).items()), render_mode],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """Size-bounded LRU cache of response bodies on disk."""
+
+    def __init__(self, directory: Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._last_tick = 0.0
+        self._db = sqlite3.connect(
+            self.directory / CACHE_FILENAME,
+            check_same_thread=False,
+        )
+        self._db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                body TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                stored_at REAL NOT NULL,
+                last_used REAL NOT NULL
+            )
+            """
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS responses_last_used "
+            "ON responses (last_used)"
+        )
+        self._db.commit()
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Return a stored response and mark it as recently used."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT body, etag, last_modified, stored_at "
+                "FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._db.execute(
+                "UPDATE responses SET last_used = ? WHERE key = ?",
+                (self._tick(), key),
+            )
+            self._db.commit()
+        return CachedResponse(*row)
+
+    def put(
+        self,
+        key: str,
+        url: str,
+        body: str,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        """Store a body, then evict old entries until the cache fits."""
+        size = len(body.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            now = self._tick()
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, url, body, size, etag, last_modified, stored_at, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, url, body, size, etag, last_modified, now, now),
+            )
+            self._evict()
+            self._db.commit()
+
+    def refresh(self, key: str) -> None:
+        """Restart the TTL of an entry the origin confirmed as unchanged."""
+        with self._lock:
+            now = self._tick()
+            self._db.execute(
+                "UPDATE responses SET stored_at = ?, last_used = ? WHERE key = ?",
+                (now, now, key),
+            )
+            self._db.commit()
+
+    def merge(self, path: Path) -> int:
+        """Copy entries from another cache database; the newer body wins.
+
+        Returns the number of entries read from ``path``.
+        """
+        with self._lock:
+            self._db.execute("ATTACH DATABASE ? AS other", (str(path),))
+            try:
+                (count,) = self._db.execute(
+                    "SELECT COUNT(*) FROM other.responses"
+                ).fetchone()
+                self._db.execute(
+                    """
+                    INSERT INTO responses
+                    SELECT key, url, body, size, etag, last_modified,
+                           stored_at, last_used
+                    FROM other.responses WHERE true
+                    ON CONFLICT (key) DO UPDATE SET
+                        url = excluded.url,
+                        body = excluded.body,
+                        size = excluded.size,
+                        etag = excluded.etag,
+                        last_modified = excluded.last_modified,
+                        stored_at = excluded.stored_at,
+                        last_used = MAX(last_used, excluded.last_used)
+                    WHERE excluded.stored_at > responses.stored_at
+                    """
+                )
+                self._evict()
+                self._db.commit()
+            finally:
+                self._db.execute("DETACH DATABASE other")
+        return count
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            (total,) = self._db.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        return total
+
+    def _tick(self) -> float:
+        # Strictly increasing so LRU order survives coarse clock resolution.
+        self._last_tick = max(time.time(), self._last_tick + 1e-6)
+        return self._last_tick
+
+    def _evict(self) -> None:
+        (total,) = self._db.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        if total <= self.max_bytes:
+            return
+        rows = self._db.execute(
+            "SELECT key, size FROM responses ORDER BY last_used ASC"
+        ).fetchall()
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,174 @@
+"""Memoized string normalization shared by the dedup passes.
+
+The same venues, titles and URLs recur across every dedup pass of a run
+(and across the persisted events file), so each normalizer uses
+precompiled patterns and a bounded LRU cache. event_view bundles the
+per-event results; equal events share one cached view, so each event is
+normalized once no matter how many passes look at it.
+"""
+
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from models import Event
+
+# Distinct strings kept per normalizer, and distinct events kept as views.
+STRING_CACHE_SIZE = 65536
+EVENT_VIEW_CACHE_SIZE = 131072
+
+TRACKING_QUERY_KEYS = {"fbclid", "gclid"}
+
+# Canonical venue names -> list of known aliases/variations
+VENUE_ALIASES: dict[str, list[str]] = {
+    "control": ["control club", "control bucuresti", "club control"],
+    "expirat": ["expirat club", "club expirat", "expirat halele carol"],
+    "quantic": ["quantic club", "club quantic", "quantic bucuresti"],
+    "beraria h": ["beraria h bucuresti", "berăria h"],
+    "arenele romane": ["arenele romane bucuresti"],
+    "sala palatului": ["sala palatului bucuresti"],
+    "romexpo": ["romexpo bucuresti", "pavilion romexpo"],
+    "opera nationala bucuresti": ["opera nb", "opera nationala"],
+    "grivita 53": ["g53", "teatrul grivita", "teatrul grivita 53"],
+    "tnb": ["teatrul national bucuresti", "teatrul nb", "teatrul national"]
+}
+
+# Build reverse lookup: alias -> canonical name
+_ALIAS_TO_CANONICAL: dict[str, str] = {}
+for canonical, aliases in VENUE_ALIASES.items():
+    _ALIAS_TO_CANONICAL[canonical] = canonical
+    for alias in aliases:
+        _ALIAS_TO_CANONICAL[alias] = canonical
+
+_PUNCTUATION = re.compile(r"[^\w\s]")
+_WHITESPACE = re.compile(r"\s+")
+_REPEATED_SLASHES = re.compile(r"/{2,}")
+_CONTROL_ROOM_SUFFIX = re.compile(
+    r"\s*\|\s*(?:live at control|control club)\s*\|.*$",
+    re.IGNORECASE,
+)
+_CONTROL_LIVE_PREFIX = re.compile(r"^\s*(?:ctrl\s+)?live\s*:\s*", re.IGNORECASE)
+_BRACKETED_COUNTRY = re.compile(r"\[(?:[A-Z]{2,3}(?:/[A-Z]{2,3})*|Algeria)\]")
+_PARENTHESIZED_COUNTRY = re.compile(r"\((?:[A-Z]{2,3}(?:/[A-Z]{2,3})*)\)")
+_LIVE_BEFORE_GUESTS = re.compile(
+    r"\blive(?=\s*\+\s*special guests\b)",
+    re.IGNORECASE,
+)
+_NON_WORD = re.compile(r"[^\w]+", re.UNICODE)
+
+
+@lru_cache(maxsize=STRING_CACHE_SIZE)
+def sanitize_venue(venue: str) -> str:
+    """Normalize venue name: lowercase, remove extra whitespace, punctuation."""
+    venue = venue.lower().strip()
+    venue = _PUNCTUATION.sub("", venue)  # remove punctuation
+    venue = _WHITESPACE.sub(" ", venue)  # collapse whitespace
+    return venue
+
+
+@lru_cache(maxsize=STRING_CACHE_SIZE)
+def normalize_venue(venue: str) -> str:
+    """Sanitize and resolve to canonical venue name if known."""
+    sanitized = sanitize_venue(venue)
+    return _ALIAS_TO_CANONICAL.get(sanitized, sanitized)
+
+
+@lru_cache(maxsize=STRING_CACHE_SIZE)
+def canonicalize_url(url: str) -> str:
+    """Normalize URL spelling without discarding identity-bearing query params."""
+    try:
+        parsed = urlsplit(url.strip())
+        hostname = parsed.hostname
+        if not hostname:
+            return url.strip()
+
+        hostname = hostname.casefold().removeprefix("www.")
+        port = parsed.port
+        if port and not (
+            (parsed.scheme.casefold() == "http" and port == 80)
+            or (parsed.scheme.casefold() == "https" and port == 443)
+        ):
+            hostname = f"{hostname}:{port}"
+
+        path = _REPEATED_SLASHES.sub("/", parsed.path or "/")
+        if path != "/":
+            path = path.rstrip("/")
+
+        query = urlencode(sorted(
+            (key, value)
+            for key, value in parse_qsl(parsed.query, keep_blank_values=True)
+            if not key.casefold().startswith("utm_")
+            and key.casefold() not in TRACKING_QUERY_KEYS
+        ))
+        return urlunsplit(("https", hostname, path, query, ""))
+    except ValueError:
+        return url.strip()
+
+
+@lru_cache(maxsize=STRING_CACHE_SIZE)
+def normalize_control_title(title: str) -> str:
+    """Remove known Control/Eventbook packaging while retaining artist identity."""
+    title = _CONTROL_ROOM_SUFFIX.sub("", title)
+    title = _CONTROL_LIVE_PREFIX.sub("", title)
+    title = _BRACKETED_COUNTRY.sub(" ", title)
+    title = _PARENTHESIZED_COUNTRY.sub(" ", title)
+    title = _LIVE_BEFORE_GUESTS.sub(" ", title)
+    title = _NON_WORD.sub(" ", title.casefold())
+    return " ".join(title.split())
+
+
+@lru_cache(maxsize=STRING_CACHE_SIZE)
+def control_venue_family(venue: str) -> str:
+    """Map Control room-qualified names to the ticket feed's venue root."""
+    sanitized = sanitize_venue(venue)
+    if normalize_venue(venue) == "control" or sanitized.startswith("control club "):
+        return "control"
+    return normalize_venue(venue)
+
+
+@dataclass(frozen=True)
+class EventView:
+    """The normalized strings the dedup passes compare an event by."""
+
+    identity: str
+    venue: str
+    canonical_url: str
+    control_title: str
+    control_venue: str
+    dedup_key: str
+
+
+def event_view(event: Event) -> EventView:
+    """Normalized view of an event, shared by every event with equal fields."""
+    return _event_view(
+        event.title,
+        event.artist,
+        event.venue,
+        event.date,
+        event.url,
+        event.source,
+    )
+
+
+@lru_cache(maxsize=EVENT_VIEW_CACHE_SIZE)
+def _event_view(
+    title: str,
+    artist: str | None,
+    venue: str,
+    date: datetime,
+    url: str,
+    source: str,
+) -> EventView:
+    identity = (artist or title).lower()
+    normalized_venue = normalize_venue(venue)
+    date_str = date.strftime("%Y-%m-%dT%H:%M")
+    return EventView(
+        identity=identity,
+        venue=normalized_venue,
+        canonical_url=canonicalize_url(url),
+        control_title=normalize_control_title(title),
+        control_venue=control_venue_family(venue),
+        dedup_key=f"{source}|{identity.strip()}|{date_str}|{normalized_venue}",
+    )
@@ -0,0 +1,82 @@
+"""Balance scrapers across parallel jobs using their recorded run times.
+
+Every run records how long each scraper took. The history keeps the last
+few runs per scraper, and balance_shards bin-packs scrapers into K shards
+of similar expected duration (longest-processing-time-first).
+"""
+
+import json
+from datetime import datetime
+from pathlib import Path
+from statistics import median
+
+HISTORY_RUNS = 10
+# Assumed duration for scrapers that have never been timed.
+DEFAULT_SCRAPER_SECONDS = 60.0
+
+
+def load_history(path: Path) -> dict[str, list[float]]:
+    """Return recent wall times per scraper key, oldest first."""
+    if not path.exists():
+        return {}
+    with open(path) as f:
+        data = json.load(f)
+    return {
+        key: [float(seconds) for seconds in runs]
+        for key, runs in data.get("scrapers", {}).items()
+    }
+
+
+def record_runs(
+    history: dict[str, list[float]],
+    timings: dict[str, float],
+    keep: int = HISTORY_RUNS,
+) -> dict[str, list[float]]:
+    """Append one run's wall times, keeping the latest ``keep`` per scraper."""
+    updated = {key: list(runs) for key, runs in history.items()}
+    for key, seconds in timings.items():
+        updated[key] = (updated.get(key, []) + [seconds])[-keep:]
+    return updated
+
+
+def save_history(path: Path, history: dict[str, list[float]]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(
+            {
+                "updated_at": datetime.now().isoformat(),
+                "scrapers": {
+                    key: [round(seconds, 2) for seconds in runs]
+                    for key, runs in sorted(history.items())
+                },
+            },
+            f,
+            indent=2,
+        )
+
+
+def estimate_seconds(
+    history: dict[str, list[float]],
+    key: str,
+    default: float = DEFAULT_SCRAPER_SECONDS,
+) -> float:
+    """Expected wall time of a scraper: the median of its recent runs."""
+    runs = history.get(key)
+    return median(runs) if runs else default
+
+
+def balance_shards(weights: dict[str, float], shards: int) -> list[list[str]]:
+    """Split keys into ``shards`` lists with near-equal total weight.
+
+    Heaviest keys are placed first, each onto the currently lightest shard;
+    ties are broken by name so the same history always gives the same plan.
+    """
+    if shards < 1:
+        raise ValueError("shards must be at least 1")
+    loads = [0.0] * shards
+    plan: list[list[str]] = [[] for _ in range(shards)]
+    for key in sorted(weights, key=lambda k: (-weights[k], k)):
+        lightest = min(range(shards), key=lambda index: (loads[index], index))
+        plan[lightest].append(key)
+        loads[lightest] += weights[key]
+    return plan
@@ -1,9 +1,10 @@
 import os
 import re
 
-import httpx
 from rapidfuzz import fuzz
 
+from services.http import get_http_client
+
 _access_token_cache: dict[str, str] = {}
 
 MATCH_THRESHOLD = 80  # Minimum fuzzy match score (0-100)
@@ -14,8 +15,9 @@ def get_access_token() -> str:
     if "token" in _access_token_cache:
         return _access_token_cache["token"]
     
-    response = httpx.post(
-        "https://accounts.spotify.com/api/token",
+    token_url = "https://accounts.spotify.com/api/token"
+    response = get_http_client(token_url).post(
+        token_url,
         data={"grant_type": "client_credentials"},
         auth=(os.environ["SPOTIFY_CLIENT_ID"], os.environ["SPOTIFY_CLIENT_SECRET"]),
     )
@@ -52,8 +54,9 @@ def _search_single_artist(artist_name: str, headers: dict) -> str | None:
     if not query:
         return None
     
-    response = httpx.get(
-        "https://api.spotify.com/v1/search",
+    search_url = "https://api.spotify.com/v1/search"
+    response = get_http_client(search_url).get(
+        search_url,
         params={"q": query, "type": "artist", "limit": 1},
         headers=headers,
     )
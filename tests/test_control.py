@@ -13,6 +13,15 @@ def test_scrape_uses_server_rendered_events_without_browser_wait():
     fetch.assert_called_once_with(control.EVENTS_URL)
 
 
+def test_scrape_parses_a_listing_fetched_by_the_fingerprint_check():
+    html = "<div class='events-list-view'></div>"
+
+    with patch("scrapers.music.control.fetch_page") as fetch:
+        assert control.scrape(listing_html=html) == []
+
+    fetch.assert_not_called()
+
+
 def test_scrape_parses_server_rendered_event_fixture():
     html = """
     <div class="events-list-view">
@@ -1,18 +1,26 @@
 """Tests for deduplication logic."""
 
-from datetime import datetime
+import random
+from collections import Counter
+from datetime import datetime, timedelta
 from unittest.mock import MagicMock, patch
 
 import pytest
+from rapidfuzz import process
 
 from models import Event
+from scripts.benchmark_dedup import synthetic_events
 from services.dedup import (
-    canonicalize_url,
+    StreamingDedup,
+    control_schedule_key,
+    dedup_preferred_cross_source,
+    dedup_similar,
+    is_unique_control_ticket_overlap,
     llm_dedup,
-    normalize_venue,
-    sanitize_venue,
+    source_priority,
     stage1_dedup,
 )
+from services.normalization import canonicalize_url, normalize_venue, sanitize_venue
 
 
 def make_event(
@@ -79,7 +87,8 @@ class TestStage1Dedup:
         ]
         result = stage1_dedup(events)
         assert len(result) == 1
-        assert result[0].source == "iabilet"
+        assert result[0].source == "eventbook"
+        assert stage1_dedup(events[::-1]) == result
 
     def test_same_canonical_url_and_datetime_prefers_curated_source(self):
         eventbook = make_event(
@@ -328,6 +337,138 @@ class TestStage1Dedup:
         ]
 
 
+def scan_cross_source(events: list[Event]) -> list[Event]:
+    """The unindexed cross-source loop: every event against every kept one."""
+    schedule_counts = Counter(
+        key for event in events if (key := control_schedule_key(event)) is not None
+    )
+    deduped: list[Event] = []
+    for event in events:
+        canonical_url = canonicalize_url(event.url)
+        for existing_index, existing in enumerate(deduped):
+            if (
+                event.date == existing.date
+                and canonical_url
+                and canonical_url == canonicalize_url(existing.url)
+            ) or is_unique_control_ticket_overlap(event, existing, schedule_counts):
+                if source_priority(event) > source_priority(existing):
+                    deduped[existing_index] = event
+                break
+        else:
+            deduped.append(event)
+    return deduped
+
+
+def control_feed_events(count: int, seed: int) -> list[Event]:
+    """Control, Eventbook and iaBilet listings sharing a few URLs and shows."""
+    rng = random.Random(seed)
+    start = datetime(2026, 9, 1, 19, 0)
+    events = []
+    for _ in range(count):
+        title = rng.choice(["Mogwai", "Low", "Slowdive", "Tinariwen"])
+        if rng.random() < 0.3:
+            title = f"LIVE: {title} (UK)"
+        events.append(Event(
+            title=title,
+            artist=None,
+            venue=rng.choice(["Control Club", "Control Club Room 2", "Quantic"]),
+            date=start + timedelta(days=rng.randrange(3), minutes=rng.choice([0, 30, 120])),
+            url=rng.choice([
+                "https://www.control-club.ro/event?id=1",
+                "https://control-club.ro/event/?id=1&utm_source=x",
+                "https://iabilet.ro/bilete-2",
+                "",
+            ]),
+            source=rng.choice(["control", "eventbook", "iabilet"]),
+            category="music",
+        ))
+    return events
+
+
+class TestCrossSourceIndex:
+    @pytest.mark.parametrize("seed", range(20))
+    def test_matches_scanning_every_kept_event(self, seed):
+        events = control_feed_events(60, seed)
+
+        assert dedup_preferred_cross_source(events) == scan_cross_source(events)
+
+
+class TestDuplicateClusters:
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_result_does_not_depend_on_input_order(self, seed):
+        events = synthetic_events(1500, seed=seed, days=20)
+        shuffled = events[:]
+        random.Random(seed).shuffle(shuffled)
+
+        result = dedup_similar(events)
+
+        assert len(result) < len(events)
+        assert sorted(map(repr, dedup_similar(shuffled))) == sorted(map(repr, result))
+
+    def test_busy_day_scored_in_chunks(self):
+        events = synthetic_events(700, seed=3, days=1)
+
+        with patch("services.dedup.SIMILARITY_ROW_CHUNK", 64):
+            result = dedup_similar(events, workers=1)
+
+        assert result == dedup_similar(events)
+
+    def test_matches_chain_into_one_cluster(self):
+        day = datetime(2026, 9, 5, 20, 0)
+        events = [
+            make_event("Robin and the Backstabbers", "Arenele Romane", day, "iabilet"),
+            make_event("Robin & Backstabbers", "Arenele Romane", day, "eventbook"),
+            make_event("Robin & the Backstabbers", "Arenele Romane", day, "control"),
+        ]
+
+        for ordering in (events, events[::-1], events[1:] + events[:1]):
+            assert dedup_similar(ordering) == [events[2]]
+
+    def test_date_only_listing_does_not_join_two_showtimes(self):
+        matinee = make_event(None, "TNB", datetime(2026, 9, 5, 11, 0), "tnb", "Hamlet")
+        evening = make_event(None, "TNB", datetime(2026, 9, 5, 19, 0), "tnb", "Hamlet")
+        date_only = make_event(None, "TNB", datetime(2026, 9, 5), "iabilet", "Hamlet")
+
+        assert dedup_similar([date_only, matinee, evening]) == [matinee, evening]
+        assert dedup_similar([evening, date_only, matinee]) == [evening, matinee]
+
+    def test_identical_rows_collapse_before_fuzzy_scoring(self):
+        day = datetime(2026, 9, 5, 20, 0)
+        repeated = [make_event("Mogwai", "Control", day, "control") for _ in range(4)]
+        other = make_event("Slowdive", "Control", day, "control")
+
+        with patch("services.dedup.process.cdist", wraps=process.cdist) as cdist:
+            result = dedup_similar(repeated + [other] + repeated)
+
+        assert result == [repeated[0], other]
+        assert result[0] is repeated[0]
+        for call in cdist.call_args_list:
+            assert len(call.args[0]) == 2
+
+
+class TestStreamingDedup:
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_matches_stage1_of_the_whole_run(self, seed):
+        events = synthetic_events(800, seed=seed, days=10) + control_feed_events(
+            200, seed
+        )
+        batches = [events[start:start + 90] for start in range(0, len(events), 90)]
+        arrival = list(enumerate(batches))
+        random.Random(seed).shuffle(arrival)
+
+        streaming = StreamingDedup()
+        for index, batch in arrival:
+            streaming.add(index, batch)
+
+        assert streaming.result() == stage1_dedup(events)
+
+    def test_empty_run(self):
+        streaming = StreamingDedup()
+        streaming.add(0, [])
+
+        assert streaming.result() == []
+
+
 class TestLLMDedup:
     def test_empty_list(self):
         assert llm_dedup([]) == []
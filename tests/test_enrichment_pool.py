@@ -0,0 +1,194 @@
+"""Unit tests for enriching events while scrapers are still running."""
+
+import threading
+from dataclasses import replace
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from models import Event
+from services.enrichment import (
+    EnrichmentPool,
+    enrich_event,
+    enrich_events,
+    enrichment_key,
+)
+from services.http import (
+    CIRCUIT_FAILURE_THRESHOLD,
+    HttpError,
+    fetch_page,
+    open_circuit_summary,
+    reset_circuit_breakers,
+)
+
+
+def make_event(title: str, category: str = "theatre") -> Event:
+    return Event(
+        title=title,
+        artist=None,
+        venue="Venue",
+        date=datetime(2099, 8, 15, 19, 0),
+        url=f"https://example.com/{title}",
+        source="bulandra",
+        category=category,
+    )
+
+
+def fake_details(event: Event) -> dict:
+    return {"description": f"About {event.title}", "image_url": None, "video_url": None}
+
+
+def test_pool_fetches_each_submitted_event_once():
+    with patch(
+        "services.enrichment.scrape_event_details", side_effect=fake_details
+    ) as scrape:
+        pool = EnrichmentPool(workers=2)
+        pool.submit([make_event("a"), make_event("b"), make_event("gig", "music")])
+        pool.submit([make_event("a")])
+        results = pool.finish()
+
+    assert sorted(details["description"] for details in results.values()) == [
+        "About a",
+        "About b",
+    ]
+    assert scrape.call_count == 2
+
+
+def test_pool_fetches_a_page_listed_by_several_sources_once():
+    listing = make_event("play")
+    resold = replace(
+        listing,
+        source="eventbook",
+        title="Play (eventbook)",
+        url="https://www.example.com/play/?utm_source=eventbook",
+    )
+
+    with patch(
+        "services.enrichment.scrape_event_details", side_effect=fake_details
+    ) as scrape:
+        pool = EnrichmentPool(workers=1)
+        pool.submit([listing, resold])
+        results = pool.finish()
+        enriched = enrich_events([resold], results)
+
+    scrape.assert_called_once_with(listing)
+    assert enriched[0].description == "About play"
+
+
+def test_ai_descriptions_wait_for_dedup():
+    kept, dropped = make_event("kept"), make_event("dropped")
+    no_description = {"description": None, "image_url": None, "video_url": None}
+
+    with (
+        patch(
+            "services.enrichment.scrape_event_details", return_value=no_description
+        ),
+        patch(
+            "services.enrichment.generate_ai_description", return_value="Written by AI"
+        ) as generate,
+    ):
+        pool = EnrichmentPool(workers=1)
+        pool.submit([kept, dropped])
+        prefetched = pool.finish()
+        generate.assert_not_called()
+
+        enriched = enrich_events([kept], prefetched)
+
+    generate.assert_called_once_with(kept)
+    assert enriched[0].description == "Written by AI"
+    assert enriched[0].description_source == "ai"
+
+
+def test_failed_detail_pages_cannot_open_the_scraper_circuit():
+    event = make_event("slow")
+    outage = HttpError("HTTP 503", status_code=503)
+    reset_circuit_breakers()
+    try:
+        with (
+            patch("services.enrichment.generate_ai_description", return_value=None),
+            patch("services.http._fetch_js", side_effect=outage),
+        ):
+            for _ in range(CIRCUIT_FAILURE_THRESHOLD + 2):
+                enrich_event(event)
+
+            assert open_circuit_summary(event.url) is None
+
+            # The same outage seen by a scraper's fetch does open it.
+            for _ in range(CIRCUIT_FAILURE_THRESHOLD):
+                with pytest.raises(HttpError):
+                    fetch_page(event.url, needs_js=True, record_failure=False)
+
+        assert open_circuit_summary(event.url) is not None
+    finally:
+        reset_circuit_breakers()
+
+
+def test_submit_blocks_while_the_queue_is_full():
+    release = threading.Event()
+    started = threading.Event()
+
+    def slow_details(event: Event) -> dict:
+        started.set()
+        release.wait(5)
+        return fake_details(event)
+
+    with patch("services.enrichment.scrape_event_details", side_effect=slow_details):
+        pool = EnrichmentPool(workers=1, maxsize=1)
+        pool.submit([make_event("first")])
+        started.wait(5)
+        pool.submit([make_event("queued")])
+        submitter = threading.Thread(
+            target=pool.submit,
+            args=([make_event("blocked")],),
+        )
+        submitter.start()
+        submitter.join(0.2)
+        assert submitter.is_alive()
+
+        release.set()
+        submitter.join(5)
+        results = pool.finish()
+
+    assert not submitter.is_alive()
+    assert len(results) == 3
+
+
+def test_enrich_events_reuses_prefetched_details():
+    kept = make_event("kept")
+    straggler = make_event("straggler")
+    prefetched = {enrichment_key(kept): fake_details(kept)}
+
+    with patch(
+        "services.enrichment.scrape_event_details", side_effect=fake_details
+    ) as scrape:
+        enriched = enrich_events([kept, straggler], prefetched)
+
+    assert [event.description for event in enriched] == [
+        "About kept",
+        "About straggler",
+    ]
+    scrape.assert_called_once_with(straggler)
+
+
+def test_cancel_drops_queued_events():
+    release = threading.Event()
+
+    def slow_details(event: Event) -> dict:
+        release.wait(5)
+        return fake_details(event)
+
+    with patch(
+        "services.enrichment.scrape_event_details", side_effect=slow_details
+    ) as scrape:
+        pool = EnrichmentPool(workers=1)
+        pool.submit([make_event(f"event-{index}") for index in range(5)])
+        canceller = threading.Thread(target=pool.cancel)
+        canceller.start()
+        while not pool._cancelled.is_set():
+            pass
+        release.set()
+        canceller.join(5)
+
+    assert not canceller.is_alive()
+    assert scrape.call_count <= 1
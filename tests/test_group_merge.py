@@ -10,24 +10,24 @@ def write_group_artifact(
     path,
     group: int,
     *,
+    groups: int | None = None,
     successful_sources: dict[str, list[str]] | None = None,
     music_events: list[dict] | None = None,
     theatre_events: list[dict] | None = None,
     culture_events: list[dict] | None = None,
 ) -> None:
-    path.write_text(
-        json.dumps(
-            {
-                "scraped_at": "2026-08-15T09:00:00",
-                "group": group,
-                "successful_sources": successful_sources
-                or {"music": [], "theatre": [], "culture": []},
-                "music_events": music_events or [],
-                "theatre_events": theatre_events or [],
-                "culture_events": culture_events or [],
-            }
-        )
-    )
+    artifact = {
+        "scraped_at": "2026-08-15T09:00:00",
+        "group": group,
+        "successful_sources": successful_sources
+        or {"music": [], "theatre": [], "culture": []},
+        "music_events": music_events or [],
+        "theatre_events": theatre_events or [],
+        "culture_events": culture_events or [],
+    }
+    if groups is not None:
+        artifact["groups"] = groups
+    path.write_text(json.dumps(artifact))
 
 
 def event(title: str, source: str, category: str = "culture") -> dict:
@@ -218,3 +218,91 @@ def test_merge_deduplicates_retained_first_party_and_fresh_ticket_rows(
         "jfr",
         "control",
     ]
+
+
+@pytest.fixture
+def merge_dirs(tmp_path, monkeypatch):
+    artifacts_dir = tmp_path / "artifacts"
+    data_dir = tmp_path / "data"
+    artifacts_dir.mkdir()
+    data_dir.mkdir()
+    events_file = data_dir / "events.json"
+    events_file.write_text(
+        json.dumps(
+            {
+                "scraped_at": "2026-08-14T09:00:00",
+                "music_events": [],
+                "theatre_events": [],
+                "culture_events": [event("Kept", "arcub")],
+            }
+        )
+    )
+    monkeypatch.setattr(main, "ARTIFACTS_DIR", artifacts_dir)
+    monkeypatch.setattr(main, "DATA_DIR", data_dir)
+    monkeypatch.setattr(main, "EVENTS_FILE", events_file)
+    return artifacts_dir, events_file
+
+
+def test_merge_discovers_any_number_of_shards(merge_dirs):
+    artifacts_dir, events_file = merge_dirs
+    for group in (1, 2, 3):
+        write_group_artifact(
+            artifacts_dir / f"events_group_{group}.json",
+            group=group,
+            groups=3,
+            successful_sources={
+                "music": [],
+                "theatre": [],
+                "culture": [f"source{group}"],
+            },
+            culture_events=[event(f"Shard {group}", f"source{group}")],
+        )
+
+    main.merge_group_artifacts()
+
+    merged = json.loads(events_file.read_text())
+    assert sorted(item["title"] for item in merged["culture_events"]) == [
+        "Kept",
+        "Shard 1",
+        "Shard 2",
+        "Shard 3",
+    ]
+
+
+def test_merge_refuses_when_the_last_shard_is_missing(merge_dirs):
+    artifacts_dir, events_file = merge_dirs
+    original = events_file.read_text()
+    for group in (1, 2, 3):
+        write_group_artifact(
+            artifacts_dir / f"events_group_{group}.json",
+            group=group,
+            groups=4,
+        )
+
+    with pytest.raises(ValueError, match="Refusing partial merge"):
+        main.merge_group_artifacts()
+
+    assert events_file.read_text() == original
+
+
+def test_merge_refuses_missing_shards_of_an_explicit_count(merge_dirs):
+    artifacts_dir, _ = merge_dirs
+    for group in (1, 2):
+        write_group_artifact(artifacts_dir / f"events_group_{group}.json", group=group)
+
+    with pytest.raises(FileNotFoundError, match="events_group_3.json"):
+        main.merge_group_artifacts(expected_groups=3)
+
+
+def test_streamed_events_file_matches_json_dump(tmp_path):
+    data = {
+        "scraped_at": "2026-08-15T09:00:00",
+        "music_events": [event("Ünicode", "control", "music")],
+        "theatre_events": [],
+        "culture_events": [event("A", "arcub"), event("B", "mnac")],
+    }
+    path = tmp_path / "events.json"
+
+    main.write_events_file(path, data)
+
+    assert path.read_text() == json.dumps(data, indent=2, default=str)
@@ -0,0 +1,210 @@
+"""Unit tests for recording and replaying runs through an HTTP archive."""
+
+import gzip
+from unittest.mock import patch
+
+import httpx
+import pytest
+import respx
+
+from services.http import (
+    CIRCUIT_FAILURE_THRESHOLD,
+    HttpError,
+    close_browser_pool,
+    close_http_clients,
+    disable_http_archive,
+    enable_http_archive,
+    fetch_many,
+    fetch_page,
+    get_fetch_failures,
+    get_http_client,
+    get_open_circuits,
+    reset_circuit_breakers,
+    reset_fetch_failures,
+)
+from services.http_archive import ArchiveMiss, HttpArchive, request_key
+
+
+@pytest.fixture
+def archive_path(tmp_path):
+    yield tmp_path / "run.har.jsonl.gz"
+    disable_http_archive()
+    close_http_clients()
+    close_browser_pool()
+
+
+def record(path, responses: dict[str, httpx.Response]) -> None:
+    enable_http_archive(path)
+    with respx.mock:
+        for url, response in responses.items():
+            respx.get(url).mock(return_value=response)
+        for url in responses:
+            try:
+                fetch_page(url)
+            except HttpError:
+                pass
+    disable_http_archive()
+
+
+def test_replay_serves_recorded_pages_without_the_network(archive_path):
+    record(
+        archive_path,
+        {
+            "https://example.com/events": httpx.Response(
+                200,
+                text="<html>Événements</html>",
+                headers={"Content-Type": "text/html; charset=utf-8"},
+            ),
+        },
+    )
+
+    enable_http_archive(archive_path, replay=True)
+    with respx.mock(assert_all_called=False) as network:
+        assert fetch_page("https://example.com/events") == "<html>Événements</html>"
+
+    assert network.calls.call_count == 0
+
+
+def test_replay_covers_the_async_client(archive_path):
+    record(
+        archive_path,
+        {"https://example.com/a": httpx.Response(200, text="A")},
+    )
+
+    enable_http_archive(archive_path, replay=True)
+    with respx.mock(assert_all_called=False):
+        assert fetch_many(["https://example.com/a"]) == ["A"]
+
+
+def test_replay_miss_fails_the_fetch_without_retrying(archive_path):
+    record(archive_path, {})
+
+    enable_http_archive(archive_path, replay=True)
+    reset_fetch_failures()
+    with pytest.raises(HttpError):
+        fetch_page("https://example.com/never-recorded")
+
+    assert get_fetch_failures() == [
+        "Failed to fetch https://example.com/never-recorded: "
+        "No archived response for https://example.com/never-recorded"
+    ]
+
+
+def test_recorded_error_statuses_replay_as_errors(archive_path):
+    record(
+        archive_path,
+        {"https://example.com/missing": httpx.Response(404)},
+    )
+
+    enable_http_archive(archive_path, replay=True)
+    with pytest.raises(HttpError) as exc_info:
+        fetch_page("https://example.com/missing")
+
+    assert exc_info.value.status_code == 404
+
+
+def test_post_bodies_are_part_of_the_key(archive_path):
+    enable_http_archive(archive_path)
+    with respx.mock:
+        respx.post("https://example.com/token", data={"a": "1"}).respond(
+            200, json={"token": "one"}
+        )
+        respx.post("https://example.com/token", data={"a": "2"}).respond(
+            200, json={"token": "two"}
+        )
+        client = get_http_client("https://example.com/token")
+        client.post("https://example.com/token", data={"a": "1"})
+        client.post("https://example.com/token", data={"a": "2"})
+    disable_http_archive()
+
+    enable_http_archive(archive_path, replay=True)
+    client = get_http_client("https://example.com/token")
+    response = client.post("https://example.com/token", data={"a": "2"})
+
+    assert response.json() == {"token": "two"}
+
+
+def test_rendered_pages_are_replayed_without_a_browser(archive_path):
+    enable_http_archive(archive_path)
+    with patch("services.http.sync_playwright") as mock_playwright:
+        playwright = mock_playwright.return_value.start.return_value
+        browser = playwright.chromium.launch.return_value
+        page = browser.new_context.return_value.new_page.return_value
+        page.content.return_value = "<html>Rendered</html>"
+        page.goto.return_value.status = 200
+        fetch_page("https://example.com/app", needs_js=True, wait_selector=".event")
+    close_browser_pool()
+    disable_http_archive()
+
+    enable_http_archive(archive_path, replay=True)
+    with patch("services.http.sync_playwright") as mock_playwright:
+        html = fetch_page(
+            "https://example.com/app",
+            needs_js=True,
+            wait_selector=".event",
+        )
+
+    assert html == "<html>Rendered</html>"
+    mock_playwright.assert_not_called()
+
+
+def test_archive_round_trips_binary_bodies(tmp_path):
+    path = tmp_path / "archive.jsonl.gz"
+    request = httpx.Request("GET", "https://example.com/blob")
+    archive = HttpArchive.record(path)
+    archive.store_exchange(
+        request,
+        httpx.Response(200, content=b"\xff\x00bytes", request=request),
+    )
+    archive.save()
+
+    replayed = HttpArchive.replay(path)
+
+    assert len(replayed) == 1
+    assert replayed.replay_exchange(request).content == b"\xff\x00bytes"
+    with pytest.raises(ArchiveMiss):
+        replayed.lookup(request_key("GET", "https://example.com/other"), "x")
+
+
+def test_replay_misses_do_not_open_the_circuit(archive_path):
+    record(
+        archive_path,
+        {"https://example.com/recorded": httpx.Response(200, text="Recorded")},
+    )
+
+    enable_http_archive(archive_path, replay=True)
+    reset_circuit_breakers()
+    for index in range(CIRCUIT_FAILURE_THRESHOLD + 1):
+        with pytest.raises(HttpError):
+            fetch_page(f"https://example.com/missing-{index}")
+
+    assert fetch_page("https://example.com/recorded") == "Recorded"
+    assert get_open_circuits() == {}
+
+
+def test_token_exchanges_are_recorded_without_the_token(archive_path):
+    token_url = "https://accounts.spotify.com/api/token"
+    enable_http_archive(archive_path)
+    with respx.mock:
+        respx.post(token_url).respond(
+            200, json={"access_token": "secret-token", "token_type": "Bearer"}
+        )
+        get_http_client(token_url).post(
+            token_url,
+            data={"grant_type": "client_credentials"},
+            auth=("client-id", "client-secret"),
+        )
+    disable_http_archive()
+
+    with gzip.open(archive_path, "rt", encoding="utf-8") as handle:
+        recorded = handle.read()
+    assert "secret-token" not in recorded
+    assert "client-secret" not in recorded
+
+    enable_http_archive(archive_path, replay=True)
+    response = get_http_client(token_url).post(
+        token_url,
+        data={"grant_type": "client_credentials"},
+        auth=("client-id", "client-secret"),
+    )
+    assert response.json() == {"access_token": "redacted", "token_type": "Bearer"}
@@ -0,0 +1,254 @@
+"""Unit tests for the asyncio fetch API and bounded fan-out helper."""
+
+import asyncio
+import threading
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import httpx
+import pytest
+import respx
+
+import services.http as http_service
+from services.http import (
+    HttpError,
+    afetch_page,
+    aclose_http_clients,
+    fetch_many,
+    get_fetch_failures,
+    reset_fetch_failures,
+)
+
+
+async def fetch_and_close(url: str, **kwargs) -> str:
+    try:
+        return await afetch_page(url, **kwargs)
+    finally:
+        await aclose_http_clients()
+
+
+@respx.mock
+def test_afetch_page_retries_transient_statuses():
+    route = respx.get("https://example.com")
+    route.side_effect = [
+        httpx.Response(503, text="Service down"),
+        httpx.Response(200, text="Back up"),
+    ]
+
+    assert asyncio.run(fetch_and_close("https://example.com")) == "Back up"
+    assert route.call_count == 2
+
+
+@respx.mock
+def test_afetch_page_records_terminal_failures():
+    respx.get("https://example.com/missing").respond(404)
+
+    reset_fetch_failures()
+    with pytest.raises(HttpError) as exc_info:
+        asyncio.run(fetch_and_close("https://example.com/missing"))
+
+    assert exc_info.value.status_code == 404
+    assert get_fetch_failures() == ["HTTP 404 for https://example.com/missing"]
+
+
+@respx.mock
+def test_async_reader_fallback_retries_through_reader():
+    respx.get("https://example.com/events").respond(200, text="<html></html>")
+    respx.get("https://r.jina.ai/https://example.com/events").respond(
+        200, text="<div class='event-marker'></div>"
+    )
+
+    async def run() -> str:
+        try:
+            return await http_service.afetch_page_with_reader_fallback(
+                "https://example.com/events",
+                expected_text="event-marker",
+            )
+        finally:
+            await aclose_http_clients()
+
+    assert "event-marker" in asyncio.run(run())
+    assert respx.calls.last.request.headers["X-Return-Format"] == "html"
+
+
+@respx.mock
+def test_fetch_many_returns_results_in_input_order():
+    respx.get("https://example.com/1").respond(200, text="one")
+    respx.get("https://example.com/2").respond(404)
+    respx.get("https://example.com/3").respond(200, text="three")
+
+    reset_fetch_failures()
+    results = fetch_many(
+        [
+            "https://example.com/1",
+            "https://example.com/2",
+            "https://example.com/3",
+        ],
+        concurrency=2,
+    )
+
+    assert results[0] == "one"
+    assert isinstance(results[1], HttpError)
+    assert results[1].status_code == 404
+    assert results[2] == "three"
+    assert get_fetch_failures() == ["HTTP 404 for https://example.com/2"]
+
+
+def test_fetch_many_bounds_requests_in_flight():
+    in_flight = 0
+    peak = 0
+
+    async def slow_fetch(url: str, **kwargs) -> str:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return url
+
+    urls = [f"https://example.com/{index}" for index in range(10)]
+    with patch("services.http.afetch_page", side_effect=slow_fetch):
+        results = fetch_many(urls, concurrency=3)
+
+    assert results == urls
+    assert peak == 3
+
+
+def test_fetch_many_rejects_non_positive_concurrency():
+    with pytest.raises(ValueError):
+        fetch_many(["https://example.com"], concurrency=0)
+
+
+def test_afetch_page_renders_js_through_async_browser_pool():
+    page = AsyncMock()
+    page.goto.return_value = Mock(status=200)
+    page.content.return_value = "<html>Rendered</html>"
+    context = AsyncMock()
+    context.new_page.return_value = page
+    browser = AsyncMock()
+    browser.is_connected = Mock(return_value=True)
+    browser.new_context.return_value = context
+    playwright = AsyncMock()
+    playwright.chromium.launch.return_value = browser
+    driver = MagicMock()
+    driver.start = AsyncMock(return_value=playwright)
+
+    with patch("services.http.async_playwright", return_value=driver):
+        results = fetch_many(
+            ["https://example.com/a", "https://example.com/b"],
+            needs_js=True,
+            wait_selector=".event",
+        )
+
+    assert results == ["<html>Rendered</html>", "<html>Rendered</html>"]
+    assert playwright.chromium.launch.await_count == 1
+    browser.new_context.assert_awaited_once_with(timezone_id="Europe/Bucharest")
+    page.wait_for_selector.assert_awaited_with(".event", timeout=30000)
+    browser.close.assert_awaited_once()
+    playwright.stop.assert_awaited_once()
+
+
+def test_thread_loops_keep_and_close_their_own_clients_and_browsers():
+    both_started = threading.Barrier(2)
+    first_closed = threading.Event()
+    held: dict[str, tuple] = {}
+    errors: list[BaseException] = []
+
+    async def use(name: str) -> None:
+        client = http_service._get_async_http_client("https://example.com")
+        pool = http_service.get_async_browser_pool()
+        held[name] = (client, pool)
+        await asyncio.to_thread(both_started.wait, 5)
+        if name == "second":
+            await asyncio.to_thread(first_closed.wait, 5)
+            # The other loop's close left this loop's entries alone.
+            assert http_service._get_async_http_client("https://example.com") is client
+            assert http_service.get_async_browser_pool() is pool
+        await aclose_http_clients()
+        await http_service.aclose_browser_pool()
+        if name == "first":
+            first_closed.set()
+
+    def run_loop(name: str) -> None:
+        try:
+            asyncio.run(use(name))
+        except BaseException as e:
+            errors.append(e)
+
+    with patch.object(
+        http_service.AsyncBrowserPool, "close", autospec=True
+    ) as close_pool:
+        threads = [
+            threading.Thread(target=run_loop, args=(name,))
+            for name in ("first", "second")
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+    assert errors == []
+    (first_client, first_pool), (second_client, second_pool) = (
+        held["first"],
+        held["second"],
+    )
+    assert first_client is not second_client
+    assert first_client.is_closed and second_client.is_closed
+    closed_pools = [call.args[0] for call in close_pool.await_args_list]
+    assert len(closed_pools) == 2
+    assert first_pool in closed_pools and second_pool in closed_pools
+    assert len(http_service._async_http_clients) == 0
+
+
+@respx.mock
+def test_fetch_many_works_after_a_sync_js_fetch():
+    respx.get("https://example.com/detail").respond(200, text="detail")
+    # Sync Playwright leaves an event loop running in the thread it started in.
+    playwright_loop = asyncio.new_event_loop()
+    playwright = MagicMock()
+    browser = playwright.chromium.launch.return_value
+    page = browser.new_context.return_value.new_page.return_value
+    page.content.return_value = "<html>Listing</html>"
+
+    def start_driver():
+        asyncio.events._set_running_loop(playwright_loop)
+        return playwright
+
+    try:
+        with patch("services.http.sync_playwright") as sync_playwright:
+            sync_playwright.return_value.start.side_effect = start_driver
+            listing = http_service.fetch_page("https://example.com/", needs_js=True)
+            details = fetch_many(["https://example.com/detail"])
+    finally:
+        asyncio.events._set_running_loop(None)
+        http_service.close_browser_pool()
+        playwright_loop.close()
+
+    assert listing == "<html>Listing</html>"
+    assert details == ["detail"]
+
+
+def test_async_render_clicks_load_more_until_the_button_is_gone():
+    page = AsyncMock()
+    page.goto.return_value = Mock(status=200)
+    page.content.return_value = "<html>All events</html>"
+    button = Mock()
+    button.is_visible = AsyncMock(side_effect=[True, True, False])
+    button.click = AsyncMock()
+    page.locator = Mock(return_value=Mock(first=button))
+    page.evaluate.side_effect = lambda script, *args: (
+        True if script is http_service._GROWTH_JS else 10
+    )
+    pool = MagicMock()
+    pool.page.return_value.__aenter__.return_value = page
+
+    with patch("services.http.get_async_browser_pool", return_value=pool):
+        html = asyncio.run(fetch_and_close(
+            "https://example.com/events",
+            needs_js=True,
+            click_selector=".load-more",
+            click_count=5,
+        ))
+
+    assert html == "<html>All events</html>"
+    assert button.click.await_count == 2
+    page.wait_for_load_state.assert_awaited_once()
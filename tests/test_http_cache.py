@@ -0,0 +1,155 @@
+"""Unit tests for the persistent HTTP response cache."""
+
+from unittest.mock import patch
+
+import httpx
+import pytest
+import respx
+
+from services.http import (
+    close_browser_pool,
+    close_http_clients,
+    disable_response_cache,
+    enable_response_cache,
+    fetch_context,
+    fetch_page,
+)
+from services.http_cache import ResponseCache, cache_key
+
+
+@pytest.fixture
+def response_cache(tmp_path):
+    cache = enable_response_cache(tmp_path / "cache")
+    yield cache
+    disable_response_cache()
+    close_http_clients()
+    close_browser_pool()
+
+
+@respx.mock
+def test_unchanged_page_is_revalidated_and_served_from_disk(response_cache):
+    route = respx.get("https://example.com/event")
+    route.side_effect = [
+        httpx.Response(200, text="<html>Event</html>", headers={"ETag": '"v1"'}),
+        httpx.Response(304),
+    ]
+
+    assert fetch_page("https://example.com/event") == "<html>Event</html>"
+    assert fetch_page("https://example.com/event") == "<html>Event</html>"
+
+    assert route.calls.last.request.headers["If-None-Match"] == '"v1"'
+
+
+@respx.mock
+def test_last_modified_is_sent_as_if_modified_since(response_cache):
+    stamp = "Wed, 14 Oct 2026 09:00:00 GMT"
+    route = respx.get("https://example.com/event")
+    route.side_effect = [
+        httpx.Response(200, text="old", headers={"Last-Modified": stamp}),
+        httpx.Response(200, text="new"),
+    ]
+
+    fetch_page("https://example.com/event")
+
+    assert fetch_page("https://example.com/event") == "new"
+    assert route.calls.last.request.headers["If-Modified-Since"] == stamp
+
+
+@respx.mock
+def test_fresh_entry_skips_the_network_within_ttl(response_cache):
+    route = respx.get("https://example.com/event").respond(200, text="body")
+
+    fetch_page("https://example.com/event", cache_ttl=3600)
+    assert fetch_page("https://example.com/event", cache_ttl=3600) == "body"
+
+    assert route.call_count == 1
+
+
+@respx.mock
+def test_scraper_ttl_applies_to_its_fetches_only(response_cache):
+    route = respx.get("https://example.com/event").respond(200, text="body")
+
+    with fetch_context("festival", cache_ttl=3600):
+        fetch_page("https://example.com/event")
+        assert fetch_page("https://example.com/event") == "body"
+    assert route.call_count == 1
+
+    fetch_page("https://example.com/event")
+    assert route.call_count == 2
+
+
+@respx.mock
+def test_cache_hits_are_counted_for_the_scraper(response_cache):
+    route = respx.get("https://example.com/event")
+    route.side_effect = [
+        httpx.Response(200, text="body", headers={"ETag": '"v1"'}),
+        httpx.Response(304),
+    ]
+
+    with fetch_context("cached") as fetches:
+        fetch_page("https://example.com/event")
+        fetch_page("https://example.com/event")
+        fetch_page("https://example.com/event", cache_ttl=3600)
+
+    assert fetches.cache_hits == 2
+    assert fetches.http_requests == 2
+
+
+@respx.mock
+def test_pages_without_validators_are_not_cached_by_default(response_cache):
+    route = respx.get("https://example.com/event").respond(200, text="body")
+
+    fetch_page("https://example.com/event")
+    fetch_page("https://example.com/event")
+
+    assert route.call_count == 2
+    assert "If-None-Match" not in route.calls.last.request.headers
+
+
+def test_rendered_pages_are_reused_only_within_ttl(response_cache):
+    with patch("services.http._fetch_js", return_value="<html>JS</html>") as fetch:
+        fetch_page("https://example.com/app", needs_js=True, cache_ttl=60)
+        fetch_page("https://example.com/app", needs_js=True, cache_ttl=60)
+        fetch_page("https://example.com/app", needs_js=True, scroll_count=5)
+
+    assert fetch.call_count == 2
+
+
+def test_cache_key_depends_on_headers_and_render_mode():
+    url = "https://example.com"
+
+    assert cache_key(url, None, "http") != cache_key(url, None, "js")
+    assert cache_key(url, None, "http") != cache_key(
+        url, {"X-Return-Format": "html"}, "http"
+    )
+    assert cache_key(url, {"A": "1", "B": "2"}, "http") == cache_key(
+        url, {"B": "2", "A": "1"}, "http"
+    )
+
+
+def test_least_recently_used_entries_are_evicted_first(tmp_path):
+    cache = ResponseCache(tmp_path, max_bytes=10)
+    cache.put("a", "https://example.com/a", "aaaa")
+    cache.put("b", "https://example.com/b", "bbbb")
+    cache.get("a")
+
+    cache.put("c", "https://example.com/c", "cccc")
+
+    assert cache.get("b") is None
+    assert cache.get("a").body == "aaaa"
+    assert cache.get("c").body == "cccc"
+    assert cache.total_bytes() == 8
+    cache.close()
+
+
+def test_cache_persists_across_instances(tmp_path):
+    cache = ResponseCache(tmp_path)
+    cache.put("key", "https://example.com", "body", etag='"v1"')
+    cache.close()
+
+    reopened = ResponseCache(tmp_path)
+    entry = reopened.get("key")
+
+    assert entry.body == "body"
+    assert entry.validators() == {"If-None-Match": '"v1"'}
+    reopened.close()
@@ -1,5 +1,6 @@
 """Unit tests for HTTP retry logic."""
 
+import re
 from unittest.mock import Mock, patch
 
 import httpx
@@ -8,13 +9,59 @@ import respx
 import services.http as http_service
 
 from services.http import (
+    BrowserPool,
+    close_browser_pool,
+    close_http_clients,
+    fetch_context,
     fetch_page,
+    fetch_page_responses,
+    get_host_limiter,
+    get_http_client,
+    HostLimiter,
+    RateLimit,
+    is_circuit_open,
+    reset_circuit_breakers,
+    reset_rate_limits,
+    set_rate_limit,
     get_fetch_failures,
     HttpError,
     reset_fetch_failures,
 )
 
 
+@pytest.fixture(autouse=True)
+def shared_browser_pool():
+    close_browser_pool()
+    yield
+    close_browser_pool()
+
+
+@pytest.fixture(autouse=True)
+def host_rate_limits():
+    reset_rate_limits()
+    yield
+    reset_rate_limits()
+
+
+@pytest.fixture(autouse=True)
+def circuit_breakers():
+    reset_circuit_breakers()
+    yield
+    reset_circuit_breakers()
+
+
+@pytest.fixture(autouse=True)
+def shared_http_clients():
+    close_http_clients()
+    yield
+    close_http_clients()
+
+
+def launched_browser(mock_playwright):
+    playwright = mock_playwright.return_value.start.return_value
+    return playwright.chromium.launch.return_value
+
+
 class TestHttpRetry:
     """Test exponential backoff retry behavior."""
 
@@ -124,8 +171,8 @@ class TestHttpRetry:
     def test_js_fetch_waits_for_requested_selector(self):
         """Should wait for asynchronous page content before reading the HTML."""
         with patch("services.http.sync_playwright") as mock_playwright:
-            playwright = mock_playwright.return_value.__enter__.return_value
-            page = playwright.chromium.launch.return_value.new_page.return_value
+            browser = launched_browser(mock_playwright)
+            page = browser.new_context.return_value.new_page.return_value
             page.content.return_value = "<div class='events-list-view'></div>"
 
             result = fetch_page(
@@ -141,20 +188,20 @@ class TestHttpRetry:
 
     def test_js_fetch_renders_bucharest_local_times(self):
         with patch("services.http.sync_playwright") as mock_playwright:
-            playwright = mock_playwright.return_value.__enter__.return_value
-            browser = playwright.chromium.launch.return_value
-            browser.new_page.return_value.content.return_value = "<html></html>"
+            browser = launched_browser(mock_playwright)
+            page = browser.new_context.return_value.new_page.return_value
+            page.content.return_value = "<html></html>"
 
             fetch_page("https://example.com/events", needs_js=True)
 
-        browser.new_page.assert_called_once_with(
+        browser.new_context.assert_called_once_with(
             timezone_id="Europe/Bucharest",
         )
 
     def test_js_fetch_rejects_http_error_pages(self):
         with patch("services.http.sync_playwright") as mock_playwright:
-            playwright = mock_playwright.return_value.__enter__.return_value
-            page = playwright.chromium.launch.return_value.new_page.return_value
+            browser = launched_browser(mock_playwright)
+            page = browser.new_context.return_value.new_page.return_value
             page.goto.return_value.status = 403
 
             reset_fetch_failures()
@@ -168,8 +215,8 @@ class TestHttpRetry:
 
     def test_js_fetch_retries_transient_http_statuses(self):
         with patch("services.http.sync_playwright") as mock_playwright:
-            playwright = mock_playwright.return_value.__enter__.return_value
-            page = playwright.chromium.launch.return_value.new_page.return_value
+            browser = launched_browser(mock_playwright)
+            page = browser.new_context.return_value.new_page.return_value
             page.goto.side_effect = [Mock(status=503), Mock(status=200)]
             page.content.return_value = "<html>Recovered</html>"
 
@@ -214,3 +261,656 @@ class TestHttpRetry:
 
         assert "event-marker" in result
         assert respx.calls.call_count == 1
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestRateLimiting:
+    """Test per-host politeness and Retry-After handling."""
+
+    @respx.mock
+    def test_retry_after_seconds_replaces_exponential_backoff(self):
+        route = respx.get("https://example.com")
+        route.side_effect = [
+            httpx.Response(429, headers={"Retry-After": "0"}),
+            httpx.Response(200, text="Success"),
+        ]
+
+        with patch("tenacity.nap.time.sleep") as sleep:
+            assert fetch_page("https://example.com") == "Success"
+
+        sleep.assert_called_once_with(0.0)
+
+    def test_retry_after_is_capped(self):
+        request = httpx.Request("GET", "https://example.com")
+        response = httpx.Response(
+            503,
+            headers={"Retry-After": "86400"},
+            request=request,
+        )
+        error = httpx.HTTPStatusError("down", request=request, response=response)
+
+        assert http_service._retry_after_for(error) == (
+            http_service.MAX_RETRY_AFTER_SECONDS
+        )
+
+    def test_retry_after_http_date_is_parsed(self):
+        assert http_service._parse_retry_after(
+            "Wed, 21 Oct 2015 07:28:00 GMT"
+        ) == 0.0
+        assert http_service._parse_retry_after("soon") is None
+
+    def test_token_bucket_spaces_requests_after_burst(self):
+        clock = FakeClock()
+        limiter = HostLimiter(
+            RateLimit(requests_per_second=2.0, burst=2, max_in_flight=10),
+            clock=clock,
+        )
+
+        assert limiter.try_acquire() == 0.0
+        assert limiter.try_acquire() == 0.0
+        assert limiter.try_acquire() == pytest.approx(0.5)
+
+        clock.now += 0.5
+        assert limiter.try_acquire() == 0.0
+
+    def test_in_flight_cap_waits_for_release(self):
+        limiter = HostLimiter(
+            RateLimit(requests_per_second=100.0, burst=10, max_in_flight=1),
+            clock=FakeClock(),
+        )
+
+        assert limiter.try_acquire() == 0.0
+        assert limiter.try_acquire() > 0
+        limiter.release()
+        assert limiter.try_acquire() == 0.0
+
+    def test_defer_blocks_the_host(self):
+        clock = FakeClock()
+        limiter = HostLimiter(RateLimit(requests_per_second=10.0), clock=clock)
+
+        limiter.defer(30)
+
+        assert limiter.try_acquire() == pytest.approx(30)
+
+    def test_limiters_are_shared_per_hostname(self):
+        set_rate_limit(
+            "https://www.iabilet.ro/bilete-in-bucuresti/",
+            RateLimit(requests_per_second=1.0, max_in_flight=1),
+        )
+
+        limiter = get_host_limiter("https://iabilet.ro/event/123")
+
+        assert limiter is get_host_limiter("https://www.iabilet.ro/?page=2")
+        assert limiter.limit.max_in_flight == 1
+        assert get_host_limiter(
+            "https://r.jina.ai/https://iabilet.ro/"
+        ).limit == http_service.HOST_RATE_LIMITS["r.jina.ai"]
+
+    def test_scraper_rate_limit_is_registered_for_its_host(self):
+        from main import run_scraper_safely
+        from scrapers.music import iabilet
+
+        with patch.object(iabilet, "scrape", return_value=[]):
+            run_scraper_safely(iabilet)
+
+        assert get_host_limiter(iabilet.EVENTS_URL).limit == iabilet.RATE_LIMIT
+
+
+class TestCircuitBreaker:
+    """Test that a dead host stops consuming retries."""
+
+    @respx.mock
+    def test_open_circuit_fails_fast_with_one_summary(self):
+        route = respx.get(url__startswith="https://down.example.com/")
+        route.side_effect = httpx.ConnectError("Connection refused")
+        threshold = http_service.CIRCUIT_FAILURE_THRESHOLD
+
+        reset_fetch_failures()
+        with patch("tenacity.nap.time.sleep"):
+            for index in range(threshold + 3):
+                with pytest.raises(HttpError):
+                    fetch_page(f"https://down.example.com/{index}")
+
+        assert route.call_count == threshold * http_service.MAX_RETRIES
+        assert is_circuit_open("https://down.example.com/")
+        failures = get_fetch_failures()
+        assert len(failures) == threshold + 1
+        assert failures[-1].startswith("Circuit open for down.example.com")
+
+    @respx.mock
+    def test_client_errors_and_successes_keep_the_circuit_closed(self):
+        route = respx.get(url__startswith="https://up.example.com/")
+        route.side_effect = [httpx.Response(404)] * 10 + [
+            httpx.Response(200, text="ok")
+        ]
+
+        for index in range(10):
+            with pytest.raises(HttpError):
+                fetch_page(f"https://up.example.com/{index}")
+
+        assert fetch_page("https://up.example.com/ok") == "ok"
+        assert not is_circuit_open("https://up.example.com/")
+
+    def test_scraper_for_an_open_host_is_skipped(self):
+        from main import run_scraper_safely, scraper_errors
+        from scrapers.theatre import eventbook as eventbook_theatre
+
+        breaker = http_service._circuit_breaker(eventbook_theatre.EVENTS_URL)
+        for _ in range(breaker.threshold):
+            breaker.record_failure()
+        scraper_errors.clear()
+
+        with patch.object(eventbook_theatre, "scrape") as scrape:
+            assert run_scraper_safely(eventbook_theatre) == []
+
+        scrape.assert_not_called()
+        assert scraper_errors[0].error_message.startswith(
+            "Skipped: Circuit open for eventbook.ro"
+        )
+
+
+class TestHttpClientPool:
+    """Test the shared keep-alive clients used by plain HTTP fetches."""
+
+    def test_client_is_shared_per_host(self):
+        first = get_http_client("https://www.iabilet.ro/bilete-in-bucuresti/")
+        second = get_http_client("https://WWW.IABILET.RO/?page=2")
+        other = get_http_client("https://eventbook.ro/city/bucuresti")
+
+        assert first is second
+        assert first is not other
+
+    @respx.mock
+    def test_fetch_page_reuses_the_host_client(self):
+        respx.get("https://example.com/a").respond(200, text="A")
+        respx.get("https://example.com/b").respond(200, text="B")
+
+        with patch(
+            "services.http.httpx.Client",
+            wraps=http_service.httpx.Client,
+        ) as client_factory:
+            assert fetch_page("https://example.com/a") == "A"
+            assert fetch_page("https://example.com/b") == "B"
+
+        assert client_factory.call_count == 1
+
+    def test_close_http_clients_closes_and_forgets_clients(self):
+        client = get_http_client("https://example.com")
+
+        close_http_clients()
+
+        assert client.is_closed
+        assert get_http_client("https://example.com") is not client
+
+
+class TestLoadMoreCompletion:
+    """Test event-driven completion of scroll and click interactions."""
+
+    def scrolling_page(self, mock_playwright, growth_results):
+        browser = launched_browser(mock_playwright)
+        page = browser.new_context.return_value.new_page.return_value
+        page.content.return_value = "<html></html>"
+        results = iter(growth_results)
+
+        def evaluate(script, arg=None):
+            if script is http_service._GROWTH_JS:
+                return next(results)
+            return 0
+
+        page.evaluate.side_effect = evaluate
+        return page
+
+    def growth_calls(self, page):
+        return [
+            call for call in page.evaluate.call_args_list
+            if call.args[0] is http_service._GROWTH_JS
+        ]
+
+    def test_scroll_stops_once_the_item_count_stops_growing(self):
+        with patch("services.http.sync_playwright") as mock_playwright:
+            page = self.scrolling_page(
+                mock_playwright, [True, True, False, False, False, True]
+            )
+
+            fetch_page(
+                "https://example.com/events",
+                needs_js=True,
+                scroll_count=50,
+                scroll_item_selector='a[href*="/hub/event/"]',
+            )
+
+        growth_calls = self.growth_calls(page)
+        assert len(growth_calls) == 5
+        assert growth_calls[0].args[1][0] == 'a[href*="/hub/event/"]'
+        page.wait_for_timeout.assert_not_called()
+        page.wait_for_load_state.assert_called_once_with(
+            "networkidle", timeout=http_service.JS_SETTLE_TIMEOUT_MS
+        )
+
+    def test_exhausted_budget_returns_the_page_as_loaded(self):
+        with patch("services.http.sync_playwright") as mock_playwright:
+            page = self.scrolling_page(mock_playwright, [True] * 50)
+
+            result = fetch_page(
+                "https://example.com/events",
+                needs_js=True,
+                scroll_count=50,
+                interaction_budget_ms=0,
+            )
+
+        assert result == "<html></html>"
+        assert self.growth_calls(page) == []
+
+    def test_click_loop_stops_when_button_disappears(self):
+        with patch("services.http.sync_playwright") as mock_playwright:
+            page = self.scrolling_page(mock_playwright, [True, True])
+            button = page.locator.return_value.first
+            button.is_visible.side_effect = [True, True, False]
+
+            fetch_page(
+                "https://example.com/concerts",
+                needs_js=True,
+                click_selector=".load-more",
+                click_count=20,
+            )
+
+        assert button.click.call_count == 2
+        assert len(self.growth_calls(page)) == 2
+
+    def test_growth_timeout_adapts_to_observed_latency(self):
+        waiter = http_service._GrowthWaiter(budget_ms=60000)
+
+        waiter.record(True, elapsed_ms=100)
+        assert waiter.next_timeout_ms() == http_service.GROWTH_MIN_TIMEOUT_MS
+
+        waiter.record(True, elapsed_ms=1000)
+        assert waiter.next_timeout_ms() == 3000
+
+        waiter.record(False, elapsed_ms=3000)
+        assert waiter.next_timeout_ms() == http_service.GROWTH_MAX_TIMEOUT_MS
+        waiter.record(False, elapsed_ms=5000)
+        waiter.record(False, elapsed_ms=5000)
+        assert waiter.exhausted
+
+    def test_slow_growth_after_a_fast_round_keeps_scrolling(self):
+        growth_rounds = 0
+
+        def growth_within(timeout_ms: int) -> bool:
+            # Two quick rounds, then items take 1.2s to appear after a scroll.
+            nonlocal growth_rounds
+            growth_rounds += 1
+            return growth_rounds <= 2 or timeout_ms >= 1200
+
+        with patch("services.http.sync_playwright") as mock_playwright:
+            page = self.scrolling_page(mock_playwright, [])
+            page.evaluate.side_effect = lambda script, arg=None: (
+                growth_within(arg[2]) if script is http_service._GROWTH_JS else 0
+            )
+
+            fetch_page("https://example.com/events", needs_js=True, scroll_count=10)
+
+        timeouts = [call.args[1][2] for call in self.growth_calls(page)]
+        assert len(timeouts) == 10
+        assert timeouts[2] == http_service.GROWTH_MIN_TIMEOUT_MS
+        assert timeouts[3] == 2 * http_service.GROWTH_MIN_TIMEOUT_MS
+
+
+class TestResponseCapture:
+    """Test recording XHR/JSON responses while rendering."""
+
+    def fake_response(self, url, body, status=200):
+        response = Mock(url=url, status=status)
+        response.text.return_value = body
+        return response
+
+    def rendering_page(self, mock_playwright, responses):
+        browser = launched_browser(mock_playwright)
+        page = browser.new_context.return_value.new_page.return_value
+        page.content.return_value = "<html>App</html>"
+        handlers = []
+        page.on.side_effect = lambda event, handler: handlers.append(handler)
+
+        def goto(url, **kwargs):
+            for response in responses:
+                for handler in handlers:
+                    handler(response)
+            return Mock(status=200)
+
+        page.goto.side_effect = goto
+        return page
+
+    def test_matching_responses_are_returned_with_the_html(self):
+        feed = self.fake_response(
+            "https://api.example.com/v1/events?page=1", '{"events": [1, 2]}'
+        )
+        script = self.fake_response("https://example.com/app.js", "var x;")
+        with patch("services.http.sync_playwright") as mock_playwright:
+            self.rendering_page(mock_playwright, [script, feed])
+
+            rendered = fetch_page_responses(
+                "https://example.com/events",
+                capture=["*/v1/events*"],
+            )
+
+        assert rendered.html == "<html>App</html>"
+        assert [response.url for response in rendered.responses] == [feed.url]
+        assert rendered.json_bodies() == [{"events": [1, 2]}]
+
+    def test_regex_patterns_and_unreadable_bodies(self):
+        feed = self.fake_response("https://example.com/graphql", "not json")
+        redirect = self.fake_response("https://example.com/graphql?r=1", "")
+        redirect.text.side_effect = Exception("Response body is unavailable")
+        with patch("services.http.sync_playwright") as mock_playwright:
+            self.rendering_page(mock_playwright, [feed, redirect])
+
+            rendered = fetch_page_responses(
+                "https://example.com/events",
+                capture=[re.compile(r"/graphql")],
+            )
+
+        assert [response.url for response in rendered.responses] == [feed.url]
+        assert rendered.json_bodies() == []
+
+    def test_plain_fetch_does_not_listen_for_responses(self):
+        with patch("services.http.sync_playwright") as mock_playwright:
+            page = self.rendering_page(mock_playwright, [])
+
+            fetch_page("https://example.com/events", needs_js=True)
+
+        page.on.assert_not_called()
+
+
+class TestFetchContext:
+    """Test attribution of fetch activity to the scraper that issued it."""
+
+    @respx.mock
+    def test_requests_bytes_and_retries_are_counted(self):
+        route = respx.get("https://example.com/events")
+        route.side_effect = [
+            httpx.Response(503),
+            httpx.Response(200, text="12345"),
+        ]
+
+        with (
+            patch.object(http_service._fetch_http.retry, "sleep", lambda _: None),
+            fetch_context("example") as fetches,
+        ):
+            fetch_page("https://example.com/events")
+
+        assert fetches.name == "example"
+        assert fetches.http_requests == 2
+        assert fetches.bytes_received == 5
+        assert fetches.failures == []
+        assert fetches.fetch_seconds >= 0
+
+    @respx.mock
+    def test_reader_fallbacks_and_retries_are_counted(self):
+        respx.get("https://example.com/page").respond(200, text="<html></html>")
+        reader = respx.get(f"{http_service.HTML_READER_BASE_URL}https://example.com/page")
+        reader.side_effect = [
+            httpx.Response(502),
+            httpx.Response(200, text="<div class='event'></div>"),
+        ]
+
+        with (
+            patch.object(http_service._fetch_http.retry, "sleep", lambda _: None),
+            fetch_context("fallback") as fetches,
+        ):
+            http_service.fetch_page_with_reader_fallback(
+                "https://example.com/page", "class='event'"
+            )
+
+        assert fetches.reader_fallbacks == 1
+        assert fetches.retries == 1
+        assert fetches.http_requests == 3
+
+    @respx.mock
+    def test_concurrent_scrapers_keep_their_own_failures(self):
+        import threading
+
+        respx.get("https://example.com/ok").respond(200, text="ok")
+        respx.get("https://example.com/missing").respond(404)
+        both_started = threading.Barrier(2, timeout=5)
+        contexts = {}
+
+        def scrape(name, url):
+            with fetch_context(name) as fetches:
+                both_started.wait()
+                try:
+                    fetch_page(url)
+                except http_service.HttpError:
+                    pass
+                contexts[name] = fetches
+
+        threads = [
+            threading.Thread(target=scrape, args=("ok", "https://example.com/ok")),
+            threading.Thread(
+                target=scrape,
+                args=("broken", "https://example.com/missing"),
+            ),
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert contexts["ok"].failures == []
+        assert contexts["broken"].failures == [
+            "HTTP 404 for https://example.com/missing"
+        ]
+
+    @respx.mock
+    def test_async_fan_out_reports_to_the_enclosing_scraper(self):
+        respx.get("https://example.com/1").respond(200, text="a")
+        respx.get("https://example.com/2").respond(200, text="bb")
+
+        with fetch_context("fan-out") as fetches:
+            http_service.fetch_many(
+                ["https://example.com/1", "https://example.com/2"]
+            )
+
+        assert fetches.http_requests == 2
+        assert fetches.bytes_received == 3
+
+    def test_context_is_restored_after_the_block(self):
+        outer = http_service.current_fetch_context()
+        with fetch_context("inner") as inner:
+            assert http_service.current_fetch_context() is inner
+        assert http_service.current_fetch_context() is outer
+
+
+class TestTimeBudget:
+    """Test that a scraper's time budget bounds every fetch it makes."""
+
+    @respx.mock
+    def test_fetches_after_the_deadline_fail_fast(self):
+        route = respx.get("https://example.com/late").respond(200, text="late")
+
+        with fetch_context("slow", time_budget=0) as fetches:
+            with pytest.raises(HttpError, match="Time budget of 0s exhausted"):
+                fetch_page("https://example.com/late")
+
+        assert route.call_count == 0
+        assert fetches.budget_exhausted
+        assert not is_circuit_open("https://example.com/late")
+
+    @respx.mock
+    def test_requests_are_cut_to_the_remaining_budget(self):
+        route = respx.get("https://example.com/events").respond(200, text="ok")
+
+        with fetch_context("tight", time_budget=5):
+            fetch_page("https://example.com/events")
+
+        timeout = route.calls.last.request.extensions["timeout"]
+        assert 0 < timeout["read"] <= 5
+
+    @respx.mock
+    def test_retries_stop_when_backoff_would_outlast_the_budget(self):
+        route = respx.get("https://example.com/busy").respond(
+            503,
+            headers={"Retry-After": "30"},
+        )
+
+        with fetch_context("busy", time_budget=10) as fetches:
+            with pytest.raises(HttpError):
+                fetch_page("https://example.com/busy")
+
+        assert route.call_count == 1
+        assert fetches.failures == ["HTTP 503 for https://example.com/busy"]
+
+    def test_rendered_page_timeouts_fit_the_budget(self):
+        with patch("services.http.sync_playwright") as mock_playwright:
+            browser = launched_browser(mock_playwright)
+            page = browser.new_context.return_value.new_page.return_value
+            page.content.return_value = "<html></html>"
+            page.goto.return_value.status = 200
+
+            with fetch_context("rendered", time_budget=2):
+                fetch_page("https://example.com/app", needs_js=True, timeout=30000)
+
+        assert page.goto.call_args.kwargs["timeout"] <= 2000
+
+    def test_no_budget_leaves_timeouts_alone(self):
+        with fetch_context("unbounded") as fetches:
+            assert http_service._clamp_timeout_ms(30000) == 30000
+            assert http_service._request_timeout() == http_service.HTTP_TIMEOUT_SECONDS
+        assert fetches.remaining_seconds() is None
+
+
+class TestResourceBlocking:
+    """Test request interception for Playwright fetches."""
+
+    @pytest.mark.parametrize("resource_type", ["image", "media", "font", "stylesheet"])
+    def test_heavy_resources_are_blocked_by_default(self, resource_type):
+        assert http_service._is_blocked_request(
+            resource_type, "https://example.com/asset", frozenset()
+        )
+
+    def test_documents_and_scripts_load(self):
+        for resource_type in ("document", "script", "xhr", "fetch"):
+            assert not http_service._is_blocked_request(
+                resource_type, "https://example.com/app", frozenset()
+            )
+
+    def test_scrapers_can_opt_resource_types_back_in(self):
+        assert not http_service._is_blocked_request(
+            "stylesheet", "https://example.com/site.css", frozenset({"stylesheet"})
+        )
+
+    def test_tracker_domains_are_blocked_for_every_type(self):
+        assert http_service._is_blocked_request(
+            "script",
+            "https://www.googletagmanager.com/gtag/js?id=G-1",
+            frozenset({"script"}),
+        )
+        assert not http_service._is_blocked_request(
+            "script", "https://notgoogletagmanager.com/app.js", frozenset()
+        )
+
+    def test_js_fetch_routes_requests_through_the_blocker(self):
+        with patch("services.http.sync_playwright") as mock_playwright:
+            browser = launched_browser(mock_playwright)
+            page = browser.new_context.return_value.new_page.return_value
+            page.content.return_value = "<html></html>"
+
+            fetch_page(
+                "https://example.com/events",
+                needs_js=True,
+                allow_resource_types={"font"},
+            )
+
+        pattern, handler = page.route.call_args.args
+        assert pattern == "**/*"
+        image = Mock()
+        image.request.resource_type = "image"
+        image.request.url = "https://example.com/poster.jpg"
+        handler(image)
+        image.abort.assert_called_once()
+        font = Mock()
+        font.request.resource_type = "font"
+        font.request.url = "https://example.com/font.woff2"
+        handler(font)
+        font.continue_.assert_called_once()
+
+
+class TestBrowserPool:
+    """Test the shared Playwright browser used by JS fetches."""
+
+    def test_js_fetches_share_one_browser_launch(self):
+        with patch("services.http.sync_playwright") as mock_playwright:
+            browser = launched_browser(mock_playwright)
+            context = browser.new_context.return_value
+            context.new_page.return_value.content.return_value = "<html></html>"
+
+            fetch_page("https://example.com/a", needs_js=True)
+            fetch_page("https://example.com/b", needs_js=True)
+
+        playwright = mock_playwright.return_value.start.return_value
+        assert playwright.chromium.launch.call_count == 1
+        assert browser.new_context.call_count == 1
+        assert context.new_page.return_value.close.call_count == 2
+
+    def test_context_is_recycled_after_max_navigations(self):
+        with patch("services.http.sync_playwright") as mock_playwright:
+            browser = launched_browser(mock_playwright)
+            pool = BrowserPool(max_pages=2, max_navigations=2)
+
+            for _ in range(3):
+                with pool.page():
+                    pass
+
+        assert browser.new_context.call_count == 2
+        assert browser.new_context.return_value.close.call_count == 1
+
+    def test_contexts_are_keyed_by_extra_headers(self):
+        with patch("services.http.sync_playwright") as mock_playwright:
+            browser = launched_browser(mock_playwright)
+            pool = BrowserPool()
+
+            with pool.page():
+                pass
+            with pool.page({"X-Return-Format": "html"}):
+                pass
+
+        assert browser.new_context.call_args_list[1].kwargs == {
+            "timezone_id": "Europe/Bucharest",
+            "extra_http_headers": {"X-Return-Format": "html"},
+        }
+
+    def test_pool_refuses_more_than_max_open_pages(self):
+        with patch("services.http.sync_playwright"):
+            pool = BrowserPool(max_pages=1)
+
+            with pool.page():
+                with pytest.raises(HttpError, match="exhausted"):
+                    with pool.page():
+                        pass
+
+    def test_failed_page_discards_its_context(self):
+        with patch("services.http.sync_playwright") as mock_playwright:
+            browser = launched_browser(mock_playwright)
+            pool = BrowserPool()
+
+            with pytest.raises(RuntimeError):
+                with pool.page():
+                    raise RuntimeError("Target closed")
+
+        browser.new_context.return_value.close.assert_called_once()
+
+    def test_close_shuts_down_browser_and_driver(self):
+        with patch("services.http.sync_playwright") as mock_playwright:
+            browser = launched_browser(mock_playwright)
+            fetch_page("https://example.com/a", needs_js=True)
+
+            close_browser_pool()
+
+        playwright = mock_playwright.return_value.start.return_value
+        browser.close.assert_called_once()
+        playwright.stop.assert_called_once()
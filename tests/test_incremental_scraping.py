@@ -0,0 +1,135 @@
+"""Unit tests for reusing events of scrapers whose listing is unchanged."""
+
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import main
+from models import Event
+from services.fingerprints import fingerprint_entry, is_unchanged, listing_fingerprint
+
+LISTING = "<main><div class='lineup'>Band A <b>21:00</b></div></main>"
+
+
+def make_fingerprinted_scraper():
+    scraper = MagicMock()
+    scraper.__name__ = "scrapers.music.festival"
+    scraper.EVENTS_URL = "https://example.com/lineup"
+    scraper.FINGERPRINT_SELECTOR = ".lineup"
+    scraper.FINGERPRINT_URL = None
+    scraper.FINGERPRINT_NEEDS_JS = False
+    return scraper
+
+
+def stored_event(title: str) -> dict:
+    return {
+        "title": title,
+        "artist": title,
+        "venue": "Arena",
+        "date": (datetime.now() + timedelta(days=30)).isoformat(),
+        "url": "https://example.com/lineup",
+        "source": "festival",
+        "category": "music",
+        "spotify_url": "https://open.spotify.com/artist/1",
+    }
+
+
+@pytest.fixture
+def previous_run():
+    main.scraper_errors.clear()
+    main.successful_scraper_sources["music"].clear()
+    main.previous_fingerprints.clear()
+    main.fresh_fingerprints.clear()
+    main.scrapers_ran.clear()
+    main.previous_events["music"] = [stored_event("Band A"), stored_event("Band B")]
+    yield
+    main.previous_fingerprints.clear()
+    main.fresh_fingerprints.clear()
+    main.previous_events["music"] = []
+
+
+def test_unchanged_listing_reuses_last_run_without_scraping(previous_run):
+    scraper = make_fingerprinted_scraper()
+    entry = fingerprint_entry(listing_fingerprint(LISTING, ".lineup"), {"festival"})
+    main.previous_fingerprints["music.festival"] = entry
+
+    with patch("main.fetch_page", return_value=LISTING):
+        events = main.run_scraper_safely(scraper)
+
+    scraper.scrape.assert_not_called()
+    assert [event.title for event in events] == ["Band A", "Band B"]
+    assert isinstance(events[0].date, datetime)
+    assert events[0].spotify_url == "https://open.spotify.com/artist/1"
+    assert main.successful_scraper_sources["music"] == {"festival"}
+    assert main.fresh_fingerprints["music.festival"] == entry
+    assert main.scraper_errors == []
+    # A reused run takes no time worth balancing shards on.
+    assert "music.festival" not in main.scrapers_ran
+
+
+def test_changed_listing_scrapes_and_records_the_new_fingerprint(previous_run):
+    scraper = make_fingerprinted_scraper()
+    main.previous_fingerprints["music.festival"] = fingerprint_entry(
+        "outdated", {"festival"}
+    )
+    fresh = Event(
+        title="Band C",
+        artist="Band C",
+        venue="Arena",
+        date=datetime.now() + timedelta(days=40),
+        url="https://example.com/lineup",
+        source="festival",
+        category="music",
+    )
+    scraper.scrape.return_value = [fresh]
+
+    with patch("main.fetch_page", return_value=LISTING):
+        events = main.run_scraper_safely(scraper)
+
+    assert events == [fresh]
+    # The listing fetched for the fingerprint is not downloaded again.
+    scraper.scrape.assert_called_once_with(listing_html=LISTING)
+    assert "music.festival" in main.scrapers_ran
+    recorded = main.fresh_fingerprints["music.festival"]
+    assert recorded["fingerprint"] == listing_fingerprint(LISTING, ".lineup")
+    assert recorded["sources"] == ["festival"]
+
+
+def test_failed_scrape_keeps_the_previous_fingerprint(previous_run):
+    scraper = make_fingerprinted_scraper()
+    scraper.scrape.side_effect = RuntimeError("layout changed")
+
+    with patch("main.fetch_page", return_value=LISTING):
+        assert main.run_scraper_safely(scraper) == []
+
+    assert "music.festival" not in main.fresh_fingerprints
+
+
+def test_scrapers_without_a_selector_are_not_fingerprinted(previous_run):
+    scraper = MagicMock(spec=["__name__", "scrape"])
+    scraper.__name__ = "scrapers.music.plain"
+    scraper.scrape.return_value = []
+
+    with patch("main.fetch_page") as fetch:
+        main.run_scraper_safely(scraper)
+
+    fetch.assert_not_called()
+
+
+def test_fingerprint_ignores_markup_and_whitespace_outside_the_text():
+    reformatted = "<main>\n<div class='lineup'>Band A\n  <i>21:00</i></div></main>"
+
+    assert listing_fingerprint(LISTING, ".lineup") == listing_fingerprint(
+        reformatted, ".lineup"
+    )
+    assert listing_fingerprint(LISTING, ".missing") is None
+
+
+def test_old_fingerprints_expire():
+    entry = fingerprint_entry("abc", {"festival"})
+    later = datetime.fromisoformat(entry["recorded_at"]) + timedelta(days=8)
+
+    assert is_unchanged(entry, "abc")
+    assert not is_unchanged(entry, "abc", now=later)
+    assert not is_unchanged(entry, "other")
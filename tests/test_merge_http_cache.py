@@ -0,0 +1,40 @@
+from scripts.merge_http_cache import merge_cache_dirs
+from services.http_cache import ResponseCache
+
+
+def write_cache(directory, entries):
+    cache = ResponseCache(directory)
+    for key, body in entries.items():
+        cache.put(key, f"https://example.com/{key}", body, etag=f'"{body}"')
+    cache.close()
+
+
+def test_merge_cache_dirs_combines_every_shard(tmp_path):
+    input_dir = tmp_path / "http-caches"
+    write_cache(input_dir / "http-cache-group-1", {"a": "A", "shared": "old"})
+    write_cache(input_dir / "http-cache-group-2", {"b": "B", "shared": "new"})
+
+    assert merge_cache_dirs(input_dir, tmp_path / "merged") == 4
+
+    merged = ResponseCache(tmp_path / "merged")
+    assert merged.get("a").body == "A"
+    assert merged.get("b").body == "B"
+    assert merged.get("shared").body == "new"
+    assert merged.get("shared").etag == '"new"'
+    merged.close()
+
+
+def test_merge_keeps_the_newer_entry_whatever_the_order(tmp_path):
+    write_cache(tmp_path / "older", {"shared": "old"})
+    write_cache(tmp_path / "newer", {"shared": "new"})
+    cache = ResponseCache(tmp_path / "merged")
+
+    cache.merge(tmp_path / "newer" / "responses.sqlite3")
+    cache.merge(tmp_path / "older" / "responses.sqlite3")
+
+    assert cache.get("shared").body == "new"
+    cache.close()
+
+
+def test_merge_cache_dirs_without_inputs_reads_nothing(tmp_path):
+    assert merge_cache_dirs(tmp_path / "missing", tmp_path / "merged") == 0
@@ -0,0 +1,52 @@
+import json
+
+from scripts.merge_run_metrics import merge_metrics_files
+
+
+def write_metrics(path, group, stages, scrapers):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({
+        "recorded_at": "2026-08-15T09:00:00",
+        "group": group,
+        "stages": stages,
+        "scrapers": scrapers,
+    }))
+
+
+def test_merge_metrics_files_combines_shards(tmp_path):
+    input_dir = tmp_path / "metrics"
+    output_file = tmp_path / "artifacts" / "run_metrics.json"
+    write_metrics(
+        input_dir / "run-metrics-group-1" / "run_metrics_group_1.json",
+        1,
+        {"scrape": 300.0, "enrich": 20.0},
+        {"music.ateneul": {"wall_seconds": 250.5, "events": 40, "retries": 2}},
+    )
+    write_metrics(
+        input_dir / "run-metrics-group-2" / "run_metrics_group_2.json",
+        2,
+        {"scrape": 200.0},
+        {
+            "theatre.tnb": {"wall_seconds": 150.25, "events": 12, "retries": 0},
+            "music.iabilet": {"wall_seconds": 40.0, "events": 80, "retries": 1},
+        },
+    )
+
+    count = merge_metrics_files(input_dir, output_file)
+
+    assert count == 3
+    merged = json.loads(output_file.read_text())
+    assert list(merged["scrapers"]) == ["music.ateneul", "music.iabilet", "theatre.tnb"]
+    assert merged["stages"] == {"scrape": 500.0, "enrich": 20.0}
+    assert [shard["group"] for shard in merged["shards"]] == [1, 2]
+    assert merged["totals"]["wall_seconds"] == 440.75
+    assert merged["totals"]["events"] == 132
+    assert merged["totals"]["retries"] == 3
+    assert merged["totals"]["bytes_received"] == 0
+
+
+def test_merge_metrics_files_writes_nothing_without_artifacts(tmp_path):
+    output_file = tmp_path / "run_metrics.json"
+
+    assert merge_metrics_files(tmp_path / "missing", output_file) == 0
+    assert not output_file.exists()
@@ -0,0 +1,56 @@
+"""Tests for the memoized normalizers and per-event views."""
+
+from dataclasses import replace
+from datetime import datetime
+
+from models import Event
+from services.normalization import (
+    STRING_CACHE_SIZE,
+    canonicalize_url,
+    event_view,
+    normalize_control_title,
+)
+
+
+def make_event(**overrides) -> Event:
+    event = Event(
+        title="LIVE: Mogwai (UK)",
+        artist=None,
+        venue="Control Club | Room 2",
+        date=datetime(2026, 9, 12, 20, 0),
+        url="https://www.control-club.ro/event/?id=7&utm_source=fb",
+        source="control",
+        category="music",
+    )
+    return replace(event, **overrides)
+
+
+def test_event_view_holds_every_normalized_field():
+    view = event_view(make_event())
+
+    assert view.identity == "live: mogwai (uk)"
+    assert view.venue == "control club room 2"
+    assert view.canonical_url == "https://control-club.ro/event?id=7"
+    assert view.control_title == "mogwai"
+    assert view.control_venue == "control"
+    assert view.dedup_key == "control|live: mogwai (uk)|2026-09-12T20:00|control club room 2"
+
+
+def test_equal_events_share_one_view():
+    assert event_view(make_event()) is event_view(make_event())
+
+
+def test_view_follows_changed_fields():
+    event = make_event()
+    before = event_view(event)
+
+    event.artist = "Mogwai"
+
+    assert event_view(event) is not before
+    assert event_view(event).identity == "mogwai"
+
+
+def test_normalizers_are_bounded_caches():
+    for normalizer in (canonicalize_url, normalize_control_title):
+        normalizer("https://example.com/")
+        assert normalizer.cache_info().maxsize == STRING_CACHE_SIZE
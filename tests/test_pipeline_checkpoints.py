@@ -0,0 +1,185 @@
+"""Unit tests for resuming the pipeline from stage checkpoints."""
+
+import argparse
+import json
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+import main
+from models import Event
+from services.checkpoints import (
+    load_checkpoint,
+    previous_stage,
+    runs_stage,
+    save_checkpoint,
+)
+from services.email import ScraperError
+
+
+def make_event(title: str, category: str) -> Event:
+    return Event(
+        title=title,
+        artist=None,
+        venue="Venue",
+        date=datetime(2099, 8, 15, 19, 30),
+        url=f"https://example.com/{title}",
+        source="source",
+        category=category,
+    )
+
+
+def pipeline_args(resume_from: str | None = None) -> argparse.Namespace:
+    return argparse.Namespace(
+        group=None,
+        groups=None,
+        dry_run=False,
+        workers=1,
+        only=None,
+        skip=None,
+        record=None,
+        replay=None,
+        resume_from=resume_from,
+    )
+
+
+@pytest.fixture
+def isolated_pipeline(tmp_path):
+    empty = {"music_events": [], "theatre_events": [], "culture_events": []}
+    with (
+        patch("main.CHECKPOINTS_DIR", tmp_path / "checkpoints"),
+        patch("main.load_existing_events", return_value=empty),
+        patch("main.load_fingerprints", return_value={}),
+        patch("main.save_fingerprints"),
+        patch("main.save_run_metrics", return_value=tmp_path / "run_metrics.json"),
+        patch("main.update_scraper_history"),
+        patch("main.stage1_dedup", side_effect=lambda events: events),
+        patch("main.llm_dedup", side_effect=lambda events: events),
+        patch("main.save_scraper_errors"),
+        patch("main.save_results") as save_results,
+    ):
+        yield save_results
+
+
+def scrape_with_one_failure(group, workers, shards, on_result, *_args):
+    main.record_scraper_error(
+        ScraperError(scraper_name="broken", error_message="boom", traceback="")
+    )
+    main.successful_scraper_sources["music"].add("source")
+    music, theatre = [make_event("concert", "music")], [make_event("play", "theatre")]
+    on_result("music", 0, music)
+    on_result("theatre", 1, theatre)
+    return music, theatre, []
+
+
+def test_stage_order_helpers():
+    assert previous_stage("scrape") is None
+    assert previous_stage("enrich") == "dedup"
+    assert runs_stage("scrape", None)
+    assert not runs_stage("dedup", "enrich")
+    assert runs_stage("save", "enrich")
+
+
+def test_checkpoints_round_trip(tmp_path):
+    save_checkpoint(tmp_path, "dedup", {"music_events": [{"title": "x"}]})
+
+    data = load_checkpoint(tmp_path, "dedup")
+
+    assert data["stage"] == "dedup"
+    assert data["music_events"] == [{"title": "x"}]
+    with pytest.raises(FileNotFoundError, match="No enrich checkpoint"):
+        load_checkpoint(tmp_path, "enrich")
+
+
+def test_resume_from_enrich_reuses_the_frozen_scrape(isolated_pipeline):
+    save_results = isolated_pipeline
+    with (
+        patch("main.run_all_scrapers", side_effect=scrape_with_one_failure),
+        patch("main.enrich_with_spotify", side_effect=RuntimeError("API down")),
+    ):
+        with pytest.raises(RuntimeError):
+            main.run_pipeline(pipeline_args())
+    save_results.assert_not_called()
+
+    with (
+        patch("main.run_all_scrapers") as run_all_scrapers,
+        patch("main.enrich_with_spotify", side_effect=lambda events: events),
+        patch("main.enrich_events", side_effect=lambda events, prefetched: events),
+        patch("main.stage1_dedup") as stage1_dedup,
+    ):
+        with pytest.raises(SystemExit) as exit_info:
+            main.run_pipeline(pipeline_args(resume_from="enrich"))
+
+    run_all_scrapers.assert_not_called()
+    stage1_dedup.assert_not_called()
+    assert exit_info.value.code == 2
+    assert [error.scraper_name for error in main.scraper_errors] == ["broken"]
+    assert main.successful_scraper_sources["music"] == {"source"}
+    music, theatre, culture = save_results.call_args.args[:3]
+    assert music == [make_event("concert", "music")]
+    assert theatre == [make_event("play", "theatre")]
+    assert culture == []
+
+
+def run_scraped_pipeline(args: argparse.Namespace) -> None:
+    with (
+        patch("main.run_all_scrapers", side_effect=scrape_with_one_failure),
+        patch("main.enrich_with_spotify", side_effect=lambda events: events),
+        patch("main.enrich_events", side_effect=lambda events, prefetched: events),
+    ):
+        with pytest.raises(SystemExit):
+            main.run_pipeline(args)
+
+
+@pytest.mark.parametrize(
+    ("option", "value", "records_history"),
+    [
+        (None, None, True),
+        ("only", {"control"}, False),
+        ("skip", {"ateneul"}, False),
+        ("replay", Path("run.har.jsonl.gz"), False),
+    ],
+)
+def test_only_full_network_runs_record_scraper_history(
+    isolated_pipeline, option, value, records_history
+):
+    args = pipeline_args()
+    if option:
+        setattr(args, option, value)
+
+    run_scraped_pipeline(args)
+
+    assert main.update_scraper_history.called is records_history
+
+
+def test_replayed_runs_leave_the_committed_data_alone(isolated_pipeline):
+    save_results = isolated_pipeline
+    args = pipeline_args()
+    args.replay = Path("run.har.jsonl.gz")
+
+    run_scraped_pipeline(args)
+
+    assert save_results.call_args.args[6] == main.REPLAY_EVENTS_FILE
+    main.save_fingerprints.assert_not_called()
+
+
+def test_resume_without_a_checkpoint_fails_clearly(isolated_pipeline):
+    with pytest.raises(FileNotFoundError, match="No scrape checkpoint"):
+        main.run_pipeline(pipeline_args(resume_from="dedup"))
+
+
+def test_resumed_runs_keep_the_scraped_metrics(tmp_path):
+    with patch("main.ARTIFACTS_DIR", tmp_path):
+        main.scraper_wall_seconds.clear()
+        main.scraper_wall_seconds["music.control"] = 12.345
+        main.scraper_event_counts["music.control"] = 7
+        main.save_run_metrics(stage_seconds={"scrape": 20.0})
+        main.scraper_wall_seconds.clear()
+        path = main.save_run_metrics(stage_seconds={"enrich": 3.0}, resumed=True)
+
+    metrics = json.loads(path.read_text())
+    assert metrics["stages"] == {"scrape": 20.0, "enrich": 3.0}
+    assert metrics["scrapers"]["music.control"]["wall_seconds"] == 12.35
+    assert metrics["scrapers"]["music.control"]["events"] == 7
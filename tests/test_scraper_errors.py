@@ -210,6 +210,214 @@ class TestScraperErrorCollection:
         ]
         assert "partial_feed" not in successful_scraper_sources["music"]
 
+    def test_concurrent_runs_attribute_fetch_failures_to_their_scraper(self):
+        import threading
+
+        from main import run_scrapers, scraper_errors, successful_scraper_sources
+        from services.http import _record_fetch_failure
+
+        scraper_errors.clear()
+        successful_scraper_sources["music"].clear()
+        both_running = threading.Barrier(2, timeout=5)
+
+        def make_event(source: str) -> Event:
+            return Event(
+                title=f"{source} event",
+                artist=None,
+                venue="Venue",
+                date=datetime(2099, 8, 15),
+                url=f"https://example.com/{source}",
+                source=source,
+                category="music",
+            )
+
+        def flaky_scrape():
+            both_running.wait()
+            _record_fetch_failure("HTTP 503 for https://example.com/flaky")
+            return [make_event("flaky")]
+
+        def healthy_scrape():
+            both_running.wait()
+            return [make_event("healthy")]
+
+        flaky = make_mock_scraper("scrapers.music.flaky")
+        flaky.scrape.side_effect = flaky_scrape
+        healthy = make_mock_scraper("scrapers.music.healthy")
+        healthy.scrape.side_effect = healthy_scrape
+
+        results = run_scrapers([flaky, healthy], workers=2)
+
+        assert [[event.source for event in events] for events in results] == [
+            ["flaky"],
+            ["healthy"],
+        ]
+        assert [error.scraper_name for error in scraper_errors] == ["flaky"]
+        assert successful_scraper_sources["music"] == {"healthy"}
+
+    def test_exceeded_time_budget_keeps_partial_events(self):
+        from main import (
+            run_scraper_safely,
+            scraper_errors,
+            successful_scraper_sources,
+        )
+        from services.http import HttpError, fetch_page
+
+        scraper_errors.clear()
+        successful_scraper_sources["music"].clear()
+        first = Event(
+            title="Scraped in time",
+            artist=None,
+            venue="Venue",
+            date=datetime(2099, 8, 15),
+            url="https://example.com/first",
+            source="slow_feed",
+            category="music",
+        )
+
+        def slow_scrape():
+            events = [first]
+            try:
+                fetch_page("https://example.com/second")
+            except HttpError:
+                pass
+            return events
+
+        mock_scraper = make_mock_scraper("scrapers.music.slow_feed")
+        mock_scraper.TIME_BUDGET_SECONDS = 0.001
+        mock_scraper.scrape.side_effect = slow_scrape
+
+        result = run_scraper_safely(mock_scraper)
+
+        assert result == [first]
+        assert [error.scraper_name for error in scraper_errors] == ["slow_feed"]
+        assert scraper_errors[0].error_message == (
+            "Time budget of 0.001s exceeded; "
+            "kept 1 event(s) scraped before the deadline"
+        )
+        assert "slow_feed" not in successful_scraper_sources["music"]
+
+    def test_run_metrics_are_recorded_per_scraper(self):
+        from main import run_scraper_safely, scraper_metrics, scraper_wall_seconds
+
+        scraper_wall_seconds.clear()
+        mock_scraper = make_mock_scraper("scrapers.music.measured")
+        mock_scraper.scrape.return_value = [
+            Event(
+                title="Measured",
+                artist=None,
+                venue="Venue",
+                date=datetime(2099, 8, 15),
+                url="https://example.com/measured",
+                source="measured",
+                category="music",
+            )
+        ]
+
+        run_scraper_safely(mock_scraper)
+
+        metrics = scraper_metrics()["music.measured"]
+        assert metrics["events"] == 1
+        assert metrics["http_requests"] == 0
+        assert metrics["parse_seconds"] >= 0
+        assert set(metrics) >= {"wall_seconds", "retries", "reader_fallbacks"}
+        assert metrics["ran"] is True
+
+    def test_scrapers_cut_short_by_an_open_circuit_did_not_run(self):
+        from main import run_scraper_safely, scraper_metrics, scrapers_ran
+        from services import http as http_service
+
+        url = "https://down.example.com/events"
+        scrapers_ran.clear()
+        http_service.reset_circuit_breakers()
+        breaker = http_service._circuit_breaker(url)
+        for _ in range(breaker.threshold):
+            breaker.record_failure()
+        mock_scraper = make_mock_scraper("scrapers.music.downstream")
+        mock_scraper.scrape.side_effect = lambda: [http_service.fetch_page(url)]
+
+        try:
+            run_scraper_safely(mock_scraper)
+        finally:
+            http_service.reset_circuit_breakers()
+
+        metrics = scraper_metrics()["music.downstream"]
+        assert metrics["circuit_skips"] == 1
+        assert metrics["ran"] is False
+
+    def test_history_only_samples_scrapers_that_ran(self, tmp_path):
+        import json
+
+        from main import update_scraper_history
+        from services.shards import load_history
+
+        history_file = tmp_path / "scraper_history.json"
+        metrics_file = tmp_path / "run_metrics.json"
+        metrics_file.write_text(json.dumps({"scrapers": {
+            "music.control": {"wall_seconds": 120.0, "ran": True},
+            "music.festival": {"wall_seconds": 0.4, "ran": False},
+            "theatre.tnb": {"wall_seconds": 90.0},
+        }}))
+
+        with patch("main.SCRAPER_HISTORY_FILE", history_file):
+            update_scraper_history([metrics_file])
+
+        assert load_history(history_file) == {
+            "music.control": [120.0],
+            "theatre.tnb": [90.0],
+        }
+
+    def test_time_budget_falls_back_to_the_default(self):
+        from main import DEFAULT_SCRAPER_TIME_BUDGET_SECONDS, scraper_time_budget
+
+        mock_scraper = make_mock_scraper("scrapers.music.unconfigured")
+
+        assert scraper_time_budget(mock_scraper) == DEFAULT_SCRAPER_TIME_BUDGET_SECONDS
+        mock_scraper.TIME_BUDGET_SECONDS = 120
+        assert scraper_time_budget(mock_scraper) == 120
+
+    def test_scraper_cache_ttl_applies_to_its_fetch_context(self):
+        from main import run_scraper_safely
+        from services.http import current_fetch_context
+
+        mock_scraper = make_mock_scraper("scrapers.culture.slow_changing")
+        mock_scraper.CACHE_TTL_SECONDS = 3600
+        seen_ttls = []
+
+        def scrape():
+            seen_ttls.append(current_fetch_context().cache_ttl)
+            return []
+
+        mock_scraper.scrape.side_effect = scrape
+
+        run_scraper_safely(mock_scraper)
+
+        assert seen_ttls == [3600.0]
+
+    def test_run_scrapers_hands_over_each_result_as_it_finishes(self):
+        from main import run_scrapers
+
+        handed_over = []
+        scrapers = [
+            make_mock_scraper(f"scrapers.music.{name}")
+            for name in ("first", "second", "third")
+        ]
+
+        with patch("main.run_scraper_safely", side_effect=lambda s: [s.__name__]):
+            results = run_scrapers(
+                scrapers,
+                workers=2,
+                on_result=lambda index, events: handed_over.append((index, events)),
+            )
+
+        assert results == [[s.__name__] for s in scrapers]
+        assert sorted(handed_over) == list(enumerate(results))
+
+    def test_run_scrapers_rejects_non_positive_workers(self):
+        from main import run_scrapers
+
+        with pytest.raises(ValueError):
+            run_scrapers([], workers=0)
+
 
 class TestScraperAlertEmail:
     """Test scraper alert email formatting and sending."""
@@ -2,15 +2,18 @@ import sys
 from datetime import datetime
 from unittest.mock import patch
 
+import pytest
+
 from main import (
-    SCRAPER_GROUPS,
     main,
     run_music_scrapers,
     run_theatre_scrapers,
+    scrapers_for_run,
     should_run_festival_scrapers,
 )
 from scrapers.music import eventbook as eventbook_music
 from scrapers.music import hardrock, iabilet
+from scrapers.registry import SCRAPERS, get_spec, scraper_specs
 from scrapers.theatre import eventbook as eventbook_theatre
 from scripts.test_full_flow import SCRAPERS as INTEGRATION_SCRAPERS
 
@@ -22,7 +25,7 @@ def test_festival_scrapers_refresh_weekly_and_on_month_start():
 
 
 def test_hardrock_is_registered_for_scheduled_and_local_runs():
-    assert hardrock in SCRAPER_GROUPS[1]["music"]
+    assert get_spec("music.hardrock").group == 1
 
     with (
         patch("main.should_run_festival_scrapers", return_value=False),
@@ -35,7 +38,7 @@ def test_hardrock_is_registered_for_scheduled_and_local_runs():
 
 
 def test_iabilet_music_feed_is_registered_for_scheduled_and_local_runs():
-    assert iabilet in SCRAPER_GROUPS[2]["music"]
+    assert get_spec("music.iabilet").group == 2
 
     with (
         patch("main.should_run_festival_scrapers", return_value=False),
@@ -48,8 +51,8 @@ def test_iabilet_music_feed_is_registered_for_scheduled_and_local_runs():
 
 
 def test_eventbook_is_registered_for_scheduled_and_local_runs():
-    assert eventbook_music in SCRAPER_GROUPS[1]["music"]
-    assert eventbook_theatre in SCRAPER_GROUPS[1]["theatre"]
+    assert get_spec("music.eventbook").group == 1
+    assert get_spec("theatre.eventbook").group == 1
 
     with (
         patch("main.should_run_festival_scrapers", return_value=False),
@@ -81,8 +84,114 @@ def test_dry_run_lists_newly_registered_scrapers(capsys):
 
 def test_full_flow_uses_scheduler_registry():
     for category in ("music", "theatre", "culture"):
-        registered = {
-            *SCRAPER_GROUPS[1][category],
-            *SCRAPER_GROUPS[2][category],
-        }
-        assert registered.issubset(set(INTEGRATION_SCRAPERS[category]))
+        registered = [spec.load() for spec in scraper_specs(category)]
+        assert INTEGRATION_SCRAPERS[category] == registered
+
+
+def test_registry_matches_the_scraper_modules():
+    assert len({spec.key for spec in SCRAPERS}) == len(SCRAPERS)
+    for spec in SCRAPERS:
+        assert spec.load().__name__ == spec.module_name
+        assert spec.group in (1, 2)
+    festivals = {spec.name for spec in SCRAPERS if spec.festival}
+    assert festivals == {"bfh", "garana", "jazzinthepark", "jfr", "rockstadt"}
+
+
+def test_static_groups_keep_their_historical_run_order():
+    music = {
+        group: [spec.name for spec in scraper_specs("music", group)]
+        for group in (1, 2)
+    }
+
+    assert music[1] == [
+        "ateneul", "enescu", "eventbook", "control", "hardrock", "jazzx",
+        "bfh", "garana", "jazzinthepark", "jfr", "rockstadt",
+    ]
+    assert music[2] == ["operanb", "expirat", "quantic", "iabilet"]
+
+
+def test_history_shards_cover_every_due_scraper_once(tmp_path):
+    history_file = tmp_path / "scraper_history.json"
+    history_file.write_text(
+        '{"scrapers": {"music.ateneul": [900], "music.iabilet": [800]}}'
+    )
+
+    with (
+        patch("main.SCRAPER_HISTORY_FILE", history_file),
+        patch("main.should_run_festival_scrapers", return_value=False),
+    ):
+        everything = scrapers_for_run()
+        shards = [scrapers_for_run(shard, shards=3) for shard in (1, 2, 3)]
+
+    for category, specs in everything.items():
+        sharded = [spec for shard in shards for spec in shard[category]]
+        assert sorted(spec.key for spec in sharded) == sorted(spec.key for spec in specs)
+    assert get_spec("music.bfh") not in everything["music"]
+    owners = {
+        spec.key: index
+        for index, shard in enumerate(shards)
+        for spec in shard["music"]
+    }
+    assert owners["music.ateneul"] != owners["music.iabilet"]
+
+
+def test_sharded_dry_run_lists_one_shard(capsys):
+    with (
+        patch.object(sys, "argv", ["main.py", "--dry-run", "--groups", "3", "--group", "2"]),
+        patch("main.should_run_festival_scrapers", return_value=True),
+    ):
+        main()
+
+    output = capsys.readouterr().out
+    assert "Shard 2 of 3" in output
+
+
+def test_only_and_skip_narrow_the_selection():
+    with patch("main.should_run_festival_scrapers", return_value=False):
+        selected = scrapers_for_run(only={"control", "theatre.eventbook", "bfh"})
+        skipped = scrapers_for_run(skip={"ateneul", "eventbook"})
+
+    assert [spec.key for spec in selected["music"]] == ["music.control", "music.bfh"]
+    assert [spec.key for spec in selected["theatre"]] == ["theatre.eventbook"]
+    assert selected["culture"] == []
+    keys = {spec.key for specs in skipped.values() for spec in specs}
+    assert "music.ateneul" not in keys
+    assert not {"music.eventbook", "theatre.eventbook"} & keys
+    assert "music.control" in keys
+
+
+def test_only_runs_import_just_the_named_scrapers():
+    loaded = []
+    with (
+        patch(
+            "scrapers.registry.ScraperSpec.load",
+            autospec=True,
+            side_effect=lambda spec: loaded.append(spec.key) or hardrock,
+        ),
+        patch("main.run_scrapers", return_value=[[]]),
+    ):
+        from main import run_all_scrapers
+
+        run_all_scrapers(only={"hardrock"})
+
+    assert loaded == ["music.hardrock"]
+
+
+def test_unknown_scraper_names_are_rejected(capsys):
+    with (
+        patch.object(sys, "argv", ["main.py", "--dry-run", "--only", "nosuch"]),
+        pytest.raises(SystemExit),
+    ):
+        main()
+
+    assert "unknown scraper(s) nosuch" in capsys.readouterr().err
+
+
+def test_dry_run_with_only_lists_the_named_scrapers(capsys):
+    with patch.object(sys, "argv", ["main.py", "--dry-run", "--only", "tnb,mnac"]):
+        main()
+
+    output = capsys.readouterr().out
+    assert "  - tnb" in output
+    assert "  - mnac" in output
+    assert "Total: 2 scrapers" in output
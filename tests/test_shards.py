@@ -0,0 +1,57 @@
+"""Unit tests for run-time history and shard balancing."""
+
+import pytest
+
+from services.shards import (
+    balance_shards,
+    estimate_seconds,
+    load_history,
+    record_runs,
+    save_history,
+)
+
+
+def test_heaviest_scrapers_are_spread_across_shards():
+    plan = balance_shards(
+        {"ateneul": 600, "iabilet": 500, "control": 100, "quantic": 100, "mnac": 50},
+        shards=2,
+    )
+
+    assert plan == [["ateneul", "quantic"], ["iabilet", "control", "mnac"]]
+
+
+def test_every_scraper_lands_in_exactly_one_shard():
+    weights = {f"scraper{index}": float(index % 7) for index in range(30)}
+
+    plan = balance_shards(weights, shards=4)
+
+    assert sorted(key for shard in plan for key in shard) == sorted(weights)
+    loads = [sum(weights[key] for key in shard) for shard in plan]
+    assert max(loads) - min(loads) <= max(weights.values())
+
+
+def test_more_shards_than_scrapers_leaves_empty_shards():
+    assert balance_shards({"a": 1.0}, shards=3) == [["a"], [], []]
+
+
+def test_balance_rejects_non_positive_shard_count():
+    with pytest.raises(ValueError):
+        balance_shards({"a": 1.0}, shards=0)
+
+
+def test_history_keeps_recent_runs_and_estimates_their_median(tmp_path):
+    history = {}
+    for seconds in [10.0, 400.0, 30.0, 20.0]:
+        history = record_runs(history, {"music.ateneul": seconds}, keep=3)
+
+    path = tmp_path / "history.json"
+    save_history(path, history)
+    reloaded = load_history(path)
+
+    assert reloaded == {"music.ateneul": [400.0, 30.0, 20.0]}
+    assert estimate_seconds(reloaded, "music.ateneul") == 30.0
+    assert estimate_seconds(reloaded, "music.new", default=45.0) == 45.0
+
+
+def test_missing_history_file_is_empty(tmp_path):
+    assert load_history(tmp_path / "missing.json") == {}
@@ -80,3 +80,13 @@ def test_auto_fix_workflow_detects_amp_errors_with_zero_exit_status():
     assert "AMP_STATUS=${PIPESTATUS[1]}" in workflow
     assert 'grep -qi "Error: Out of Credits"' in workflow
     assert 'if [ "$DRY_RUN" != "true" ]; then' in workflow
+
+
+def test_scrape_workflow_shares_one_http_cache_across_shards():
+    workflow = (ROOT / ".github/workflows/scrape.yml").read_text()
+
+    assert "http-cache-group-${{ matrix.group }}-" not in workflow
+    assert "restore-keys: http-cache-\n" in workflow
+    assert "python3 scripts/merge_http_cache.py" in workflow
+    save_step = workflow.split("- name: Save HTTP response cache", 1)[1]
+    assert "key: http-cache-${{ github.run_id }}" in save_step